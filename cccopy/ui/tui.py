@@ -8,12 +8,23 @@ CCCopy를 위한 Curses 기반 TUI
 """
 
 import os
+import re
+import codecs
 import curses
 import time
+import shutil
+import datetime
+import unicodedata
+import queue
 import threading
+import uuid
+from bisect import bisect_right
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import List, Dict, Optional
+from functools import lru_cache
+from itertools import accumulate, islice
+from typing import Deque, List, Dict, Optional
 
 # cccopy 모듈에서 필요한 클래스들을 전역 변수로 설정
 # 순환 import 방지를 위해 직접 import 제거
@@ -31,9 +42,123 @@ MAX_LOG_FILES = 1024                  # 기본값
 MAX_STATE_CHECK_WORKERS = 2           # 기본값
 WATCH_FILE_CHANGE_INTERVAL = 5        # 기본값
 
+# getch 대기 시간 (ms) - 키 입력이 없어도 주기적으로 화면/상태를 갱신하기 위한 타임아웃
+GETCH_TIMEOUT_MS = 100
+
 # 로그 파일 디렉토리
 LOG_DIR = os.path.expanduser("~/.cccopy/log/")
 
+# 텍스트 모드용 ANSI 색상 코드
+ANSI_COLORS = {
+    'reset': '\033[0m',
+    'bold': '\033[1m',
+    'red': '\033[31m',
+    'green': '\033[32m',
+    'yellow': '\033[33m',
+    'blue': '\033[34m',
+    'cyan': '\033[36m',
+    'white': '\033[37m',
+    'bg_white': '\033[47m',
+    'bg_black': '\033[40m'
+}
+
+# 로그 레벨 태그 패턴 및 ANSI 색상 치환 테이블 (텍스트 모드 로그 출력용)
+_LOG_LEVEL_RE = re.compile(r'\[(INFO |WARN |ERROR|DEBUG|HIGH )\]')
+_LOG_LEVEL_ANSI = {
+    'INFO ': f"{ANSI_COLORS['green']}{ANSI_COLORS['bold']}[INFO ]{ANSI_COLORS['reset']}",    # 녹색
+    'WARN ': f"{ANSI_COLORS['yellow']}{ANSI_COLORS['bold']}[WARN ]{ANSI_COLORS['reset']}",   # 노란색
+    'ERROR': f"{ANSI_COLORS['red']}{ANSI_COLORS['bold']}[ERROR]{ANSI_COLORS['reset']}",      # 빨간색
+    'DEBUG': f"\033[2m[DEBUG]{ANSI_COLORS['reset']}",                                        # 회색 (어둡게)
+    'HIGH ': f"\033[1;36m[HIGH ]{ANSI_COLORS['reset']}",                                     # 청록색
+}
+
+# 로그 레벨 표시 형식 (add_log에서 사용)
+LOG_LEVEL_TAGS = {
+    "INFO": "[INFO ]",
+    "WARNING": "[WARN ]",
+    "ERROR": "[ERROR]",
+    "DEBUG": "[DEBUG]",
+    "HIGH": "[HIGH ]"
+}
+
+
+def _compute_char_width(code):
+    """코드 포인트의 표시 너비 계산 (한글, 중문, 일문 등 동아시아 문자는 2, 나머지는 1)"""
+    if 0x1100 <= code <= 0x11FF:    # 한글 자모
+        return 2
+    if 0x3130 <= code <= 0x318F:    # 한글 호환 자모
+        return 2
+    if 0xAC00 <= code <= 0xD7AF:    # 한글 음절
+        return 2
+    if 0x4E00 <= code <= 0x9FFF:    # CJK 한자
+        return 2
+    if 0x3400 <= code <= 0x4DBF:    # CJK 확장 A
+        return 2
+    if 0xFF00 <= code <= 0xFFEF:    # 전각 문자
+        return 2
+    return 1
+
+
+# 화면 행 패딩용 공백 문자열 (그리기 루프에서 " " * n 대신 _SPACES[:n] 슬라이스 사용, n >= 0)
+_SPACES = " " * 4096
+
+# BMP 문자별 표시 너비 테이블 (0 = 아직 계산 안 됨, 처음 조회 시 채움)
+_WIDTH_LUT = bytearray(0x10000)
+
+
+def _char_display_width(char):
+    """문자 하나의 표시 너비 (BMP 문자는 테이블에 캐시)"""
+    code = ord(char)
+    if code < 0x80:
+        return 1
+    if code < 0x10000:
+        width = _WIDTH_LUT[code]
+        if not width:
+            width = _compute_char_width(code)
+            _WIDTH_LUT[code] = width
+        return width
+    return _compute_char_width(code)
+
+
+@lru_cache(maxsize=4096)
+def _text_display_width(text):
+    """문자열의 표시 너비 (메뉴 항목 등 같은 문자열이 반복 계산되므로 캐시)"""
+    return sum(1 if char < '\x80' else _char_display_width(char) for char in text)
+
+
+@lru_cache(maxsize=1024)
+def _text_prefix_widths(text):
+    """문자열의 누적 표시 너비 (결과[i] = 앞에서부터 i개 문자의 표시 너비)"""
+    widths = [0]
+    widths.extend(accumulate(1 if char < '\x80' else _char_display_width(char) for char in text))
+    return tuple(widths)
+
+
+@lru_cache(maxsize=2048)
+def _dialog_line(content, dialog_width, align):
+    """"│ content │" 형태의 다이얼로그 라인 (스크롤/키 입력마다 같은 줄을 다시 만들지 않도록 캐시)
+
+    결과는 인자에만 의존하므로 화면 크기가 바뀌어도 무효화할 필요가 없음 (너비가 키에 포함됨)
+    """
+    content_width = max(0, dialog_width - 4)  # 양쪽 "│ " 제외 (음수면 _SPACES 슬라이스가 공백을 잘못 돌려주므로 0으로 제한)
+    if content_width == 0:
+        truncated = ""
+    elif content.isascii():
+        truncated = content[:content_width]
+    else:
+        truncated = content[:bisect_right(_text_prefix_widths(content), content_width) - 1]
+    display_width = len(truncated) if truncated.isascii() else _text_display_width(truncated)
+
+    if align == 'left':
+        formatted = truncated + _SPACES[:content_width - display_width]
+    elif align == 'right':
+        formatted = _SPACES[:content_width - display_width] + truncated
+    else:  # center
+        left_padding = (content_width - display_width) // 2
+        right_padding = content_width - display_width - left_padding
+        formatted = _SPACES[:left_padding] + truncated + _SPACES[:right_padding]
+    return "│ " + formatted + " │"
+
 # 초기화 로그 버퍼 (curses 초기화 전 로그들을 저장)
 _init_log_buffer = []
 
@@ -258,6 +383,134 @@ class FileTree:
                 self._collapse_recursive(child)
 
 
+class ScreenBuffer:
+    """행 단위 화면 버퍼 (변경된 행만 다시 그리기)
+
+    draw_* 메서드에 stdscr 대신 전달되어 addstr/addch/move/clrtoeol 호출을
+    행별 명령 목록으로 기록하고, flush()에서 이전 프레임과 명령이 달라진 행만
+    실제 윈도우에 출력한다. 매 프레임 erase() 후 전체를 다시 그리던 방식을 대체.
+
+    다이얼로그 등이 stdscr에 직접 그린 경우에는 invalidate()로 알려야 다음 flush()에서
+    모든 행이 다시 출력된다 (실제 윈도우 내용은 다시 읽지 않음).
+    """
+
+    def __init__(self, win):
+        self.win = win
+        self.size = (0, 0)
+        self.rows = {}        # 현재 프레임: {row: [(kind, x, text, attr), ...]}
+        self.prev_rows = {}   # 이전 프레임 명령 목록
+        self.redraw_all = True  # 다음 flush()에서 명령 비교 없이 모든 행 출력
+        self.cursor = (0, 0)
+
+    def begin(self, size=None):
+        """새 프레임 기록 시작 (터미널 크기가 바뀌면 전체 다시 그리기)
+
+        Args:
+            size: 호출자가 캐시한 (height, width) - None이면 윈도우에서 조회
+        """
+        if size is None:
+            size = self.win.getmaxyx()
+        if size != self.size:
+            self.size = size
+            # 이전 크기의 프레임은 재사용할 수 없으므로 버림
+            self.prev_rows = {}
+            self.invalidate()
+        self.rows = {}
+
+    def invalidate(self):
+        """다음 flush()에서 모든 행을 다시 출력하도록 표시 (다이얼로그가 닫히거나 화면을 지운 뒤 호출)"""
+        self.redraw_all = True
+
+    def reuse_previous_frame(self):
+        """draw_* 호출 없이 이전 프레임을 그대로 사용 (invalidate() 후에는 모든 행을 다시 출력)
+
+        Returns:
+            이전 프레임이 없어 재사용할 수 없으면 False
+        """
+        if not self.prev_rows:
+            return False
+        # 얕은 복사: 이후 clear_row()로 교체한 행이 prev_rows와 비교될 수 있도록
+        self.rows = dict(self.prev_rows)
+        return True
+
+    def clear_row(self, y):
+        """현재 프레임에서 한 행의 기록을 비움 (reuse_previous_frame 후 일부 행만 다시 그릴 때 사용)"""
+        self.rows[y] = []
+
+    def getmaxyx(self):
+        return self.size
+
+    def _check_position(self, y, x):
+        """좌표가 화면 밖이면 curses와 같이 curses.error 발생 (draw_*의 폴백/재시도 로직이 동작하도록)"""
+        height, width = self.size
+        if not (0 <= y < height and 0 <= x < width):
+            raise curses.error("ScreenBuffer: position out of range")
+
+    def addstr(self, y, x, text, attr=curses.A_NORMAL):
+        self._check_position(y, x)
+        self.rows.setdefault(y, []).append(('s', x, text, attr))
+        # curses는 줄바꿈된 출력이 오른쪽 아래 마지막 칸에 닿으면 (출력 후) 실패를 반환함
+        # 남은 칸 수가 최대 표시 너비(문자당 2칸)보다 큰 경우는 너비 계산을 생략
+        height, width = self.size
+        remaining = (height - y) * width - x
+        if 2 * len(text) >= remaining:
+            cells = len(text) if text.isascii() else _text_display_width(text)
+            if cells >= remaining:
+                raise curses.error("ScreenBuffer: write past the end of the window")
+
+    def addch(self, y, x, ch, attr=curses.A_NORMAL):
+        self._check_position(y, x)
+        self.rows.setdefault(y, []).append(('c', x, ch, attr))
+        height, width = self.size
+        if y == height - 1 and x == width - 1:
+            raise curses.error("ScreenBuffer: write past the end of the window")
+
+    def move(self, y, x):
+        self._check_position(y, x)
+        self.cursor = (y, x)
+
+    def clrtoeol(self):
+        y, x = self.cursor
+        self.rows.setdefault(y, []).append(('e', x, None, 0))
+
+    def __getattr__(self, name):
+        # 기록하지 않는 나머지 메서드는 실제 윈도우로 위임
+        return getattr(self.win, name)
+
+    def flush(self):
+        """이전 프레임과 명령이 달라진 행만 실제 윈도우에 출력 (invalidate() 후에는 모든 행)"""
+        win = self.win
+        height = self.size[0]
+        redraw_all = self.redraw_all
+        prev_rows = self.prev_rows
+        empty = []
+        for y in range(height):
+            ops = self.rows.get(y, empty)
+            # 기록이 없는 행은 빈 행으로 비교 (매 프레임 빈 행을 다시 지우지 않도록)
+            if not redraw_all and ops == prev_rows.get(y, empty):
+                continue
+
+            try:
+                win.move(y, 0)
+                win.clrtoeol()
+            except curses.error:
+                pass
+            # 기록 시점에 이미 draw_*에 curses.error를 전달했으므로 여기서는 출력 가능한 부분만 반영
+            for kind, x, text, attr in ops:
+                try:
+                    if kind == 's':
+                        win.addstr(y, x, text, attr)
+                    elif kind == 'c':
+                        win.addch(y, x, text, attr)
+                    else:
+                        win.move(y, x)
+                        win.clrtoeol()
+                except curses.error:
+                    pass
+        self.prev_rows = self.rows
+        self.redraw_all = False
+
+
 class CCCopyTUI:
     """CCCopy TUI 메인 클래스"""
 
@@ -267,7 +520,8 @@ class CCCopyTUI:
         self.tree = FileTree(workspace)
         self.selected_index = 0
         self.scroll_offset = 0
-        self.logs: List[str] = []
+        # 메모리 로그 (MAX_LOG_LINES개 초과시 가장 오래된 항목부터 자동 제거)
+        self.logs: Deque[str] = deque(maxlen=MAX_LOG_LINES)
 
         # 전역 환경설정 관리자
         if preference:
@@ -292,6 +546,8 @@ class CCCopyTUI:
 
         # 디렉토리 탐색 상태
         self.current_directory = ""  # 상대 경로 (공백은 루트)
+        self._cwd_full_path = None   # 현재 디렉토리 전체 경로 캐시
+        self._cwd_full_path_key = None  # (base_path, current_directory) - 캐시 무효화 판단용
         self.directory_entries: List[Dict] = []  # 현재 디렉토리의 항목들
 
         # 트리 뷰 상태
@@ -334,13 +590,38 @@ class CCCopyTUI:
         self.app_list = []  # 앱 목록
         self.app_selected_index = 0
         self.app_scroll_offset = 0
+        self._app_rendered_rows = []  # 앱별 표시 문자열 캐시 (_app_layout_width 기준)
+        self._app_layout_width = -1
+        self._prev_app_selected = -1  # 직전 프레임의 선택 인덱스 (-1이면 전체 다시 그리기)
+        self._prev_app_scroll = -1
+        self._prev_app_size = None
+        self._app_frame_cache = None  # (width, 테두리/헤더/도움말 문자열) - 화면 너비가 바뀔 때만 재생성
 
         # 색상 쌍 정의
         self.colors = {}
+        self.ansi_colors = {}  # 텍스트 모드 ANSI 색상 (run_simple_tui에서 활성화)
 
         # 다이얼로그 상태
         self.dialog_active = False
         self.dialog_result = None
+        self.dialog_done_event = threading.Event()  # 대화상자 종료 신호 (메인 루프 대기용)
+        self.dialog_done_event.set()
+        self._input_dialog_win = None  # input_dialog에서 재사용하는 창 (크기가 같으면 위치만 이동)
+
+        # ALT+키 시퀀스 처리 (ESC 직후 같은 입력 묶음으로 도착한 키를 ALT+키로 해석)
+        self.escape_pending = False
+
+        # 메인 화면 행 버퍼 (main_loop에서 생성)
+        self.screen_buffer = None
+
+        # 메인 화면 입력 시그니처 (변경이 없으면 draw_* 생략)
+        self.log_count = 0             # 추가된 로그 수 (로그 영역 변경 감지용)
+        self.entries_version = 0       # directory_entries 상태 변경 횟수
+        self.last_main_signature = None
+
+        # 터미널 크기 캐시 (키 입력/리사이즈시에만 다시 조회)
+        self.term_height = 0
+        self.term_width = 0
 
         # Cache 시스템 (파일별 상태 캐싱)
         # 구조: {relative_path: (timestamp, FileState)}
@@ -348,7 +629,6 @@ class CCCopyTUI:
         self.cache_timeout = PARTIAL_REFRESH_CACHE_TIMEOUT  # 5분 (초 단위)
 
         # Thread 시스템
-        import threading
         self.refresh_lock = threading.Lock()
         self.stop_refresh_event = threading.Event()
         self.pending_updates = {}  # {relative_path: FileState}
@@ -370,6 +650,24 @@ class CCCopyTUI:
         self.last_git_status = None  # 이전 git status 결과 저장 (None=초기화 안됨)
         self.needs_auto_refresh = False
 
+        # 자동 새로고침 요청은 needs_auto_refresh 플래그로 병합되어 메인 루프(UI thread)에서 한 번만 처리
+        self._pending_full_refresh = False  # 대기 중인 요청 중 Full Refresh 요청이 있었는지
+
+        # Partial 자동 새로고침 스캔 thread (maxsize=1 큐로 연속된 요청을 한 번의 스캔으로 병합)
+        # 스캔 thread는 파일 상태만 계산해 pending_updates로 전달하고 directory_entries/selected_index/
+        # scroll_offset은 건드리지 않음 (항목 구성 변경이 필요하면 _pending_rebuild로 UI thread에 요청)
+        self.scan_thread = None
+        self._scan_q = queue.Queue(maxsize=1)
+        # 메인 루프에서 Partial Refresh로 항목 목록을 다시 구성해야 함 (refresh_lock으로 보호)
+        # (스캔 thread가 파일 목록 변경을 발견했거나 Download 등으로 캐시를 지운 경우)
+        self._pending_rebuild = False
+
+        # 등록된 프로젝트 목록 캐시 (프로젝트 목록 다이얼로그에서 삭제/편집/복제 시 갱신)
+        self._projects_cache = None
+
+        # 백그라운드 Download 진행 중 표시 (D 키 Download와 복제 후 자동 Download가 공유)
+        self.download_lock = threading.Lock()
+
         # 튜토리얼 시스템
         # TUTORIAL.STARTUP_SHOW 설정 확인 (기본값: ON)
         startup_show = self.preference.get('', 'TUTORIAL.STARTUP_SHOW').upper()
@@ -417,7 +715,6 @@ class CCCopyTUI:
 
     def _init_log_file(self):
         """로그 파일 초기화"""
-        import datetime
 
         # 로그 디렉토리 생성
         os.makedirs(LOG_DIR, exist_ok=True)
@@ -521,11 +818,10 @@ class CCCopyTUI:
             rel_path: 상대 경로
             current_mtime: 현재 파일의 mtime (제공시 비교)
         """
-        if rel_path not in self.file_state_cache:
+        cache_entry = self.file_state_cache.get(rel_path)
+        if cache_entry is None:
             return None
 
-        cache_entry = self.file_state_cache[rel_path]
-
         # 캐시 구조 체크 (하위 호환성)
         if len(cache_entry) == 2:
             # 구 버전 캐시 (timestamp, state)
@@ -539,7 +835,8 @@ class CCCopyTUI:
 
         # 5분 타임아웃 체크
         if current_time - timestamp >= self.cache_timeout:
-            del self.file_state_cache[rel_path]
+            # 스캔 thread와 UI thread가 같은 항목을 동시에 지울 수 있으므로 pop 사용
+            self.file_state_cache.pop(rel_path, None)
             return None
 
         # mtime 비교 (제공된 경우)
@@ -547,7 +844,7 @@ class CCCopyTUI:
             if current_mtime != cached_mtime:
                 # mtime 불일치 → 파일 수정됨 → 캐시 무효
                 self.add_log(f"mtime 변경 감지: {os.path.basename(rel_path)}", "DEBUG")
-                del self.file_state_cache[rel_path]
+                self.file_state_cache.pop(rel_path, None)
                 return None
 
         return state
@@ -579,7 +876,17 @@ class CCCopyTUI:
         with self.refresh_lock:
             if rel_path in self.file_state_cache:
                 del self.file_state_cache[rel_path]
-                self.add_log(f"파일 캐시 삭제: {os.path.basename(rel_path)}", "DEBUG")
+                self.add_log("파일 캐시 삭제: %s", "DEBUG", os.path.basename(rel_path))
+
+    def invalidate_file_caches(self, rel_paths):
+        """변경된 파일들의 상태 캐시와 Git tracked 파일 목록 캐시 삭제"""
+        with self.refresh_lock:
+            for rel_path in rel_paths:
+                self.file_state_cache.pop(rel_path, None)
+            # 새 파일이 추가되었을 수 있으므로 tracked 목록도 다시 조회
+            self.tracked_files_cache = None
+            self.tracked_files_cache_time = 0
+        self.add_log("변경 파일 캐시 삭제: %d개", "DEBUG", len(rel_paths))
 
     # ==================== Thread 기반 Partial Refresh ====================
 
@@ -614,7 +921,7 @@ class CCCopyTUI:
             # 오류 발생시 SAME으로 처리
             with self.refresh_lock:
                 self.pending_updates[file_path] = FileState.SAME
-            self.add_log(f"State check failed for {file_path}: {e}", "DEBUG")
+            self.add_log("State check failed for %s: %s", "DEBUG", file_path, e)
 
     def stop_all_refresh_threads(self):
         """모든 refresh thread 종료 (ThreadPool 사용)"""
@@ -656,8 +963,9 @@ class CCCopyTUI:
         # 1. 로그 파일 닫기
         self._close_log_file()
 
-        # 2. Watch thread 종료
+        # 2. Watch thread 및 자동 새로고침 스캔 thread 종료
         self.stop_watch_thread()
+        self.stop_scan_thread()
 
         # 3. 모든 refresh thread 종료
         self.stop_all_refresh_threads()
@@ -792,6 +1100,134 @@ class CCCopyTUI:
                 self.watch_directory_changed_event.clear()
                 self.add_log("Watch 디렉토리 변경됨", "DEBUG")
 
+    def request_auto_refresh(self, full_refresh=False, invalidate_paths=None):
+        """자동 새로고침 요청 (이미 대기 중인 요청이 있으면 병합, 다른 thread에서 호출 가능)
+
+        Args:
+            full_refresh: True면 Full Refresh 요청 (대기 중인 Partial 요청과 병합 시 Full로 승격)
+            invalidate_paths: 상태 캐시를 지울 파일 상대 경로 목록 (Download 등으로 바뀐 파일).
+                         현재 디렉토리 밖의 파일일 수 있으므로 메인 루프에서 항목 목록을 다시 구성
+        """
+        if invalidate_paths:
+            self.invalidate_file_caches(invalidate_paths)
+        with self.refresh_lock:
+            if full_refresh:
+                self._pending_full_refresh = True
+                self.needs_auto_refresh = True
+            elif invalidate_paths:
+                self._pending_rebuild = True
+            else:
+                self.needs_auto_refresh = True
+
+    def start_scan_thread(self):
+        """자동 새로고침 스캔 thread 시작 (Partial Refresh의 파일 상태 계산으로 UI thread가 블로킹되지 않도록)"""
+        if self.scan_thread and self.scan_thread.is_alive():
+            return  # 이미 실행 중
+
+        self.scan_thread = threading.Thread(
+            target=self._scan_worker,
+            daemon=True,
+            name="cccopy_scan"
+        )
+        self.scan_thread.start()
+
+    def request_scan(self):
+        """현재 디렉토리 스캔 요청 (UI thread에서 호출, 이미 대기 중인 요청이 있으면 병합)"""
+        if not (self.scan_thread and self.scan_thread.is_alive()):
+            # 스캔 thread가 없으면 (시작 전 등) 기존처럼 동기 처리
+            self.refresh_tree(full_refresh=False)
+            return
+
+        # 화면 상태는 UI thread에서 스냅샷으로 만들어 전달 (스캔 thread는 directory_entries를 읽지 않음)
+        if self.mode == ViewMode.WORK:
+            base_dir = self.workspace.working_dir
+        else:
+            base_dir = self.workspace.production_dir
+        directory = self.current_directory
+        displayed = frozenset(
+            entry['path'] for entry in self.directory_entries
+            if entry.get('type') in ('directory', 'file', 'tree_directory', 'tree_file')
+            and os.path.dirname(entry['path']) == directory
+        )
+        try:
+            self._scan_q.put_nowait((self.mode, base_dir, directory, displayed))
+        except queue.Full:
+            pass  # 대기 중인 스캔이 곧 같은 디렉토리를 다시 확인함
+
+    def _scan_worker(self):
+        """스캔 요청을 받아 현재 디렉토리 파일 상태 계산 (Thread 실행)"""
+        while True:
+            request = self._scan_q.get()
+            if request is None:
+                break
+            try:
+                self._scan_directory(*request)
+            except Exception as e:
+                self.add_log(f"Auto refresh scan error: {e}", "DEBUG")
+
+    def _scan_directory(self, mode, base_dir, directory, displayed):
+        """디렉토리의 파일 상태를 계산해 pending_updates에 등록 (스캔 thread에서 실행)
+
+        화면 항목(directory_entries)은 만들지 않으며, 파일/디렉토리 목록이 화면과 다르면
+        _pending_rebuild를 설정해 메인 루프(UI thread)에서 다시 구성하도록 함
+        """
+        # Production 자동 커밋 (Partial Refresh와 동일하게 캐시 활용)
+        try:
+            self.workspace.auto_commit_production_changes(force=False)
+        except Exception as e:
+            self.add_log(f"Production 자동 커밋 실패: {e}", "WARNING")
+
+        directories, files = self.get_current_directory_items(base_dir, directory, async_mode=True)
+        listed = set(os.path.join(directory, name) if directory else name for name in directories)
+
+        for file_name in files:
+            file_path = os.path.join(directory, file_name) if directory else file_name
+            listed.add(file_path)
+            full_path = os.path.join(base_dir, file_path)
+
+            try:
+                current_mtime = os.path.getmtime(full_path)
+            except OSError:
+                current_mtime = 0
+            with self.refresh_lock:
+                cached_state = self.get_cached_state(file_path, current_mtime)
+            if cached_state is not None:
+                continue  # 화면에 이미 반영된 상태
+
+            try:
+                if mode == ViewMode.WORK:
+                    production_file = os.path.join(self.workspace.production_dir, file_path)
+                    state = self.workspace.get_file_state(production_file, full_path, file_path)
+                else:
+                    work_file = os.path.join(self.workspace.working_dir, file_path)
+                    state = self.workspace.get_file_state(full_path, work_file, file_path)
+                self.update_cache(file_path, state)
+            except Exception as e:
+                state = FileState.SAME
+                self.add_log("State check failed for %s: %s", "DEBUG", file_path, e)
+
+            with self.refresh_lock:
+                self.pending_updates[file_path] = state
+
+        if listed != displayed:
+            # 새로 생기거나 삭제된 항목이 있으면 항목 목록은 UI thread에서 다시 구성
+            with self.refresh_lock:
+                self._pending_rebuild = True
+
+    def stop_scan_thread(self):
+        """자동 새로고침 스캔 thread 종료"""
+        if self.scan_thread and self.scan_thread.is_alive():
+            # 대기 중인 요청을 버리고 종료 신호 전달 (요청은 UI thread에서만 넣으므로 사이에 끼어들 수 없음)
+            try:
+                self._scan_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._scan_q.put_nowait(None)
+            except queue.Full:
+                pass
+            self.scan_thread.join(timeout=1)
+
     def notify_directory_changed(self):
         """디렉토리 변경 알림 (디렉토리 이동시 호출)"""
         if self.watch_directory_changed_event:
@@ -823,6 +1259,8 @@ class CCCopyTUI:
                         updated = True
 
             self.pending_updates.clear()
+            if updated:
+                self.entries_version += 1
 
         return updated
 
@@ -912,7 +1350,6 @@ class CCCopyTUI:
     def get_current_project_tag(self):
         """현재 프로젝트의 이름과 TAG 정보를 가져옴"""
         try:
-            import os
             import configparser
 
             # 현재 사용자의 홈 디렉토리에서 설정 확인
@@ -962,51 +1399,52 @@ class CCCopyTUI:
 
     def get_display_width(self, text):
         """한글을 고려한 실제 표시 너비 계산"""
-        width = 0
-        for char in text:
-            # 한글, 중문, 일문 등 동아시아 문자는 너비 2, 나머지는 1
-            if ord(char) >= 0x1100 and ord(char) <= 0x11FF:  # 한글 자모
-                width += 2
-            elif ord(char) >= 0x3130 and ord(char) <= 0x318F:  # 한글 호환 자모
-                width += 2
-            elif ord(char) >= 0xAC00 and ord(char) <= 0xD7AF:  # 한글 음절
-                width += 2
-            elif ord(char) >= 0x4E00 and ord(char) <= 0x9FFF:  # CJK 한자
-                width += 2
-            elif ord(char) >= 0x3400 and ord(char) <= 0x4DBF:  # CJK 확장 A
-                width += 2
-            elif ord(char) >= 0xFF00 and ord(char) <= 0xFFEF:  # 전각 문자
-                width += 2
-            else:
-                width += 1
-        return width
+        if text.isascii():
+            return len(text)
+        return _text_display_width(text)
+
+    def get_max_line_width(self, text, lines):
+        """여러 줄 텍스트에서 가장 긴 줄의 표시 너비
+
+        Args:
+            text: 원본 텍스트 (lines를 분할하기 전 문자열)
+            lines: text를 줄 단위로 분할한 목록
+
+        Returns:
+            최대 표시 너비 (줄이 없으면 0)
+        """
+        if not lines:
+            return 0
+        # 전체가 ASCII면 줄별 문자 검사 없이 길이만 비교 (긴 로그 덤프 등)
+        if text.isascii():
+            return max(map(len, lines))
+        return max(map(self.get_display_width, lines))
 
     def truncate_text(self, text, max_width):
         """텍스트를 지정된 표시 너비에 맞게 자르기"""
-        current_width = 0
-        result = ""
-        for char in text:
-            # 직접 문자 폭 계산 (get_display_width 재귀 호출 방지)
-            if ord(char) >= 0x1100 and ord(char) <= 0x11FF:  # 한글 자모
-                char_width = 2
-            elif ord(char) >= 0x3130 and ord(char) <= 0x318F:  # 한글 호환 자모
-                char_width = 2
-            elif ord(char) >= 0xAC00 and ord(char) <= 0xD7AF:  # 한글 음절
-                char_width = 2
-            elif ord(char) >= 0x4E00 and ord(char) <= 0x9FFF:  # CJK 한자
-                char_width = 2
-            elif ord(char) >= 0x3400 and ord(char) <= 0x4DBF:  # CJK 확장 A
-                char_width = 2
-            elif ord(char) >= 0xFF00 and ord(char) <= 0xFFEF:  # 전각 문자
-                char_width = 2
-            else:
-                char_width = 1
+        if max_width <= 0:
+            return ""
+        if text.isascii():
+            return text[:max_width]
+        # 누적 너비에서 max_width를 넘지 않는 가장 긴 접두사 길이를 이진 탐색
+        return text[:bisect_right(_text_prefix_widths(text), max_width) - 1]
 
-            if current_width + char_width > max_width:
-                break
-            result += char
-            current_width += char_width
-        return result
+    def fit_text(self, text, width):
+        """텍스트를 표시 너비에 맞게 자르고, 남는 칸을 채울 공백을 함께 반환
+
+        누적 너비를 한 번만 계산해 자르기와 너비 측정을 같이 처리한다.
+
+        Returns:
+            (잘린 텍스트, 공백 패딩) 튜플
+        """
+        if width <= 0:
+            return "", ""
+        if text.isascii():
+            truncated = text[:width]
+            return truncated, _SPACES[:width - len(truncated)]
+        widths = _text_prefix_widths(text)
+        end = bisect_right(widths, width) - 1
+        return text[:end], _SPACES[:width - widths[end]]
 
     def format_text_with_korean_padding(self, text, total_width, align='center'):
         """한글 폭을 고려한 텍스트 패딩 및 정렬
@@ -1019,17 +1457,19 @@ class CCCopyTUI:
         Returns:
             패딩이 적용된 텍스트
         """
+        if total_width <= 0:
+            return ""
         truncated = self.truncate_text(text, total_width)
         display_width = self.get_display_width(truncated)
 
         if align == 'left':
-            return truncated + " " * (total_width - display_width)
+            return truncated + _SPACES[:total_width - display_width]
         elif align == 'right':
-            return " " * (total_width - display_width) + truncated
+            return _SPACES[:total_width - display_width] + truncated
         else:  # center
             left_padding = (total_width - display_width) // 2
             right_padding = total_width - display_width - left_padding
-            return " " * left_padding + truncated + " " * right_padding
+            return _SPACES[:left_padding] + truncated + _SPACES[:right_padding]
 
     def create_dialog_line(self, content, dialog_width, align='center'):
         """다이얼로그 라인 생성 (한글 폭 고려)
@@ -1042,15 +1482,13 @@ class CCCopyTUI:
         Returns:
             "│ content │" 형태의 다이얼로그 라인
         """
-        content_width = dialog_width - 4  # 양쪽 "│ " 제외
-        formatted_content = self.format_text_with_korean_padding(content, content_width, align)
-        return "│ " + formatted_content + " │"
+        return _dialog_line(content, dialog_width, align)
 
     def messagebox(self, message, title="", message_type="info", buttons="ok", default=""):
         """TUI 모드 메시지박스 구현"""
-        import curses
 
         # 대화상자 활성화 플래그 설정
+        self.dialog_done_event.clear()
         self.dialog_active = True
 
         try:
@@ -1132,14 +1570,14 @@ class CCCopyTUI:
             from ..utils.ui_handler import _cli_messagebox
             return _cli_messagebox(message, title, message_type, buttons, default)
         finally:
-            # 대화상자 비활성화
+            # 대화상자 비활성화 (메인 루프 대기 해제)
             self.dialog_active = False
+            self.dialog_done_event.set()
             # 화면 강제 새로고침 - 대화상자 흔적 제거
             self.force_refresh_screen()
 
     def _handle_dialog_buttons(self, dialog_win, buttons, default, height, width):
         """다이얼로그 버튼 처리"""
-        import curses
 
         if buttons == "ok":
             dialog_win.addstr(height - 2, (width - 6) // 2, "[ OK ]", curses.A_REVERSE)
@@ -1233,8 +1671,6 @@ class CCCopyTUI:
 
     def _handle_text_input(self, dialog_win, height, width, default=""):
         """고급 텍스트 입력 처리 - 실시간 표시, 커서 이동, 스크롤, 한글 지원"""
-        import curses
-        import unicodedata
 
         # 입력 상태 변수
         text = list(default)  # 문자 리스트로 관리 (삽입/삭제 용이)
@@ -1497,13 +1933,11 @@ class CCCopyTUI:
         """TUI용 메시지 표시"""
         # level이 이미 포맷된 형태([INFO ], [WARN ] 등)라면 직접 로그에 추가
         if level.startswith("[") and level.endswith("]"):
-            import datetime
             timestamp = datetime.datetime.now().strftime("%y%m%d %H:%M:%S")
             log_entry = f"{timestamp} {level} {message}"
             self.logs.append(log_entry)
+            self.log_count += 1
             self._write_log_to_file(log_entry)
-            if len(self.logs) > MAX_LOG_LINES:
-                self.logs.pop(0)
             # 로그가 추가되었으므로 화면 갱신 필요
             self.needs_redraw = True
         else:
@@ -1649,9 +2083,14 @@ class CCCopyTUI:
             except curses.error:
                 return False
 
-    def add_log(self, message: str, level: str = "LOG"):
-        """로그 추가"""
-        import datetime
+    def add_log(self, message: str, level: str = "LOG", *args):
+        """로그 추가
+
+        Args:
+            message: 로그 메시지 (args가 있으면 % 포맷 문자열)
+            level: 로그 레벨 (INFO, WARNING, ERROR, DEBUG, HIGH 또는 [XXXX] 형식)
+            *args: 메시지 포맷 인자 (로그 항목을 만들 때 한 번만 포맷팅)
+        """
 
         # 현재 시간을 YYMMDD HH:MM:SS 형식으로 생성
         timestamp = datetime.datetime.now().strftime("%y%m%d %H:%M:%S")
@@ -1661,20 +2100,16 @@ class CCCopyTUI:
             level_formatted = level
         else:
             # 기존 방식과의 호환성을 위해 포맷팅
-            level_formatted = {
-                "INFO": "[INFO ]",
-                "WARNING": "[WARN ]",
-                "ERROR": "[ERROR]",
-                "DEBUG": "[DEBUG]",
-                "HIGH": "[HIGH ]"
-            }.get(level, f"[{level}]")
+            level_formatted = LOG_LEVEL_TAGS.get(level) or f"[{level}]"
+
+        if args:
+            message = message % args
 
         # DEBUG 로그는 항상 추가 (로그 뷰어에서 토글로 필터링)
         log_entry = f"{timestamp} {level_formatted} {message}"
         self.logs.append(log_entry)
+        self.log_count += 1
         self._write_log_to_file(log_entry)
-        if len(self.logs) > MAX_LOG_LINES:
-            self.logs.pop(0)
 
         # 로그가 추가되었으므로 화면 갱신 필요
         self.needs_redraw = True
@@ -2600,7 +3035,7 @@ class CCCopyTUI:
                             self.safe_addstr(stdscr, row, suffix_col, suffix_text, color)
                 else:
                     # 빈 줄
-                    stdscr.addstr(row, 1, " " * min(width - 2, 50))
+                    stdscr.addstr(row, 1, _SPACES[:min(width - 2, 50)])
             except curses.error:
                 # 안전한 대안 - 간단한 텍스트만 (동일한 정렬)
                 try:
@@ -2912,8 +3347,8 @@ class CCCopyTUI:
             # 로그 영역 상단 테두리 (명령어 영역과 분리)
             stdscr.addstr(start_row - 1, 0, "├" + "─" * (width - 2) + "┤")
 
-            # 최근 로그 7줄 표시 (하단 테두리 보호)
-            recent_logs = self.logs[-7:] if len(self.logs) >= 7 else self.logs
+            # 최근 로그 7줄 표시 (하단 테두리 보호) - deque 끝에서부터 7개만 순회
+            recent_logs = list(islice(reversed(self.logs), 7))[::-1]
             for i, log in enumerate(recent_logs):
                 row = start_row + i
                 stdscr.addstr(row, 0, "│")
@@ -2960,7 +3395,7 @@ class CCCopyTUI:
             try:
                 if self.logs:
                     # 최근 로그 몇 개만 간단하게 표시 (하단 테두리 보호)
-                    recent_logs = self.logs[-7:] if len(self.logs) >= 7 else self.logs
+                    recent_logs = list(islice(reversed(self.logs), 7))[::-1]
                     for i, log in enumerate(recent_logs):
                         row = height - 8 + i
                         if row >= 0 and row < height - 1:
@@ -3027,6 +3462,52 @@ class CCCopyTUI:
         except Exception as e:
             self.add_log(f"Refresh failed: {e}", "ERROR")
 
+    def draw_main_view(self, stdscr):
+        """일반 화면 구성 요소 그리기"""
+        self.draw_header(stdscr)
+        self.draw_path(stdscr)
+        self.draw_file_list(stdscr)
+        self.draw_commands(stdscr)
+        self.draw_tutorial(stdscr)  # 튜토리얼 오버레이
+        self.draw_logs(stdscr)
+
+    def redraw_while_waiting(self):
+        """외부 프로그램 종료 대기 중 호출 - pending 업데이트와 새 로그를 메인 화면에 반영"""
+        if self.apply_pending_updates():
+            self.needs_redraw = True
+        if not self.needs_redraw or self.screen_buffer is None:
+            return
+
+        try:
+            buf = self.screen_buffer
+            buf.begin((self.term_height, self.term_width))
+            self.draw_main_view(buf)
+            buf.flush()
+            self.stdscr.noutrefresh()
+            curses.doupdate()
+            self.needs_redraw = False
+            # 화면을 다시 그렸으므로 다음 메인 루프에서 시그니처 비교 없이 새로 그림
+            self.last_main_signature = None
+        except curses.error:
+            pass
+
+    def get_main_view_signature(self):
+        """메인 화면을 구성하는 상태의 시그니처 (같으면 다시 그릴 필요 없음)"""
+        return (
+            self.term_height, self.term_width,
+            self.mode, self.view_style, self.current_directory,
+            self.selected_index, self.scroll_offset,
+            id(self.directory_entries), len(self.directory_entries), self.entries_version,
+            self.log_count,
+            self.tutorial_enabled, self.tutorial_step,
+            self.workspace.working_dir,
+        )
+
+    def invalidate_screen_buffer(self):
+        """stdscr에 직접 그리거나 화면을 지운 경우 다음 프레임에서 모든 행을 다시 출력하도록 표시"""
+        if self.screen_buffer is not None:
+            self.screen_buffer.invalidate()
+
     def force_refresh_screen(self):
         """Force complete screen refresh - clears and redraws everything"""
         try:
@@ -3034,6 +3515,7 @@ class CCCopyTUI:
                 self.add_log("강제 화면 새로고침 시작...", "INFO")
                 # 화면 완전 지우기
                 self.stdscr.clear()
+                self.invalidate_screen_buffer()
                 # app_viewer_mode일 때는 refresh_tree 호출 안 함
                 if not getattr(self, 'app_viewer_mode', False):
                     # Partial Refresh로 빠르게 화면 다시 그리기
@@ -3206,7 +3688,6 @@ class CCCopyTUI:
 
     def open_preference_editor(self):
         """환경설정 에디터 실행 (ALT+P)"""
-        import curses
         import subprocess
 
         self.add_log("환경설정 파일을 편집합니다...", "INFO")
@@ -3227,8 +3708,9 @@ class CCCopyTUI:
         except Exception as e:
             self.add_log(f"환경설정 편집 중 오류 발생: {e}", "ERROR")
 
-        # Curses 재개
+        # Curses 재개 (에디터 실행 중 입력된 키는 버림)
         curses.reset_prog_mode()
+        curses.flushinp()
         self.stdscr.refresh()
         self.needs_redraw = True
 
@@ -3936,9 +4418,10 @@ class CCCopyTUI:
             except Exception as e:
                 self.add_log(f"로그 파일 읽기 실패: {e}", "ERROR")
                 self.viewing_log_file = None
-                file_logs = self.logs
+                file_logs = list(self.logs)
         else:
-            file_logs = self.logs
+            # 다른 thread의 add_log와 충돌하지 않도록 스냅샷 사용
+            file_logs = list(self.logs)
 
         # DEBUG 로그 필터링 (self.log_show_all_debug에 따라)
         if self.log_show_all_debug:
@@ -4677,9 +5160,9 @@ class CCCopyTUI:
                     with open(self.viewing_log_file, 'r', encoding='utf-8') as f:
                         current_logs = [line.rstrip('\n') for line in f]
                 except Exception:
-                    current_logs = self.logs
+                    current_logs = list(self.logs)
             else:
-                current_logs = self.logs
+                current_logs = list(self.logs)
 
             # 현재 필터링된 로그 개수 계산 (네비게이션에 사용)
             if self.log_show_all_debug:
@@ -4862,35 +5345,77 @@ class CCCopyTUI:
             # 오류 발생시 조용히 무시
             pass
 
+    def _begin_download(self):
+        """백그라운드 Download 시작 표시 (이미 진행 중이면 False)"""
+        if not self.download_lock.acquire(blocking=False):
+            self.add_log("이미 Download가 진행 중입니다. 완료 후 다시 시도하세요.", "WARNING")
+            return False
+        return True
+
     def run_download(self):
         """다운로드 실행"""
+        if not self._begin_download():
+            return
+
         self.add_log("DOWNLOAD 시작...", "INFO")
+        # 시작 시점의 workspace 사용
+        workspace = self.workspace
         try:
             # 백그라운드 실행을 위해 스레드 사용
-            import threading
             def download_task():
                 try:
-                    self.workspace.download()
+                    changed_paths = workspace.download()
                     self.add_log("DOWNLOAD 완료", "INFO")
-                    # Download 완료 후 파일 상태가 변경되므로 Full Refresh 필요
-                    self.add_log("파일 상태 업데이트 중...", "INFO")
-                    self.refresh_tree(full_refresh=True)
-                    self.add_log("화면 새로고침 완료", "INFO")
+                    # 화면 항목은 UI thread에서만 바꾸므로 메인 루프에 새로고침 요청
+                    # (tag/.gitignore가 바뀌었으면 Full Refresh, 아니면 복사된 파일의 캐시만 지우고 Partial Refresh)
+                    self.add_log("파일 상태 업데이트 요청...", "INFO")
+                    self.request_auto_refresh(full_refresh=changed_paths is None,
+                                              invalidate_paths=changed_paths)
                 except Exception as e:
                     self.add_log(f"DOWNLOAD 실패: {e}", "ERROR")
+                finally:
+                    self.download_lock.release()
 
             thread = threading.Thread(target=download_task)
             thread.daemon = True
             thread.start()
 
         except Exception as e:
+            self.download_lock.release()
             self.add_log(f"다운로드 실행 실패: {e}", "ERROR")
 
+    def start_download_after_clone(self):
+        """프로젝트 복제 후 자동 Download를 백그라운드에서 실행 (다이얼로그를 블로킹하지 않음)"""
+        if not self._begin_download():
+            return
+
+        # 복제 직후 시점의 workspace 사용
+        workspace = self.workspace
+
+        def download_task():
+            try:
+                workspace.download()
+                self.add_log("Download 완료", "HIGH")
+                # Full Refresh: Download 후 정확한 상태 반영
+                # (메인 루프에 요청하여 연속된 복제/새로고침 요청을 한 번의 새로고침으로 병합)
+                self.request_auto_refresh(full_refresh=True)
+            except Exception as e:
+                self.add_log(f"Download 실패: {e}", "ERROR")
+            finally:
+                self.download_lock.release()
+
+        try:
+            thread = threading.Thread(target=download_task)
+            thread.daemon = True
+            thread.start()
+        except Exception:
+            self.download_lock.release()
+            raise
+
     def run_upload(self):
         """업로드 뷰어 열기"""
         self.add_log("업로드 대상 파일 확인 중...", "INFO")
         try:
-            import threading
             def upload_check_task():
                 try:
                     # 업로드 가능한 파일(Modified 상태) 및 충돌 파일 수집 (Git tracked 파일만)
@@ -4945,7 +5470,6 @@ class CCCopyTUI:
         """저장 실행"""
         self.add_log("SAVE 시작...", "INFO")
         try:
-            import threading
             def save_task():
                 try:
                     self.workspace.save()
@@ -4967,9 +5491,9 @@ class CCCopyTUI:
     def run_history(self):
         """히스토리 보기"""
         self.stdscr.clear() # greenfish : 화면 잔상 삭제
+        self.invalidate_screen_buffer()
         self.add_log("HISTORY 조회...", "INFO")
         try:
-            import threading
             def history_task():
                 try:
                     if self.mode == ViewMode.WORK:
@@ -5008,7 +5532,8 @@ class CCCopyTUI:
             # 외부 프로그램 실행 (curses 상태 변경 없이)
             result = func(*args, **kwargs)
 
-            # 외부 프로그램 실행 후 화면 새로고침만 요청
+            # 외부 프로그램 실행 중 입력된 키는 버리고 화면 새로고침 요청
+            curses.flushinp()
             self.needs_redraw = True
 
             return result
@@ -5137,8 +5662,7 @@ class CCCopyTUI:
                 else:
                     # 빈 줄인 경우에도 중간 공간을 공백으로 채워서 │ 문자가 제대로 보이도록 함
                     try:
-                        empty_line = " " * (width - 2)
-                        stdscr.addstr(row, 1, empty_line)
+                        stdscr.addstr(row, 1, _SPACES[:width - 2])
                     except curses.error:
                         pass
 
@@ -5230,7 +5754,6 @@ class CCCopyTUI:
             self.add_log(f"Production 파일: {production_file}", "INFO")
 
             import tempfile
-            import shutil
 
             # 임시 파일 생성 (Production 버전)
             temp_production_file = None
@@ -5281,7 +5804,6 @@ class CCCopyTUI:
 
         self.add_log("업로드 시작...", "INFO")
         try:
-            import threading
             def upload_task():
                 try:
                     # 임시로 upload 메시지를 설정하는 방법이 필요하지만,
@@ -5313,7 +5835,7 @@ class CCCopyTUI:
 
         # 대화상자가 활성화된 동안에는 모든 키 입력 무시
         if self.dialog_active:
-            self.add_log(f"Main: Ignoring key {key} during dialog", "DEBUG")
+            self.add_log("Main: Ignoring key %s during dialog", "DEBUG", key)
             return True
 
         # 도움말 뷰어 모드일 때 키 처리
@@ -5394,6 +5916,14 @@ class CCCopyTUI:
             else:
                 return self.handle_log_viewer_key(key)
 
+        # ESC 직후 바로 도착한 키는 ALT+키 시퀀스로 처리
+        if self.escape_pending:
+            self.escape_pending = False
+            if key == ord('p') or key == ord('P'):  # ALT+P
+                self.open_preference_editor()
+            # 그 외 시퀀스는 무시 (예: ALT+Q로 종료되지 않도록)
+            return True
+
         # 일반 모드에서 종료 키들 (최우선 처리)
         if key == ord('q') or key == ord('Q'):  # q, Q만 종료 (ESC 제거)
             self.add_log("Exit key pressed", "INFO")
@@ -5493,17 +6023,9 @@ class CCCopyTUI:
             self.start_tutorial(force=True)  # F9는 설정 무시하고 무조건 실행
         elif key == 27:  # ESC 키 - ALT+키 시퀀스일 수 있음
             # ALT+키는 많은 터미널에서 ESC + 키로 전달됨
-            # nodelay 모드로 다음 키를 빠르게 확인
-            self.stdscr.nodelay(True)
-            next_key = self.stdscr.getch()
-            self.stdscr.nodelay(False)
-
-            if next_key == ord('p') or next_key == ord('P'):  # ALT+P
-                self.open_preference_editor()
-            else:
-                # 일반 ESC 키 동작 (다른 모드들에서 처리)
-                # next_key가 -1이면 단순 ESC, 그 외는 시퀀스 무시
-                pass
+            # 다음 키는 메인 루프의 getch로 받아 처리 (입력 모드 전환 없음)
+            # 다음 getch가 타임아웃(-1)이면 단순 ESC로 간주하고 해제됨
+            self.escape_pending = True
         elif key == 224 or (key >= 128 and chr(key) == 'p'):  # ALT+P - 다른 터미널 환경
             # 일부 터미널에서는 224나 다른 값으로 전달될 수 있음
             self.open_preference_editor()
@@ -5520,7 +6042,7 @@ class CCCopyTUI:
         else:
             # Unhandled key - 디버깅을 위해 특정 키들만 로그
             if key in [13, 10, 343]:  # Enter 관련 키들만 로그
-                self.add_log(f"Unhandled Enter-like key: {key}", "DEBUG")
+                self.add_log("Unhandled Enter-like key: %s", "DEBUG", key)
             # 다른 키는 로그 출력하지 않음 (노이즈 방지)
 
         return True  # 계속 실행
@@ -5534,7 +6056,9 @@ class CCCopyTUI:
             # 기본 설정
             curses.curs_set(0)  # 커서 숨기기
             stdscr.keypad(1)  # 특수 키 활성화 (필수!)
-            stdscr.timeout(100)  # 짧은 타임아웃으로 빠른 반응
+            if hasattr(curses, 'set_escdelay'):  # Python 3.9+ (이전 버전은 ESCDELAY 환경변수)
+                curses.set_escdelay(25)  # ESC 단독 입력 판단 대기 시간 단축 (기본 1초)
+            stdscr.timeout(GETCH_TIMEOUT_MS)  # 짧은 타임아웃으로 빠른 반응
 
             # 키 입력 설정
             curses.noecho()  # 입력 에코 방지
@@ -5551,6 +6075,10 @@ class CCCopyTUI:
         # 화면 상태 추적을 위한 변수
         self.needs_redraw = True
 
+        # 메인 화면용 행 단위 버퍼 (변경된 행만 다시 그리기)
+        self.screen_buffer = ScreenBuffer(stdscr)
+        self.term_height, self.term_width = stdscr.getmaxyx()
+
         # 프로젝트 선택이 필요한지 확인 및 처리
         if self.workspace.needs_project_selection():
             # 프로젝트 선택이 필요한 경우: 초기 화면 그리지 않고 바로 다이얼로그 표시
@@ -5602,18 +6130,20 @@ class CCCopyTUI:
                 self.run_simple_tui()
                 return
 
-        # Watch thread 시작 (파일 변화 감지)
+        # Watch thread 및 자동 새로고침 스캔 thread 시작 (파일 변화 감지)
         self.start_watch_thread()
+        self.start_scan_thread()
 
         # 앱 시작 시 운세 표시 (다이얼로그)
         self._show_startup_fortune()
 
         while True:
             try:
-                # 화면 크기 확인
-                height, width = stdscr.getmaxyx()
+                # 화면 크기 확인 (캐시된 크기 사용)
+                height, width = self.term_height, self.term_width
                 if height < 15 or width < 60:
                     stdscr.erase()
+                    self.invalidate_screen_buffer()
                     stdscr.addstr(0, 0, "터미널 크기가 너무 작습니다. (최소 60x15)")
                     stdscr.addstr(1, 0, "Q 키를 누르면 종료됩니다.")
                     stdscr.noutrefresh()
@@ -5622,6 +6152,8 @@ class CCCopyTUI:
                     if key == ord('q') or key == ord('Q'):
                         self.cleanup()
                         break
+                    if key == curses.KEY_RESIZE:
+                        self.term_height, self.term_width = stdscr.getmaxyx()
                     continue
 
                 # Pending updates 적용 (thread에서 완료된 상태 업데이트)
@@ -5634,15 +6166,34 @@ class CCCopyTUI:
 
                 # 자동 refresh 체크 (Watch thread에서 파일 변경 감지시)
                 if self.needs_auto_refresh:
+                    # 병합된 요청 중 하나라도 Full Refresh였으면 Full Refresh 실행
+                    # (두 플래그를 함께 읽고 지워서 그 사이에 들어온 Full Refresh 요청을 잃지 않음)
                     with self.refresh_lock:
                         self.needs_auto_refresh = False
-                    # Partial Refresh로 변경 (변경된 파일의 캐시만 클리어됨, Thread 기반 비동기)
+                        full_refresh = self._pending_full_refresh
+                        self._pending_full_refresh = False
+                        if full_refresh:
+                            self._pending_rebuild = False  # Full Refresh가 항목 목록도 다시 구성함
+                    if full_refresh:
+                        # directory_entries/선택 위치 등 화면 상태를 바꾸므로 UI thread에서 실행
+                        self.refresh_tree(full_refresh=True)
+                    else:
+                        # 파일 상태 계산은 스캔 thread에서 (결과는 pending_updates로 돌아옴)
+                        self.request_scan()
+
+                # 스캔 thread가 파일 목록 변경을 발견했거나 Download 등으로 캐시를 지운 경우 항목 목록 다시 구성
+                if self._pending_rebuild:
+                    with self.refresh_lock:
+                        self._pending_rebuild = False
                     self.refresh_tree(full_refresh=False)
 
                 # 키 입력 처리
                 if not self.dialog_active:
                     key = stdscr.getch()  # 블로킹: 키 입력시에만 반환
-                    if key != -1:  # 실제 키 입력이 있는 경우
+                    if key == -1:
+                        # ESC 뒤에 이어진 키가 없으면 단순 ESC
+                        self.escape_pending = False
+                    else:  # 실제 키 입력이 있는 경우
                         try:
                             # 키 처리 결과 확인
                             continue_running = self.handle_key(key)
@@ -5651,8 +6202,13 @@ class CCCopyTUI:
                                 # Graceful shutdown: 모든 thread 및 리소스 정리
                                 self.cleanup()
                                 break
-                            # 키 입력 후 버퍼 정리
-                            curses.flushinp()  # 잔여 입력 버퍼 정리
+                            if self.app_viewer_mode:
+                                # 키를 누르고 있어 쌓인 이동 키는 모두 반영한 뒤 한 번만 그림
+                                self.drain_app_viewer_keys(stdscr)
+                            # 터미널 크기 갱신 (KEY_RESIZE 또는 키 처리 중 다이얼로그가 리사이즈를 소비한 경우)
+                            self.term_height, self.term_width = stdscr.getmaxyx()
+                            # 키 처리 중 다이얼로그/편집기가 화면 외 상태(프로젝트 TAG 등)를 바꿀 수 있으므로 다시 그리기
+                            self.last_main_signature = None
                             # 뷰어 모드가 아닐 때만 화면 갱신 (뷰어는 자체 redraw 관리)
                             if not (self.help_viewer_mode or self.history_viewer_mode or
                                     self.upload_viewer_mode or self.log_viewer_mode):
@@ -5664,36 +6220,38 @@ class CCCopyTUI:
                 # 화면 갱신이 필요한 경우에만 그리기 (Double Buffering 적용)
                 if not self.dialog_active and self.needs_redraw:
                     try:
-                        # Double Buffering: 백버퍼에 그리기
-                        stdscr.erase()  # clear 대신 erase 사용으로 더 안전한 클리어
+                        # 모든 화면 모드를 행 버퍼에 기록한 뒤 변경된 행만 출력
+                        # (화면 전체 erase 없이 모드 전환/스크롤로 바뀐 영역만 다시 그림)
+                        buf = self.screen_buffer
+                        buf.begin((self.term_height, self.term_width))
 
                         # 화면 모드에 따른 그리기
                         if self.help_viewer_mode:
                             # 도움말 뷰어 모드
-                            self.draw_help_viewer(stdscr)
+                            self.draw_help_viewer(buf)
                         elif self.upload_viewer_mode:
                             # 업로드 뷰어 모드
-                            self.draw_upload_viewer(stdscr)
+                            self.draw_upload_viewer(buf)
                         elif self.app_viewer_mode:
                             # App 뷰어 모드
-                            self.draw_app_viewer(stdscr)
+                            self.draw_app_viewer(buf)
                         elif self.history_viewer_mode:
                             # 히스토리 뷰어 모드
                             if self.history_detail_mode:
-                                self.draw_history_detail_viewer(stdscr)
+                                self.draw_history_detail_viewer(buf)
                             else:
-                                self.draw_history_viewer(stdscr)
+                                self.draw_history_viewer(buf)
                         elif self.log_viewer_mode:
                             # 로그 뷰어 모드
-                            self.draw_log_viewer(stdscr)
+                            self.draw_log_viewer(buf)
                         else:
-                            # 일반 화면 구성 요소 그리기
-                            self.draw_header(stdscr)
-                            self.draw_path(stdscr)
-                            self.draw_file_list(stdscr)
-                            self.draw_commands(stdscr)
-                            self.draw_tutorial(stdscr)  # 튜토리얼 오버레이
-                            self.draw_logs(stdscr)
+                            # 화면 상태가 이전 프레임과 같으면 draw_* 생략 (덮어써진 행만 복구)
+                            signature = self.get_main_view_signature()
+                            if signature != self.last_main_signature or not buf.reuse_previous_frame():
+                                self.draw_main_view(buf)
+                                self.last_main_signature = signature
+
+                        buf.flush()
 
                         # Double Buffering: 백버퍼를 가상 스크린에 준비
                         stdscr.noutrefresh()
@@ -5706,6 +6264,7 @@ class CCCopyTUI:
                     except Exception as e:
                         # 그리기 오류시 에러 메시지 표시 (Double Buffering 적용)
                         stdscr.erase()
+                        self.invalidate_screen_buffer()
                         stdscr.addstr(0, 0, f"화면 그리기 오류: {str(e)[:50]}")
                         stdscr.addstr(1, 0, "Q 키를 누르면 종료됩니다.")
                         stdscr.noutrefresh()
@@ -5717,13 +6276,14 @@ class CCCopyTUI:
                         self.needs_redraw = True
                         continue
 
+                elif self.dialog_active:
+                    # 대화상자가 활성화된 동안에는 종료 신호까지 대기 (polling 없음)
+                    self.dialog_done_event.wait()
+                    # 대화상자 종료 후 강제 새로고침
+                    self.needs_redraw = True
                 else:
-                    # 대화상자가 활성화된 동안에는 최소한의 CPU 사용률 유지
-                    import time
-                    time.sleep(0.01)  # 대화상자 상태 체크를 위한 최소 대기
-                    # 대화상자 종료 감지 시 강제 새로고침
-                    if not self.dialog_active:
-                        self.needs_redraw = True
+                    # getch 타임아웃마다 화면 갱신 (변경된 행만 출력됨)
+                    self.needs_redraw = True
 
             except KeyboardInterrupt:
                 # Ctrl+C 종료시에도 cleanup
@@ -5745,19 +6305,8 @@ class CCCopyTUI:
 
     def run_simple_tui(self):
         """간단한 텍스트 기반 TUI (curses 대안) - ANSI 색상 지원"""
-        # ANSI 색상 코드 정의
-        self.ansi_colors = {
-            'reset': '\033[0m',
-            'bold': '\033[1m',
-            'red': '\033[31m',
-            'green': '\033[32m',
-            'yellow': '\033[33m',
-            'blue': '\033[34m',
-            'cyan': '\033[36m',
-            'white': '\033[37m',
-            'bg_white': '\033[47m',
-            'bg_black': '\033[40m'
-        }
+        # ANSI 색상 활성화
+        self.ansi_colors = ANSI_COLORS
 
         print("\n" + "="*60)
         print(f"{self.ansi_colors['bold']}CCCopy TUI - 텍스트 모드 (ANSI 색상 지원){self.ansi_colors['reset']}")
@@ -5786,7 +6335,7 @@ class CCCopyTUI:
 
     def get_ansi_color_for_state(self, state):
         """파일 상태에 따른 ANSI 색상 반환"""
-        if not hasattr(self, 'ansi_colors'):
+        if not self.ansi_colors:
             return ""
 
         color_map = {
@@ -5799,33 +6348,17 @@ class CCCopyTUI:
 
     def get_ansi_color_for_folder(self):
         """폴더용 ANSI 색상 반환"""
-        if not hasattr(self, 'ansi_colors'):
+        if not self.ansi_colors:
             return ""
         return self.ansi_colors['blue'] + self.ansi_colors['bold']  # 파란색 + 볼드
 
     def get_ansi_color_for_log(self, log_line):
         """로그 레벨에 따른 ANSI 색상 적용"""
-        if not hasattr(self, 'ansi_colors'):
+        if not self.ansi_colors:
             return log_line
 
-        # 로그 레벨 추출
-        if '[INFO ]' in log_line:
-            # INFO는 녹색
-            return log_line.replace('[INFO ]', f"{self.ansi_colors['green']}{self.ansi_colors['bold']}[INFO ]{self.ansi_colors['reset']}")
-        elif '[WARN ]' in log_line:
-            # WARNING은 노란색
-            return log_line.replace('[WARN ]', f"{self.ansi_colors['yellow']}{self.ansi_colors['bold']}[WARN ]{self.ansi_colors['reset']}")
-        elif '[ERROR]' in log_line:
-            # ERROR는 빨간색
-            return log_line.replace('[ERROR]', f"{self.ansi_colors['red']}{self.ansi_colors['bold']}[ERROR]{self.ansi_colors['reset']}")
-        elif '[DEBUG]' in log_line:
-            # DEBUG는 회색 (어둡게)
-            return log_line.replace('[DEBUG]', f"\033[2m[DEBUG]{self.ansi_colors['reset']}")
-        elif '[HIGH ]' in log_line:
-            # HIGH는 CYAN (청록색)
-            return log_line.replace('[HIGH ]', f"\033[1;36m[HIGH ]{self.ansi_colors['reset']}")
-
-        return log_line
+        # 로그 레벨 태그를 한 번의 정규식 치환으로 색상 적용
+        return _LOG_LEVEL_RE.sub(lambda m: _LOG_LEVEL_ANSI[m.group(1)], log_line)
 
     def show_full_logs(self):
         """전체 로그 표시 (텍스트 모드용)"""
@@ -5836,7 +6369,7 @@ class CCCopyTUI:
             return
 
         # 모든 로그 표시 (색상 적용)
-        for i, log in enumerate(self.logs, 1):
+        for i, log in enumerate(list(self.logs), 1):
             colored_log = self.get_ansi_color_for_log(log)
             print(f"{i:3}. {colored_log}")
 
@@ -5853,21 +6386,92 @@ class CCCopyTUI:
         print("=" * 60)
         input("\nEnter 키를 누르면 메인 메뉴로 돌아갑니다...")
 
+    def _get_current_full_path(self):
+        """현재 모드 기준 현재 디렉토리의 전체 경로 반환 (변경시에만 다시 계산)"""
+        if self.mode == ViewMode.WORK:
+            base_path = self.workspace.working_dir
+        else:
+            base_path = self.workspace.production_dir
+
+        key = (base_path, self.current_directory)
+        if key != self._cwd_full_path_key:
+            self._cwd_full_path = os.path.join(base_path, self.current_directory) if self.current_directory else base_path
+            self._cwd_full_path_key = key
+        return self._cwd_full_path
+
+    def _remove_temp_file(self, path):
+        """임시 파일 삭제 (없으면 무시)"""
+        if not path:
+            return
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def _remove_tree(self, path):
+        """디렉토리 트리 삭제 - 파일이 많은 작업 디렉토리는 OS 명령(rm -rf / rd /s /q)이
+        shutil.rmtree보다 훨씬 빠르므로 우선 사용하고, 명령이 없으면 shutil.rmtree로 대체"""
+        import subprocess
+
+        if os.name == 'posix':
+            cmd = ['rm', '-rf', '--', path]
+        else:
+            cmd = ['cmd', '/c', 'rd', '/s', '/q', path]
+
+        try:
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except FileNotFoundError:
+            shutil.rmtree(path)
+
+    def _remove_tree_deferred(self, path):
+        """디렉토리를 임시 이름으로 변경한 뒤 백그라운드에서 삭제 (즉시 반환)
+
+        rename은 같은 파일시스템에서 O(1)이므로 사용자는 삭제 완료를 바로 볼 수 있다.
+        rename이 실패하면(다른 파일시스템 등) 동기 삭제로 대체한다.
+        이전 실행에서 삭제가 끝나지 않고 남은 같은 경로의 .todelete.* 디렉토리도 함께 삭제한다.
+
+        Returns:
+            bool: 백그라운드 삭제로 예약했으면 True, 동기 삭제로 이미 끝났으면 False
+        """
+        base_path = path.rstrip(os.sep)
+        trash_path = f"{base_path}.todelete.{uuid.uuid4().hex[:8]}"
+        try:
+            os.rename(path, trash_path)
+        except OSError:
+            self._remove_tree(path)
+            return False
+
+        # 중단되어 남은 이전 삭제 대상 디렉토리 (같은 부모 디렉토리의 "<이름>.todelete.*")
+        parent_dir, base_name = os.path.split(base_path)
+        prefix = base_name + ".todelete."
+        trash_paths = [trash_path]
+        try:
+            with os.scandir(parent_dir or os.curdir) as entries:
+                trash_paths.extend(entry.path for entry in entries
+                                   if entry.name.startswith(prefix) and entry.path != trash_path
+                                   and entry.is_dir(follow_symlinks=False))
+        except OSError:
+            pass
+
+        def remove_task():
+            for target in trash_paths:
+                try:
+                    self._remove_tree(target)
+                    self.add_log(f"백그라운드 삭제 완료: {target}", "DEBUG")
+                except Exception as e:
+                    self.add_log(f"백그라운드 삭제 실패: {target} ({e})", "WARNING")
+
+        # 종료 시 삭제가 끝나도록 daemon이 아닌 thread 사용 (삭제 도중 종료되어 디렉토리가 남지 않도록)
+        threading.Thread(target=remove_task, name="cccopy_remove_tree").start()
+        return True
+
     def launch_terminal_at_current_dir(self):
         """현재 디렉토리에서 터미널 열기"""
         try:
             from ..utils.helpers import launch_terminal
 
-            if self.mode == ViewMode.WORK:
-                base_path = self.workspace.working_dir
-            else:
-                base_path = self.workspace.production_dir
-
-            # 현재 디렉토리 경로 구성
-            if self.current_directory:
-                target_path = os.path.join(base_path, self.current_directory)
-            else:
-                target_path = base_path
+            # 현재 디렉토리 경로 (모드/디렉토리 변경시에만 다시 계산)
+            target_path = self._get_current_full_path()
 
             self.add_log(f"터미널 실행 요청: {target_path}", "INFO")
 
@@ -5891,7 +6495,8 @@ class CCCopyTUI:
 
             is_curses_mode = has_stdscr and not is_text_mode
 
-            self.add_log(f"프로젝트 관리 모드 감지: Curses={is_curses_mode}, stdscr={has_stdscr}, text_mode={is_text_mode}", "DEBUG")
+            self.add_log("프로젝트 관리 모드 감지: Curses=%s, stdscr=%s, text_mode=%s", "DEBUG",
+                         is_curses_mode, has_stdscr, is_text_mode)
 
             if is_curses_mode:
                 # Curses 모드에서는 dialog 사용
@@ -5953,7 +6558,6 @@ class CCCopyTUI:
             welcome_y = max(0, (height // 2) - 5)  # 다이얼로그 위에 표시
 
             try:
-                import curses
                 # 노란색 (볼드) 속성 사용
                 if curses.has_colors():
                     stdscr.addstr(welcome_y, welcome_x, welcome_msg, curses.color_pair(3) | curses.A_BOLD)
@@ -5983,23 +6587,18 @@ class CCCopyTUI:
                 from ..utils.config import ProjectSelectionManager
                 project_manager = ProjectSelectionManager(self.workspace)
 
-                if not project_manager._is_path_already_used(base_dir):
-                    # 중복 없음 - 그대로 사용
-                    default_working_dir = base_dir
-                else:
+                # 등록된 경로 집합을 한 번만 조회하여 후보 경로를 검사
+                used_paths = project_manager._get_used_paths_set()
+                default_working_dir = base_dir  # 중복 없음 - 그대로 사용
+                if base_dir in used_paths:
                     # 중복 있음 - _1, _2, ... 추가
-                    counter = 1
-                    while True:
+                    for counter in range(1, 101):  # 무한 루프 방지
                         candidate_dir = f"{base_dir}_{counter}"
-                        if not project_manager._is_path_already_used(candidate_dir):
+                        if candidate_dir not in used_paths:
                             default_working_dir = candidate_dir
                             break
-                        counter += 1
-                        if counter > 100:  # 무한 루프 방지
-                            default_working_dir = base_dir
-                            break
         except Exception as e:
-            self.add_log(f"템플릿 기본 경로 조회 실패: {e}", "DEBUG")
+            self.add_log("템플릿 기본 경로 조회 실패: %s", "DEBUG", e)
 
         # 작업 디렉토리 경로 입력
         while True:
@@ -6055,15 +6654,14 @@ class CCCopyTUI:
                     temp_ini_file = project_manager._create_sources_edit_file(selected_template)
                     if temp_ini_file:
                         # 텍스트 에디터 실행
-                        if launch_text_editor(temp_ini_file):
+                        if launch_text_editor(temp_ini_file, poll_callback=self.redraw_while_waiting):
                             use_custom_settings = True
                             self.add_log("SOURCES 편집이 완료되었습니다.", "INFO")
                             self.show_info_dialog("SOURCES 편집이 완료되었습니다.")
                             break
                         else:
                             self.show_error_dialog("텍스트 에디터 실행에 실패했습니다.")
-                            if temp_ini_file and os.path.exists(temp_ini_file):
-                                os.remove(temp_ini_file)
+                            self._remove_temp_file(temp_ini_file)
                             temp_ini_file = None
                             # 다시 메뉴로 돌아감
                     else:
@@ -6084,8 +6682,7 @@ class CCCopyTUI:
                 )
 
                 # 임시 파일 정리
-                if temp_ini_file and os.path.exists(temp_ini_file):
-                    os.remove(temp_ini_file)
+                self._remove_temp_file(temp_ini_file)
 
                 # 프로젝트 생성시 캐시 초기화
                 self.tracked_files_cache = None
@@ -6111,7 +6708,7 @@ class CCCopyTUI:
                 try:
                     self.workspace.download()
                     self.add_log("Download 완료", "HIGH")
-                    # Full Refresh: Download 후 정확한 상태 반영
+                    # 새 프로젝트의 첫 Download는 모든 파일을 새로 받으므로 Full Refresh
                     self.refresh_tree(full_refresh=True)
                 except Exception as e:
                     self.add_log(f"Download 실패: {e}", "ERROR")
@@ -6120,17 +6717,57 @@ class CCCopyTUI:
                 return True
             except Exception as e:
                 # 오류 발생시 임시 파일 정리
-                if temp_ini_file and os.path.exists(temp_ini_file):
-                    os.remove(temp_ini_file)
+                self._remove_temp_file(temp_ini_file)
                 self.show_error_dialog(f"프로젝트 생성 실패:\n{e}")
                 return False
 
+    def _load_projects(self, project_manager, force=False):
+        """등록된 프로젝트 목록 로드 (캐시된 목록이 있으면 디스크를 다시 읽지 않음)"""
+        if force or self._projects_cache is None:
+            self._projects_cache = project_manager._get_registered_projects()
+        return self._projects_cache
+
+    def _drop_cached_project(self, project_count):
+        """삭제된 프로젝트를 캐시된 목록에서 제거 (디스크 재조회 없이 in-place 갱신)"""
+        if self._projects_cache is not None:
+            self._projects_cache[:] = [p for p in self._projects_cache if p[0] != project_count]
+        return self._projects_cache
+
+    def _on_project_registry_change(self, event, project_count):
+        """ProjectSelectionManager.on_change 콜백 - 프로젝트 목록 캐시 갱신
+
+        삭제는 캐시에서 바로 제거하고, 편집/복제는 다음 조회 시 디스크에서 다시 읽도록 캐시를 비운다.
+        """
+        if event == 'delete':
+            self._drop_cached_project(project_count)
+        else:
+            self._projects_cache = None
+
+    def _build_project_rows(self, registered_projects):
+        """프로젝트 목록의 표시용 필드를 한 번만 계산
+
+        Returns:
+            (4자리 패딩 번호 리스트, 표시 이름 리스트) - registered_projects와 같은 순서
+        """
+        padded_numbers = [f"{project_count:04d}" for project_count, _, _, _, _ in registered_projects]
+        display_names = [f"{project_name}({tag})" if tag else project_name
+                         for _, project_name, _, tag, _ in registered_projects]
+        return padded_numbers, display_names
+
+    def _format_project_menu_items(self, registered_projects, display_names, current_project):
+        """프로젝트 목록 메뉴 항목 문자열 생성 (현재 프로젝트에는 [현재] 표시)"""
+        current = str(current_project)
+        return [f"{display_name} ({work_dir}){' [현재]' if str(project_count) == current else ''}"
+                for (project_count, _, work_dir, _, _), display_name in zip(registered_projects, display_names)]
+
     def show_project_switching_dialog(self):
         """프로젝트 목록 다이얼로그"""
         from ..utils.config import ProjectSelectionManager
 
         project_manager = ProjectSelectionManager(self.workspace)
-        registered_projects = project_manager._get_registered_projects()
+        # 다이얼로그 진입 시 한 번만 디스크에서 읽고, 이후 변경은 on_change 콜백으로 캐시에 반영
+        project_manager.on_change = self._on_project_registry_change
+        registered_projects = self._load_projects(project_manager, force=True)
 
         if not registered_projects:
             self.show_error_dialog("등록된 프로젝트가 없습니다.\n먼저 신규 프로젝트를 생성하세요.")
@@ -6138,29 +6775,25 @@ class CCCopyTUI:
 
         current_project = self.workspace.get_current_project_name()
 
-        # 메뉴 항목 구성
-        menu_items = []
-        for project_count, project_name, work_dir, tag, create_date in registered_projects:
-            current_marker = " [현재]" if str(project_count) == current_project else ""
-            if tag:
-                display_name = f"{project_name}({tag})"
-            else:
-                display_name = project_name
-            menu_items.append(f"{display_name} ({work_dir}){current_marker}")
+        # 메뉴 항목은 목록이 변경(편집/삭제/복제)된 경우에만 다시 구성
+        list_dirty = True
 
         while True:
+            if list_dirty:
+                registered_projects = self._load_projects(project_manager)
+                # 표시용 필드는 목록 로드 시 한 번만 계산
+                padded_numbers, display_names = self._build_project_rows(registered_projects)
+                menu_items = self._format_project_menu_items(registered_projects, display_names, current_project)
+                list_dirty = False
+
             selected_idx = self.show_menu_dialog("프로젝트 목록", menu_items, "↑↓: 선택, Enter: 선택, ESC: 취소")
 
             if selected_idx == -1:  # 취소
                 return False
 
             project_count, project_name, work_dir, tag, create_date = registered_projects[selected_idx]
-
-            # 디스플레이 이름 생성
-            if tag:
-                display_name = f"{project_name}({tag})"
-            else:
-                display_name = project_name
+            padded_project_count = padded_numbers[selected_idx]
+            display_name = display_names[selected_idx]
 
             # 이 프로젝트에 대한 action을 반복 선택할 수 있도록 내부 루프
             while True:
@@ -6177,16 +6810,19 @@ class CCCopyTUI:
                         self.show_info_dialog(f"이미 현재 프로젝트입니다:\n{display_name}")
                         continue
 
+                    # workspace 설정은 프로젝트 변경 시 제자리에서 바뀌므로 Download 중에는 변경하지 않음
+                    if self.download_lock.locked():
+                        self.show_info_dialog("Download가 진행 중입니다.\n완료된 후 프로젝트를 변경하세요.")
+                        continue
+
                     try:
                         # 현재 프로젝트의 view mode 저장
                         self._save_view_mode()
 
                         self.workspace._load_project(project_name)
-                        # 4자리 패딩된 프로젝트 번호 생성
-                        padded_project_number = f"{project_count:04d}"
-                        self.workspace.current_project_number = padded_project_number  # 현재 프로젝트 번호 저장
+                        self.workspace.current_project_number = padded_project_count  # 현재 프로젝트 번호 저장
                         self.workspace._apply_final_config()  # 설정 적용하여 working_dir 업데이트
-                        project_manager._update_last_project(padded_project_number)
+                        project_manager._update_last_project(padded_project_count)
 
                         # 프로젝트 변경시 캐시 초기화
                         self.tracked_files_cache = None
@@ -6210,7 +6846,6 @@ class CCCopyTUI:
                     curses.endwin()
 
                     try:
-                        padded_project_count = f"{project_count:04d}"
                         changed = project_manager.edit_project(padded_project_count, project_name, tag)
 
                         if changed and str(project_count) == current_project:
@@ -6227,29 +6862,30 @@ class CCCopyTUI:
                         self.add_log(f"프로젝트 편집 중 오류: {e}", "ERROR")
 
                     finally:
-                        # Curses 재개
+                        # Curses 재개 (에디터 실행 중 입력된 키는 버림)
                         curses.reset_prog_mode()
+                        curses.flushinp()
                         self.stdscr.refresh()
                         self.needs_redraw = True
 
-                    # 목록 갱신 (display_name도 변경될 수 있음)
-                    registered_projects = project_manager._get_registered_projects()
+                    # 목록 갱신 (display_name도 변경될 수 있음 - 변경된 경우 on_change 콜백으로 캐시가 비워져 다시 읽음)
+                    registered_projects = self._load_projects(project_manager)
+                    list_dirty = True
                     # 현재 프로젝트 정보 다시 가져오기
                     for pc, pn, wd, t, cd in registered_projects:
                         if pc == project_count:
                             project_name = pn
                             work_dir = wd
                             tag = t
-                            if t:
-                                display_name = f"{pn}({t})"
-                            else:
-                                display_name = pn
+                            display_name = f"{pn}({t})" if t else pn
                             break
 
                     # 내부 루프 계속 -> 같은 프로젝트의 action 메뉴로 돌아감
                     continue
 
                 elif action == 2:  # 프로젝트 삭제
+                    config_path_str = f"~/.cccopy/project/{padded_project_count}/"
+
                     # 삭제 옵션 선택
                     delete_option = self.show_choice_dialog(
                         f"프로젝트 삭제 확인\n\n프로젝트: {display_name}\n작업 경로: {work_dir}",
@@ -6258,35 +6894,24 @@ class CCCopyTUI:
 
                     if delete_option == 0:  # 항목만 삭제 (파일 유지)
                         self.add_log(f"프로젝트 항목 삭제 시도: {project_count} ({project_name})", "DEBUG")
-                        self.add_log(f"삭제할 경로: ~/.cccopy/project/{project_count:04d}/", "DEBUG")
+                        self.add_log(f"삭제할 경로: {config_path_str}", "DEBUG")
 
-                        # 프로젝트 번호를 4자리로 패딩하여 삭제 시도
-                        padded_project_count = f"{project_count:04d}"
-                        delete_result = project_manager._delete_project(padded_project_count)
+                        delete_result = project_manager._delete_project(project_count)
                         if delete_result:
                             self.add_log(f"프로젝트 항목 삭제 성공: {project_count}", "INFO")
                             self.show_info_dialog(f"프로젝트 '{project_name}' 항목이 삭제되었습니다.\n(작업 파일은 유지됩니다)")
-                            # 목록 갱신
-                            registered_projects = project_manager._get_registered_projects()
+                            # 목록 갱신 (on_change 콜백으로 캐시에서 이미 제거됨)
+                            registered_projects = self._load_projects(project_manager)
                             if not registered_projects:
                                 self.show_info_dialog("더 이상 등록된 프로젝트가 없습니다.")
                                 return False
-                            # 메뉴 항목 재구성 (원래 포맷과 동일하게)
-                            menu_items = []
-                            for project_count, proj_name, proj_dir, tag, create_date in registered_projects:
-                                current_marker = " [현재]" if str(project_count) == current_project else ""
-                                if tag:
-                                    display_name = f"{proj_name}({tag})"
-                                else:
-                                    display_name = proj_name
-                                menu_items.append(f"{display_name} ({proj_dir}){current_marker}")
-                            # 삭제 후 처음부터 다시 시작
-                            continue
+                            list_dirty = True
+                            # 삭제 후 처음부터 다시 시작 (프로젝트 목록으로)
+                            break
                         else:
                             # 삭제 실패 (예외 발생 등)
-                            actual_path = f"~/.cccopy/project/{project_count:04d}"
                             self.add_log(f"프로젝트 삭제 실패: {project_count}", "ERROR")
-                            self.add_log(f"삭제 실패 경로: {actual_path}", "ERROR")
+                            self.add_log(f"삭제 실패 경로: {config_path_str}", "ERROR")
                             self.show_error_dialog(f"프로젝트 삭제 중 오류가 발생했습니다.")
 
                     elif delete_option == 1:  # 전체 삭제 (파일 포함)
@@ -6298,43 +6923,34 @@ class CCCopyTUI:
 
                         if final_confirm == 0:  # Yes, 전체 삭제 실행
                             self.add_log(f"프로젝트 전체 삭제 시도: {project_count} ({project_name})", "DEBUG")
-                            self.add_log(f"삭제할 설정 경로: ~/.cccopy/project/{project_count:04d}/", "DEBUG")
+                            self.add_log(f"삭제할 설정 경로: {config_path_str}", "DEBUG")
                             self.add_log(f"삭제할 작업 경로: {work_dir}", "DEBUG")
 
-                            import shutil
-                            import os
-
                             try:
-                                # 1. 작업 디렉토리 삭제
-                                if os.path.exists(work_dir):
-                                    shutil.rmtree(work_dir)
-                                    self.add_log(f"작업 디렉토리 삭제 완료: {work_dir}", "INFO")
-                                else:
-                                    self.add_log(f"작업 디렉토리가 이미 존재하지 않음: {work_dir}", "INFO")
-
-                                # 2. 프로젝트 설정 삭제
-                                padded_project_count = f"{project_count:04d}"
-                                delete_result = project_manager._delete_project(padded_project_count)
+                                # 1. 프로젝트 설정 삭제 (작은 메타데이터이므로 먼저 삭제하여 목록에서 즉시 제거)
+                                delete_result = project_manager._delete_project(project_count)
 
                                 if delete_result:
+                                    # 2. 작업 디렉토리 삭제 (이름 변경 후 백그라운드에서 삭제)
+                                    if os.path.exists(work_dir):
+                                        if self._remove_tree_deferred(work_dir):
+                                            # 실제 삭제 완료/실패는 백그라운드 thread가 DEBUG/WARNING 로그로 남김
+                                            self.add_log(f"작업 디렉토리 삭제 예약됨: {work_dir}", "INFO")
+                                        else:
+                                            self.add_log(f"작업 디렉토리 삭제 완료: {work_dir}", "INFO")
+                                    else:
+                                        self.add_log(f"작업 디렉토리가 이미 존재하지 않음: {work_dir}", "INFO")
+
                                     self.add_log(f"프로젝트 전체 삭제 성공: {project_count}", "INFO")
                                     self.show_info_dialog(f"프로젝트 '{project_name}'가 완전히 삭제되었습니다.\n(설정 및 작업 파일 모두 삭제됨)")
-                                    # 목록 갱신
-                                    registered_projects = project_manager._get_registered_projects()
+                                    # 목록 갱신 (on_change 콜백으로 캐시에서 이미 제거됨)
+                                    registered_projects = self._load_projects(project_manager)
                                     if not registered_projects:
                                         self.show_info_dialog("더 이상 등록된 프로젝트가 없습니다.")
                                         return False
-                                    # 메뉴 항목 재구성 (원래 포맷과 동일하게)
-                                    menu_items = []
-                                    for project_count, proj_name, proj_dir, tag, create_date in registered_projects:
-                                        current_marker = " [현재]" if str(project_count) == current_project else ""
-                                        if tag:
-                                            display_name = f"{proj_name}({tag})"
-                                        else:
-                                            display_name = proj_name
-                                        menu_items.append(f"{display_name} ({proj_dir}){current_marker}")
-                                    # 삭제 후 처음부터 다시 시작
-                                    continue
+                                    list_dirty = True
+                                    # 삭제 후 처음부터 다시 시작 (프로젝트 목록으로)
+                                    break
                                 else:
                                     self.add_log(f"프로젝트 설정 삭제 실패: {project_count}", "ERROR")
                                     self.show_error_dialog(f"프로젝트 설정 삭제 중 오류가 발생했습니다.")
@@ -6385,35 +7001,18 @@ class CCCopyTUI:
                             new_tag = default_tag
 
                         # 복제 실행
-                        padded_project_count = f"{project_count:04d}"
                         self.add_log(f"복제 실행: {padded_project_count} → {new_work_dir} (TAG: {new_tag})", "INFO")
 
                         if project_manager.clone_project(padded_project_count, new_work_dir, new_tag):
                             self.add_log(f"프로젝트 복제 성공", "INFO")
                             self.show_info_dialog(f"프로젝트가 복제되었습니다!\n\n원본: {display_name}\n새 작업 경로: {new_work_dir}\n새 TAG: {new_tag}")
 
-                            # 자동 Download 실행
+                            # 자동 Download 실행 (백그라운드 - 진행 상황은 로그로 표시)
                             self.add_log("프로젝트 복제 후 자동 Download를 시작합니다...", "HIGH")
-                            try:
-                                self.workspace.download()
-                                self.add_log("Download 완료", "HIGH")
-                                # Full Refresh: Download 후 정확한 상태 반영
-                                self.refresh_tree(full_refresh=True)
-                            except Exception as e:
-                                self.add_log(f"Download 실패: {e}", "ERROR")
-                                self.show_error_dialog(f"Download 중 오류가 발생했습니다:\n{e}")
-
-                            # 목록 갱신
-                            registered_projects = project_manager._get_registered_projects()
-                            # 메뉴 항목 재구성
-                            menu_items = []
-                            for proj_count, proj_name, proj_dir, proj_tag, create_date in registered_projects:
-                                current_marker = " [현재]" if str(proj_count) == current_project else ""
-                                if proj_tag:
-                                    proj_display_name = f"{proj_name}({proj_tag})"
-                                else:
-                                    proj_display_name = proj_name
-                                menu_items.append(f"{proj_display_name} ({proj_dir}){current_marker}")
+                            self.start_download_after_clone()
+
+                            # 목록 갱신 (on_change 콜백으로 캐시가 비워졌으므로 목록으로 돌아갈 때 다시 읽어 재구성)
+                            list_dirty = True
 
                             # 복제 후 처음부터 다시 시작
                             break
@@ -6426,12 +7025,10 @@ class CCCopyTUI:
         """로그 파일 선택 다이얼로그"""
         try:
             # 로그 파일 목록 가져오기 (최신순)
-            log_files = []
-            for filename in os.listdir(LOG_DIR):
-                if filename.endswith('.log'):
-                    filepath = os.path.join(LOG_DIR, filename)
-                    # 파일 수정 시간 기준으로 정렬
-                    log_files.append((os.path.getmtime(filepath), filepath, filename))
+            # scandir의 DirEntry를 사용하여 별도의 경로 조합/stat 호출 없이 수정 시간 확인
+            with os.scandir(LOG_DIR) as entries:
+                log_files = [(entry.stat().st_mtime, entry.path, entry.name)
+                             for entry in entries if entry.name.endswith('.log')]
 
             if not log_files:
                 self.add_log("로그 파일이 없습니다", "INFO")
@@ -6450,7 +7047,6 @@ class CCCopyTUI:
                 # 현재 실행 중인 로그 파일은 목록에서 제외
                 if filepath == current_log_path:
                     continue
-                import datetime
                 time_str = datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
                 items.append(f"{filename} ({time_str})")
                 filtered_log_files.append((mtime, filepath, filename))
@@ -6509,6 +7105,15 @@ class CCCopyTUI:
         start_y = max(0, (height - dialog_height) // 2)
         start_x = max(0, (width - dialog_width) // 2)
 
+        # 다이얼로그는 pad에 그린 뒤 한 번의 doupdate로 화면에 출력
+        # (오른쪽 아래 마지막 칸 쓰기 오류를 피하기 위해 1칸씩 여유를 둠)
+        pad = curses.newpad(dialog_height + 1, dialog_width + 1)
+        pad_bottom = min(start_y + dialog_height, height) - 1
+        pad_right = min(start_x + dialog_width, width) - 1
+
+        # 선택 항목 색상은 다이얼로그 진입 시 한 번만 조회
+        selected_color = getattr(self, 'colors', {}).get('selected', curses.A_REVERSE)
+
         selected_index = 0
         scroll_offset = 0
         needs_full_redraw = True
@@ -6537,119 +7142,132 @@ class CCCopyTUI:
 
             menu_lines.append((normal_line, selected_line))
 
-        while True:
-            try:
-                # 스크롤 처리: 선택된 항목이 화면에 보이도록 조정
-                if selected_index < scroll_offset:
-                    scroll_offset = selected_index
-                elif selected_index >= scroll_offset + visible_items:
-                    scroll_offset = selected_index - visible_items + 1
+        # 테두리/제목/도움말 등 고정 라인들도 미리 계산
+        top_border = "┌" + "─" * (dialog_width - 2) + "┐"
+        mid_separator = "├" + "─" * (dialog_width - 2) + "┤"
+        bottom_border = "└" + "─" * (dialog_width - 2) + "┘"
+        empty_line = "│" + " " * (dialog_width - 2) + "│"
+
+        # 제목 - 중앙 정렬 (한글 너비 고려)
+        title_truncated = self.truncate_text(title, content_width)
+        title_actual_width = self.get_display_width(title_truncated)
+        title_padding = (content_width - title_actual_width) // 2
+        title_line = "│" + " " * title_padding + title_truncated + " " * (content_width - title_padding - title_actual_width) + "│"
+
+        # 도움말 - 중앙 정렬 (한글 너비 고려)
+        help_truncated = self.truncate_text(help_text, content_width)
+        help_actual_width = self.get_display_width(help_truncated)
+        help_padding = (content_width - help_actual_width) // 2
+        help_line = "│" + " " * help_padding + help_truncated + " " * (content_width - help_padding - help_actual_width) + "│"
+        help_row = visible_items + 3
 
-                # 전체 재그리기 또는 스크롤 변경
-                if needs_full_redraw or last_scroll_offset != scroll_offset:
-                    # 상단 테두리
-                    stdscr.addstr(start_y, start_x, "┌" + "─" * (dialog_width - 2) + "┐")
-
-                    # 제목 - 중앙 정렬 (한글 너비 고려)
-                    content_width = dialog_width - 2
-                    title_truncated = self.truncate_text(title, content_width)
-                    title_actual_width = self.get_display_width(title_truncated)
-                    title_padding = (content_width - title_actual_width) // 2
-                    title_line = "│" + " " * title_padding + title_truncated + " " * (content_width - title_padding - title_actual_width) + "│"
-                    stdscr.addstr(start_y + 1, start_x, title_line)
+        try:
+            while True:
+                try:
+                    # 스크롤 처리: 선택된 항목이 화면에 보이도록 조정
+                    if selected_index < scroll_offset:
+                        scroll_offset = selected_index
+                    elif selected_index >= scroll_offset + visible_items:
+                        scroll_offset = selected_index - visible_items + 1
+
+                    # 전체 재그리기 또는 스크롤 변경
+                    changed = True
+                    if needs_full_redraw or last_scroll_offset != scroll_offset:
+                        # 상단 테두리, 제목, 구분선
+                        pad.addstr(0, 0, top_border)
+                        pad.addstr(1, 0, title_line)
+                        pad.addstr(2, 0, mid_separator)
+
+                        # 보이는 항목들만 그리기 (스크롤 적용)
+                        for display_idx in range(visible_items):
+                            item_idx = scroll_offset + display_idx
+                            row = 3 + display_idx
+
+                            if item_idx < len(items):
+                                normal_line, selected_line = menu_lines[item_idx]
+                                if item_idx == selected_index:
+                                    pad.addstr(row, 0, selected_line, selected_color)
+                                else:
+                                    pad.addstr(row, 0, normal_line)
+                            else:
+                                # 빈 줄
+                                pad.addstr(row, 0, empty_line)
+
+                        # 하단 구분선, 도움말, 하단 테두리
+                        pad.addstr(help_row, 0, mid_separator)
+                        pad.addstr(help_row + 1, 0, help_line)
+                        pad.addstr(help_row + 2, 0, bottom_border)
+
+                        needs_full_redraw = False
+                        last_selected_index = selected_index
+                        last_scroll_offset = scroll_offset
+
+                    # 선택 상태만 변경된 경우 (스크롤 없이)
+                    elif last_selected_index != selected_index:
+                        # 이전 선택 항목 언하이라이트
+                        if last_selected_index >= scroll_offset and last_selected_index < scroll_offset + visible_items:
+                            display_idx = last_selected_index - scroll_offset
+                            row = 3 + display_idx
+                            normal_line, _ = menu_lines[last_selected_index]
+                            pad.addstr(row, 0, normal_line)
+
+                        # 새 선택 항목 하이라이트
+                        if selected_index >= scroll_offset and selected_index < scroll_offset + visible_items:
+                            display_idx = selected_index - scroll_offset
+                            row = 3 + display_idx
+                            _, selected_line = menu_lines[selected_index]
+                            pad.addstr(row, 0, selected_line, selected_color)
+
+                        last_selected_index = selected_index
 
-                    # 구분선
-                    stdscr.addstr(start_y + 2, start_x, "├" + "─" * (dialog_width - 2) + "┤")
-
-                    # 보이는 항목들만 그리기 (스크롤 적용)
-                    for display_idx in range(visible_items):
-                        item_idx = scroll_offset + display_idx
-                        row = start_y + 3 + display_idx
-
-                        if item_idx < len(items):
-                            normal_line, selected_line = menu_lines[item_idx]
-                            if item_idx == selected_index:
-                                color = getattr(self, 'colors', {}).get('selected', curses.A_REVERSE)
-                                stdscr.addstr(row, start_x, selected_line, color)
-                            else:
-                                stdscr.addstr(row, start_x, normal_line)
-                        else:
-                            # 빈 줄
-                            empty_line = "│" + " " * (dialog_width - 2) + "│"
-                            stdscr.addstr(row, start_x, empty_line)
-
-                    # 하단 구분선
-                    help_row = start_y + visible_items + 3
-                    stdscr.addstr(help_row, start_x, "├" + "─" * (dialog_width - 2) + "┤")
-
-                    # 도움말 - 중앙 정렬 (한글 너비 고려)
-                    content_width = dialog_width - 2
-                    help_truncated = self.truncate_text(help_text, content_width)
-                    help_actual_width = self.get_display_width(help_truncated)
-                    help_padding = (content_width - help_actual_width) // 2
-                    help_line = "│" + " " * help_padding + help_truncated + " " * (content_width - help_padding - help_actual_width) + "│"
-                    stdscr.addstr(help_row + 1, start_x, help_line)
-
-                    # 하단 테두리
-                    stdscr.addstr(help_row + 2, start_x, "└" + "─" * (dialog_width - 2) + "┘")
-
-                    needs_full_redraw = False
-                    last_selected_index = selected_index
-                    last_scroll_offset = scroll_offset
-
-                # 선택 상태만 변경된 경우 (스크롤 없이)
-                elif last_selected_index != selected_index:
-                    # 이전 선택 항목 언하이라이트
-                    if last_selected_index >= scroll_offset and last_selected_index < scroll_offset + visible_items:
-                        display_idx = last_selected_index - scroll_offset
-                        row = start_y + 3 + display_idx
-                        normal_line, _ = menu_lines[last_selected_index]
-                        stdscr.addstr(row, start_x, normal_line)
-
-                    # 새 선택 항목 하이라이트
-                    if selected_index >= scroll_offset and selected_index < scroll_offset + visible_items:
-                        display_idx = selected_index - scroll_offset
-                        row = start_y + 3 + display_idx
-                        _, selected_line = menu_lines[selected_index]
-                        color = getattr(self, 'colors', {}).get('selected', curses.A_REVERSE)
-                        stdscr.addstr(row, start_x, selected_line, color)
-
-                    last_selected_index = selected_index
+                    else:
+                        # 무시된 키/타임아웃: 상태가 그대로면 화면 출력 없이 다시 키 대기
+                        changed = False
 
-                stdscr.refresh()
+                    if changed:
+                        # 키 입력은 stdscr.getch()로 받으므로 stdscr를 먼저 반영해 둠
+                        # (touch된 stdscr가 남아 있으면 getch()의 암묵적 refresh가 다이얼로그를 덮어씀)
+                        stdscr.noutrefresh()
+                        pad.noutrefresh(0, 0, start_y, start_x, pad_bottom, pad_right)
+                        curses.doupdate()
 
-                key = stdscr.getch()
+                    key = stdscr.getch()
 
-                if key == curses.KEY_UP and selected_index > 0:
-                    selected_index -= 1
-                elif key == curses.KEY_DOWN and selected_index < len(items) - 1:
-                    selected_index += 1
-                elif key == curses.KEY_PPAGE:  # Page Up
-                    selected_index = max(0, selected_index - visible_items)
-                elif key == curses.KEY_NPAGE:  # Page Down
-                    selected_index = min(len(items) - 1, selected_index + visible_items)
-                elif key == curses.KEY_HOME:
-                    selected_index = 0
-                elif key == curses.KEY_END:
-                    selected_index = len(items) - 1
-                elif key == 10 or key == 13:  # Enter
-                    return selected_index
-                elif key == 27 or key == ord('q') or key == ord('Q'):  # ESC
+                    if key == curses.KEY_UP and selected_index > 0:
+                        selected_index -= 1
+                    elif key == curses.KEY_DOWN and selected_index < len(items) - 1:
+                        selected_index += 1
+                    elif key == curses.KEY_PPAGE:  # Page Up
+                        selected_index = max(0, selected_index - visible_items)
+                    elif key == curses.KEY_NPAGE:  # Page Down
+                        selected_index = min(len(items) - 1, selected_index + visible_items)
+                    elif key == curses.KEY_HOME:
+                        selected_index = 0
+                    elif key == curses.KEY_END:
+                        selected_index = len(items) - 1
+                    elif key == 10 or key == 13:  # Enter
+                        return selected_index
+                    elif key == 27 or key == ord('q') or key == ord('Q'):  # ESC
+                        return -1
+
+                except curses.error as e:
+                    # 디버깅을 위해 로그 추가
+                    self.add_log(f"Dialog drawing error: {e}", "ERROR")
                     return -1
-
-            except curses.error as e:
-                # 디버깅을 위해 로그 추가
-                self.add_log(f"Dialog drawing error: {e}", "ERROR")
-                return -1
+        finally:
+            # pad로 그린 영역은 stdscr에 기록되지 않으므로, 다음 refresh에서
+            # stdscr 전체를 다시 출력하여 다이얼로그 흔적을 지우도록 표시
+            stdscr.touchwin()
 
     def show_input_dialog(self, title, message, default_value=""):
         """입력 다이얼로그 - 한글 입력 지원"""
-        import unicodedata
 
         if not hasattr(self, 'stdscr') or not self.stdscr:
             return None
 
         stdscr = self.stdscr
+        # 다이얼로그를 stdscr에 직접 그리므로 닫힌 뒤 메인 화면의 모든 행을 다시 출력
+        self.invalidate_screen_buffer()
 
         # 기존 커서 상태 저장
         try:
@@ -6664,7 +7282,7 @@ class CCCopyTUI:
         message_lines = message.split('\n')
 
         # 다이얼로그 크기 계산 (한글 폭 고려, 화면 크기 제한)
-        max_message_width = max(self.get_display_width(line) for line in message_lines) if message_lines else 0
+        max_message_width = self.get_max_line_width(message, message_lines)
         dialog_width = min(max(self.get_display_width(title) + 4, max_message_width + 4, 50), width - 4)
 
         # 메시지 라인 수 제한 (화면 높이 고려)
@@ -6687,7 +7305,7 @@ class CCCopyTUI:
         # 한글 입력을 위한 변수들
         text = list(default_value)  # 문자 리스트로 관리
         cursor_pos = len(text)
-        multibyte_buffer = []  # UTF-8 멀티바이트 버퍼
+        utf8_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')  # UTF-8 멀티바이트 디코더
         scroll_offset = 0  # 스크롤 오프셋 (문자 인덱스)
 
         def get_char_width(char):
@@ -6701,144 +7319,155 @@ class CCCopyTUI:
             else:
                 return 1
 
-        try:
-            while True:
-                # 다이얼로그 영역 지우기
-                for y in range(start_y, start_y + dialog_height):
-                    for x in range(start_x, start_x + dialog_width):
-                        try:
-                            stdscr.addch(y, x, ' ')
-                        except curses.error:
-                            pass
+        blank_line = " " * dialog_width
+        separator_row = start_y + 3 + len(message_lines)
+        help_row = start_y + 3 + len(message_lines) + 2
+
+        def draw_input_frame():
+            """입력 행을 제외한 다이얼로그 틀 그리기 (테두리, 제목, 메시지, 도움말)"""
+            # 다이얼로그 영역 지우기 (행 단위로 공백 문자열 한 번에 출력)
+            for y in range(start_y, start_y + dialog_height):
+                try:
+                    stdscr.addstr(y, start_x, blank_line)
+                except curses.error:
+                    pass
+
+            # 다이얼로그 배경
+            stdscr.addstr(start_y, start_x, "┌" + "─" * (dialog_width - 2) + "┐")
+
+            # 제목 중앙 정렬 (한글 폭 고려)
+            title_line = self.create_dialog_line(title, dialog_width, 'center')
+            stdscr.addstr(start_y + 1, start_x, title_line)
+            stdscr.addstr(start_y + 2, start_x, "├" + "─" * (dialog_width - 2) + "┤")
+
+            # 메시지 표시 (한글 폭 고려)
+            for i, line in enumerate(message_lines):
+                line_padded = self.create_dialog_line(line, dialog_width, 'left')
+                stdscr.addstr(start_y + 3 + i, start_x, line_padded)
+
+            # 입력 필드 구분선
+            stdscr.addstr(separator_row, start_x, "├" + "─" * (dialog_width - 2) + "┤")
 
-                # 다이얼로그 배경
-                stdscr.addstr(start_y, start_x, "┌" + "─" * (dialog_width - 2) + "┐")
+            # 하단 경계 및 도움말
+            stdscr.addstr(help_row, start_x, "├" + "─" * (dialog_width - 2) + "┤")
 
-                # 제목 중앙 정렬 (한글 폭 고려)
-                title_line = self.create_dialog_line(title, dialog_width, 'center')
-                stdscr.addstr(start_y + 1, start_x, title_line)
-                stdscr.addstr(start_y + 2, start_x, "├" + "─" * (dialog_width - 2) + "┤")
+            help_text = "Enter: 확인, ESC: 취소"
+            help_line = self.create_dialog_line(help_text, dialog_width, 'center')
+            stdscr.addstr(help_row + 1, start_x, help_line)
 
-                # 메시지 표시 (한글 폭 고려)
-                for i, line in enumerate(message_lines):
-                    line_padded = self.create_dialog_line(line, dialog_width, 'left')
-                    stdscr.addstr(start_y + 3 + i, start_x, line_padded)
+            stdscr.addstr(help_row + 2, start_x, "└" + "─" * (dialog_width - 2) + "┘")
 
-                # 입력 필드 구분선
-                separator_row = start_y + 3 + len(message_lines)
-                stdscr.addstr(separator_row, start_x, "├" + "─" * (dialog_width - 2) + "┤")
+        # 틀은 처음과 화면 크기 변경 시에만 그리고, 키 입력마다 입력 행만 다시 그림
+        frame_dirty = True
+
+        # 입력 위치는 반전 블록 대신 터미널 커서로 표시 (루프 밖에서 한 번만 켬)
+        try:
+            curses.curs_set(1)
+        except curses.error:
+            pass
+
+        try:
+            while True:
+                if frame_dirty:
+                    draw_input_frame()
+                    frame_dirty = False
 
                 # 입력 필드
                 input_row = start_y + 3 + len(message_lines) + 1
                 input_field_width = dialog_width - 6
 
                 # 스크롤 오프셋 자동 조정 (커서가 항상 보이도록)
-                input_text = ''.join(text)
+                # 앞에서부터 i개 문자의 화면 표시 폭 (prefix_widths[i])
+                prefix_widths = [0]
+                prefix_widths.extend(accumulate(1 if char < '\x80' else _char_display_width(char) for char in text))
 
                 # 커서 위치의 화면 표시 폭 계산
-                cursor_display_pos = self.get_display_width(input_text[:cursor_pos])
-                scroll_display_pos = self.get_display_width(input_text[:scroll_offset])
+                cursor_display_pos = prefix_widths[cursor_pos]
+                scroll_display_pos = prefix_widths[scroll_offset]
 
                 # 커서가 화면 오른쪽을 벗어나면 스크롤 오른쪽으로
                 visible_width = input_field_width - 2  # "> " 제외
                 if cursor_display_pos - scroll_display_pos >= visible_width:
                     # 커서가 보이도록 스크롤 오프셋 증가
-                    while scroll_offset < len(text) and cursor_display_pos - self.get_display_width(input_text[:scroll_offset]) >= visible_width:
-                        scroll_offset += 1
+                    # (커서까지의 폭이 visible_width 미만이 되는 첫 위치를 이진 탐색)
+                    scroll_offset = min(len(text), bisect_right(prefix_widths, cursor_display_pos - visible_width))
 
                 # 커서가 화면 왼쪽을 벗어나면 스크롤 왼쪽으로
                 if cursor_display_pos < scroll_display_pos:
                     scroll_offset = cursor_pos
 
                 # 스크롤된 텍스트 표시 (한글 폭 고려)
-                scrolled_text = input_text[scroll_offset:]
-                display_text = self.truncate_text(scrolled_text, visible_width)
-
-                # 입력 필드 직접 그리기 (create_dialog_line 사용하지 않음)
-                # 왼쪽 경계
-                stdscr.addstr(input_row, start_x, "│ ")
-                # 프롬프트와 입력 텍스트
-                stdscr.addstr(input_row, start_x + 2, "> ")
-                stdscr.addstr(input_row, start_x + 4, display_text)
-                # 나머지 공백 채우기
-                text_display_width = self.get_display_width(display_text)
-                remaining_width = dialog_width - 6 - text_display_width  # "│ > " + "│" 제외
-                if remaining_width > 0:
-                    stdscr.addstr(input_row, start_x + 4 + text_display_width, " " * remaining_width)
-                # 오른쪽 경계
-                stdscr.addstr(input_row, start_x + dialog_width - 2, " │")
+                # 전체 문자열을 만들지 않고 화면에 들어가는 구간만 join
+                scroll_display_width = prefix_widths[scroll_offset]
+                display_end = max(scroll_offset, bisect_right(prefix_widths, scroll_display_width + visible_width) - 1)
+                display_text = ''.join(text[scroll_offset:display_end])
+
+                # 입력 행만 한 번의 addstr로 다시 그림 (create_dialog_line 사용하지 않음)
+                # "│ > " + 입력 텍스트 + 나머지 공백 + " │"
+                text_display_width = prefix_widths[display_end] - scroll_display_width
+                remaining_width = max(0, dialog_width - 6 - text_display_width)
+                stdscr.addstr(input_row, start_x, "│ > " + display_text + _SPACES[:remaining_width] + " │")
 
                 # 커서 위치 계산 (스크롤 고려)
-                scroll_display_width = self.get_display_width(input_text[:scroll_offset])
                 cursor_relative_pos = cursor_display_pos - scroll_display_width
                 cursor_x = start_x + 4 + cursor_relative_pos  # "│ > " 고려
                 cursor_y = input_row
 
-                # 하단 경계 및 도움말
-                help_row = start_y + 3 + len(message_lines) + 2
-                stdscr.addstr(help_row, start_x, "├" + "─" * (dialog_width - 2) + "┤")
-
-                help_text = "Enter: 확인, ESC: 취소"
-                help_line = self.create_dialog_line(help_text, dialog_width, 'center')
-                stdscr.addstr(help_row + 1, start_x, help_line)
-
-                stdscr.addstr(help_row + 2, start_x, "└" + "─" * (dialog_width - 2) + "┘")
-
-                # 화면 업데이트 및 커서 위치 설정
-                stdscr.refresh()
+                # 커서를 입력 위치로 옮긴 뒤 한 번만 화면 업데이트
                 try:
                     max_y, max_x = stdscr.getmaxyx()
                     if 0 <= cursor_y < max_y and 0 <= cursor_x < max_x:
                         stdscr.move(cursor_y, cursor_x)
-                        curses.curs_set(1)
-                        stdscr.refresh()
                 except curses.error:
                     pass
+                stdscr.refresh()
 
-                # 키 입력 처리
-                key = stdscr.getch()
-
-                if key == 10 or key == 13:  # Enter
-                    result = ''.join(text)
-                    break
-                elif key == 27:  # ESC
-                    result = None
-                    break
-                elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
-                    if cursor_pos > 0:
-                        text.pop(cursor_pos - 1)
-                        cursor_pos -= 1
-                elif key == curses.KEY_DC:  # Delete 키
-                    if cursor_pos < len(text):
-                        text.pop(cursor_pos)
-                elif key == curses.KEY_LEFT:
-                    cursor_pos = max(0, cursor_pos - 1)
-                elif key == curses.KEY_RIGHT:
-                    cursor_pos = min(len(text), cursor_pos + 1)
-                elif key == curses.KEY_HOME:
-                    cursor_pos = 0
-                elif key == curses.KEY_END:
-                    cursor_pos = len(text)
-                elif key >= 32:  # 모든 인쇄 가능한 문자 (한글 포함)
-                    # UTF-8 멀티바이트 처리
-                    if key >= 128:  # 멀티바이트 문자
-                        multibyte_buffer.append(key)
-                        try:
-                            # 바이트 배열을 UTF-8로 디코딩 시도
-                            char_bytes = bytes(multibyte_buffer)
-                            char = char_bytes.decode('utf-8')
-                            # 성공하면 문자 삽입
+                # 키 입력 처리 (붙여넣기처럼 연달아 들어온 키는 모두 처리한 뒤 한 번만 그림)
+                done = False
+                for key in self.read_pending_keys(stdscr):
+                    if key == 10 or key == 13:  # Enter
+                        result = ''.join(text)
+                        done = True
+                        break
+                    elif key == 27:  # ESC
+                        result = None
+                        done = True
+                        break
+                    elif key == curses.KEY_RESIZE:
+                        frame_dirty = True
+                    elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
+                        if cursor_pos > 0:
+                            text.pop(cursor_pos - 1)
+                            cursor_pos -= 1
+                    elif key == curses.KEY_DC:  # Delete 키
+                        if cursor_pos < len(text):
+                            text.pop(cursor_pos)
+                    elif key == curses.KEY_LEFT:
+                        cursor_pos = max(0, cursor_pos - 1)
+                    elif key == curses.KEY_RIGHT:
+                        cursor_pos = min(len(text), cursor_pos + 1)
+                    elif key == curses.KEY_HOME:
+                        cursor_pos = 0
+                    elif key == curses.KEY_END:
+                        cursor_pos = len(text)
+                    elif key >= 32:  # 모든 인쇄 가능한 문자 (한글 포함)
+                        # UTF-8 멀티바이트 처리
+                        if key >= 128:  # 멀티바이트 문자
+                            if key > 0xFF:
+                                # 바이트가 아닌 특수 키 코드는 무시
+                                continue
+                            # 바이트 단위로 디코딩 (불완전한 시퀀스면 빈 문자열 반환)
+                            char = utf8_decoder.decode(bytes((key,)))
+                            if char:
+                                text.insert(cursor_pos, char)
+                                cursor_pos += 1
+                        else:  # ASCII 문자
+                            utf8_decoder.reset()  # 디코더 상태 초기화
+                            char = chr(key)
                             text.insert(cursor_pos, char)
                             cursor_pos += 1
-                            multibyte_buffer = []
-                        except UnicodeDecodeError:
-                            # 아직 불완전한 멀티바이트 시퀀스
-                            continue
-                    else:  # ASCII 문자
-                        multibyte_buffer = []  # 버퍼 초기화
-                        char = chr(key)
-                        text.insert(cursor_pos, char)
-                        cursor_pos += 1
+                if done:
+                    break
 
             # 커서 상태 복원
             try:
@@ -6856,19 +7485,43 @@ class CCCopyTUI:
                 pass
             return None
 
+    def read_pending_keys(self, stdscr):
+        """키 입력 하나를 기다린 뒤 이미 입력 버퍼에 쌓여 있는 키들을 함께 반환
+
+        Returns:
+            list: 입력된 키 코드 목록 (타임아웃이면 빈 리스트)
+        """
+        key = stdscr.getch()
+        if key == -1:
+            return []
+
+        keys = [key]
+        stdscr.timeout(0)
+        try:
+            while True:
+                key = stdscr.getch()
+                if key == -1:
+                    break
+                keys.append(key)
+        finally:
+            stdscr.timeout(GETCH_TIMEOUT_MS)
+        return keys
+
     def show_choice_dialog(self, message, choices):
         """선택 다이얼로그 (한글 폭 처리 적용, 스크롤 지원)"""
         if not hasattr(self, 'stdscr') or not self.stdscr:
             return -1
 
         stdscr = self.stdscr
+        # 다이얼로그를 stdscr에 직접 그리므로 닫힌 뒤 메인 화면의 모든 행을 다시 출력
+        self.invalidate_screen_buffer()
         height, width = stdscr.getmaxyx()
 
         # 메시지를 줄 단위로 분할
         message_lines = message.split('\n')
 
         # 다이얼로그 크기 계산 (한글 폭 고려)
-        max_message_width = max(self.get_display_width(line) for line in message_lines) if message_lines else 0
+        max_message_width = self.get_max_line_width(message, message_lines)
         max_choice_width = max(self.get_display_width(choice) for choice in choices) if choices else 0
         help_text = "↑↓: 선택, Enter: 확인, ESC: 취소"
         help_width = self.get_display_width(help_text)
@@ -6885,8 +7538,31 @@ class CCCopyTUI:
         start_y = max(0, (height - dialog_height) // 2)
         start_x = max(0, (width - dialog_width) // 2)
 
+        # 선택 항목 색상은 다이얼로그 진입 시 한 번만 조회
+        selected_color = getattr(self, 'colors', {}).get('selected', curses.A_REVERSE)
+
         selected_index = 0
         scroll_offset = 0
+        needs_full_redraw = True
+        last_selected_index = -1
+        last_scroll_offset = -1
+
+        # 선택지 라인들을 미리 계산 (한 번만)
+        choice_lines = []
+        content_width = dialog_width - 4  # "│ " + " │" 제외
+        for choice in choices:
+            lines = []
+            for prefix in ("   ", " ▶ "):
+                choice_truncated, suffix = self.fit_text(choice, content_width - len(prefix))
+                lines.append("│ " + prefix + choice_truncated + suffix + " │")
+            choice_lines.append((lines[0], lines[1]))
+
+        # 테두리/빈 줄 문자열은 한 번만 생성
+        top_border = "┌" + "─" * (dialog_width - 2) + "┐"
+        mid_separator = "├" + "─" * (dialog_width - 2) + "┤"
+        bottom_border = "└" + "─" * (dialog_width - 2) + "┘"
+        empty_line = "│" + " " * (dialog_width - 2) + "│"
+        separator_row = start_y + 1 + len(message_lines)
 
         while True:
             try:
@@ -6896,62 +7572,74 @@ class CCCopyTUI:
                 elif selected_index >= scroll_offset + visible_choices:
                     scroll_offset = selected_index - visible_choices + 1
 
-                # 상단 테두리
-                stdscr.addstr(start_y, start_x, "┌" + "─" * (dialog_width - 2) + "┐")
-
-                # 메시지 표시 (한글 안전 방식)
-                for i, line in enumerate(message_lines):
-                    row = start_y + 1 + i
-                    dialog_line = self.create_dialog_line(line, dialog_width, 'left')
-                    stdscr.addstr(row, start_x, dialog_line)
-
-                # 구분선
-                separator_row = start_y + 1 + len(message_lines)
-                stdscr.addstr(separator_row, start_x, "├" + "─" * (dialog_width - 2) + "┤")
-
-                # 선택지들 (스크롤 적용, 한글 안전 방식)
-                for display_idx in range(visible_choices):
-                    choice_idx = scroll_offset + display_idx
-                    row = separator_row + 1 + display_idx
-
-                    if choice_idx < len(choices):
-                        choice = choices[choice_idx]
-                        if choice_idx == selected_index:
-                            prefix = " ▶ "
-                            color = getattr(self, 'colors', {}).get('selected', curses.A_REVERSE)
-                        else:
-                            prefix = "   "
-                            color = None
+                # 전체 재그리기 또는 스크롤 변경
+                changed = True
+                if needs_full_redraw or last_scroll_offset != scroll_offset:
+                    # 상단 테두리
+                    stdscr.addstr(start_y, start_x, top_border)
+
+                    # 메시지 표시 (한글 안전 방식)
+                    for i, line in enumerate(message_lines):
+                        row = start_y + 1 + i
+                        dialog_line = self.create_dialog_line(line, dialog_width, 'left')
+                        stdscr.addstr(row, start_x, dialog_line)
 
-                        content_width = dialog_width - 4  # "│ " + " │" 제외
-                        available_width = content_width - len(prefix)
-                        choice_truncated = self.truncate_text(choice, available_width)
-                        choice_actual_width = self.get_display_width(choice_truncated)
-                        suffix = " " * (available_width - choice_actual_width)
+                    # 구분선
+                    stdscr.addstr(separator_row, start_x, mid_separator)
 
-                        dialog_line = "│ " + prefix + choice_truncated + suffix + " │"
+                    # 선택지들 (스크롤 적용, 미리 계산된 라인 사용)
+                    for display_idx in range(visible_choices):
+                        choice_idx = scroll_offset + display_idx
+                        row = separator_row + 1 + display_idx
 
-                        if color:
-                            stdscr.addstr(row, start_x, dialog_line, color)
+                        if choice_idx < len(choices):
+                            normal_line, selected_line = choice_lines[choice_idx]
+                            if choice_idx == selected_index:
+                                stdscr.addstr(row, start_x, selected_line, selected_color)
+                            else:
+                                stdscr.addstr(row, start_x, normal_line)
                         else:
-                            stdscr.addstr(row, start_x, dialog_line)
-                    else:
-                        # 빈 줄
-                        empty_line = "│" + " " * (dialog_width - 2) + "│"
-                        stdscr.addstr(row, start_x, empty_line)
+                            # 빈 줄
+                            stdscr.addstr(row, start_x, empty_line)
 
-                # 하단 구분선
-                help_row = separator_row + 1 + visible_choices
-                stdscr.addstr(help_row, start_x, "├" + "─" * (dialog_width - 2) + "┤")
+                    # 하단 구분선
+                    help_row = separator_row + 1 + visible_choices
+                    stdscr.addstr(help_row, start_x, mid_separator)
 
-                # 도움말 (한글 안전 중앙 정렬)
-                help_dialog_line = self.create_dialog_line(help_text, dialog_width, 'center')
-                stdscr.addstr(help_row + 1, start_x, help_dialog_line)
+                    # 도움말 (한글 안전 중앙 정렬)
+                    help_dialog_line = self.create_dialog_line(help_text, dialog_width, 'center')
+                    stdscr.addstr(help_row + 1, start_x, help_dialog_line)
 
-                # 하단 테두리
-                stdscr.addstr(help_row + 2, start_x, "└" + "─" * (dialog_width - 2) + "┘")
+                    # 하단 테두리
+                    stdscr.addstr(help_row + 2, start_x, bottom_border)
 
-                stdscr.refresh()
+                    needs_full_redraw = False
+                    last_selected_index = selected_index
+                    last_scroll_offset = scroll_offset
+
+                # 선택 상태만 변경된 경우 (스크롤 없이) - 바뀐 두 줄만 다시 그리기
+                elif last_selected_index != selected_index:
+                    # 이전 선택 항목 언하이라이트
+                    if scroll_offset <= last_selected_index < scroll_offset + visible_choices:
+                        row = separator_row + 1 + last_selected_index - scroll_offset
+                        normal_line, _ = choice_lines[last_selected_index]
+                        stdscr.addstr(row, start_x, normal_line)
+
+                    # 새 선택 항목 하이라이트
+                    if scroll_offset <= selected_index < scroll_offset + visible_choices:
+                        row = separator_row + 1 + selected_index - scroll_offset
+                        _, selected_line = choice_lines[selected_index]
+                        stdscr.addstr(row, start_x, selected_line, selected_color)
+
+                    last_selected_index = selected_index
+
+                else:
+                    changed = False
+
+                # 변경된 행이 있을 때만 화면에 반영
+                if changed:
+                    stdscr.noutrefresh()
+                    curses.doupdate()
 
                 key = stdscr.getch()
 
@@ -6989,6 +7677,8 @@ class CCCopyTUI:
             return
 
         stdscr = self.stdscr
+        # 다이얼로그를 stdscr에 직접 그리므로 닫힌 뒤 메인 화면의 모든 행을 다시 출력
+        self.invalidate_screen_buffer()
         height, width = stdscr.getmaxyx()
 
         # 메시지를 줄 단위로 분할
@@ -6996,7 +7686,7 @@ class CCCopyTUI:
 
         # 다이얼로그 크기 계산 (한글 폭 고려)
         title_width = self.get_display_width(title) + 4
-        max_message_width = max(self.get_display_width(line) for line in message_lines) + 4 if message_lines else 30
+        max_message_width = self.get_max_line_width(message, message_lines) + 4 if message_lines else 30
         dialog_width = min(max(title_width, max_message_width, 30), width - 4)
 
         # 최대 표시 가능한 메시지 라인 수
@@ -7007,45 +7697,68 @@ class CCCopyTUI:
         start_y = max(0, (height - dialog_height) // 2)
         start_x = max(0, (width - dialog_width) // 2)
 
+        # 테두리/빈 줄 문자열은 한 번만 생성
+        top_border = "┌" + "─" * (dialog_width - 2) + "┐"
+        mid_separator = "├" + "─" * (dialog_width - 2) + "┤"
+        bottom_border = "└" + "─" * (dialog_width - 2) + "┘"
+        empty_line = "│" + " " * (dialog_width - 2) + "│"
+
+        # 제목/도움말 줄도 호출마다 변하지 않으므로 루프 밖에서 생성
+        # (스크롤 가능 여부에 따라 도움말 변경)
+        scrollable = len(message_lines) > visible_lines
+        help_msg = "↑↓: 스크롤, Enter: 확인" if scrollable else "Enter: 확인"
+        title_line = self.create_dialog_line(title, dialog_width, 'center')
+        help_line = self.create_dialog_line(help_msg, dialog_width, 'center')
+        max_scroll_offset = max(0, len(message_lines) - visible_lines)
+
         scroll_offset = 0
+        last_scroll_offset = -1
+        frame_drawn = False
 
         while True:
             try:
-                # 다이얼로그 영역 지우기 (배경 겹침 방지)
-                for row in range(start_y, start_y + dialog_height):
-                    if row < height and start_x < width:
-                        clear_line = " " * min(dialog_width, width - start_x)
-                        stdscr.addstr(row, start_x, clear_line)
-
-                # 다이얼로그 배경
-                stdscr.addstr(start_y, start_x, "┌" + "─" * (dialog_width - 2) + "┐")
-                stdscr.addstr(start_y + 1, start_x, self.create_dialog_line(title, dialog_width, 'center'))
-                stdscr.addstr(start_y + 2, start_x, "├" + "─" * (dialog_width - 2) + "┤")
-
-                # 메시지 표시 (스크롤 적용)
-                for display_idx in range(visible_lines):
-                    line_idx = scroll_offset + display_idx
-                    if line_idx < len(message_lines):
-                        line = message_lines[line_idx]
-                        stdscr.addstr(start_y + 3 + display_idx, start_x, self.create_dialog_line(line, dialog_width, 'left'))
-                    else:
-                        # 빈 줄
-                        empty_line = "│" + " " * (dialog_width - 2) + "│"
-                        stdscr.addstr(start_y + 3 + display_idx, start_x, empty_line)
+                # 고정 영역(테두리, 제목, 도움말)은 처음 한 번만 그리기
+                if not frame_drawn:
+                    # 다이얼로그 영역 지우기 (배경 겹침 방지)
+                    # stdscr와 메모리를 공유하는 subwin의 erase()로 행별 addstr 없이 한 번에 지움
+                    clear_rows = min(dialog_height, height - start_y)
+                    clear_cols = min(dialog_width, width - start_x)
+                    if clear_rows > 0 and clear_cols > 0:
+                        stdscr.subwin(clear_rows, clear_cols, start_y, start_x).erase()
+
+                    # 다이얼로그 배경
+                    stdscr.addstr(start_y, start_x, top_border)
+                    stdscr.addstr(start_y + 1, start_x, title_line)
+                    stdscr.addstr(start_y + 2, start_x, mid_separator)
 
-                # 하단 경계 및 도움말
-                help_row = start_y + 3 + visible_lines
-                stdscr.addstr(help_row, start_x, "├" + "─" * (dialog_width - 2) + "┤")
+                    # 하단 경계 및 도움말
+                    help_row = start_y + 3 + visible_lines
+                    stdscr.addstr(help_row, start_x, mid_separator)
+                    stdscr.addstr(help_row + 1, start_x, help_line)
+                    stdscr.addstr(help_row + 2, start_x, bottom_border)
+
+                    # 메시지 영역은 pad에 한 번만 그리고, 스크롤 시에는 pad의 보이는 위치만 변경
+                    # (오른쪽 아래 마지막 칸 쓰기 오류를 피하기 위해 1칸씩 여유를 둠)
+                    pad_rows = max(len(message_lines), visible_lines)
+                    message_pad = curses.newpad(pad_rows + 1, dialog_width + 1)
+                    for line_idx in range(pad_rows):
+                        if line_idx < len(message_lines):
+                            message_pad.addstr(line_idx, 0, self.create_dialog_line(message_lines[line_idx], dialog_width, 'left'))
+                        else:
+                            # 빈 줄
+                            message_pad.addstr(line_idx, 0, empty_line)
+                    view_top = start_y + 3
+                    view_bottom = min(start_y + 2 + visible_lines, height - 1)
+                    view_right = min(start_x + dialog_width, width) - 1
 
-                # 스크롤 가능 여부에 따라 도움말 변경
-                if len(message_lines) > visible_lines:
-                    help_msg = "↑↓: 스크롤, Enter: 확인"
-                else:
-                    help_msg = "Enter: 확인"
-                stdscr.addstr(help_row + 1, start_x, self.create_dialog_line(help_msg, dialog_width, 'center'))
-                stdscr.addstr(help_row + 2, start_x, "└" + "─" * (dialog_width - 2) + "┘")
+                    stdscr.noutrefresh()
+                    frame_drawn = True
 
-                stdscr.refresh()
+                # 메시지 영역은 스크롤 위치가 바뀐 경우에만 pad에서 다시 출력
+                if scroll_offset != last_scroll_offset:
+                    message_pad.noutrefresh(scroll_offset, 0, view_top, start_x, view_bottom, view_right)
+                    curses.doupdate()
+                    last_scroll_offset = scroll_offset
 
                 key = stdscr.getch()
 
@@ -7053,20 +7766,24 @@ class CCCopyTUI:
                     break
                 elif key == curses.KEY_UP and scroll_offset > 0:
                     scroll_offset -= 1
-                elif key == curses.KEY_DOWN and scroll_offset < len(message_lines) - visible_lines:
+                elif key == curses.KEY_DOWN and scroll_offset < max_scroll_offset:
                     scroll_offset += 1
                 elif key == curses.KEY_PPAGE:  # Page Up
                     scroll_offset = max(0, scroll_offset - visible_lines)
                 elif key == curses.KEY_NPAGE:  # Page Down
-                    scroll_offset = min(len(message_lines) - visible_lines, scroll_offset + visible_lines)
+                    scroll_offset = min(max_scroll_offset, scroll_offset + visible_lines)
                 elif key == curses.KEY_HOME:
                     scroll_offset = 0
                 elif key == curses.KEY_END:
-                    scroll_offset = max(0, len(message_lines) - visible_lines)
+                    scroll_offset = max_scroll_offset
 
             except curses.error:
                 break
 
+        # pad로 그린 메시지 영역은 stdscr에 기록되지 않으므로, 다음 refresh에서
+        # stdscr 전체를 다시 출력하여 다이얼로그 흔적을 지우도록 표시
+        stdscr.touchwin()
+
     def show_simple_project_management(self):
         """텍스트 모드에서 간단한 프로젝트 관리"""
         self.add_log("=== 프로젝트 관리 ===", "INFO")
@@ -7106,8 +7823,19 @@ class CCCopyTUI:
         dialog_y = (height - dialog_height) // 2
         dialog_x = (width - dialog_width) // 2
 
-        # 다이얼로그 창 생성
-        dialog_win = curses.newwin(dialog_height, dialog_width, dialog_y, dialog_x)
+        # 다이얼로그 창 생성 (이전에 만든 창과 크기가 같으면 위치만 옮겨 재사용)
+        dialog_win = self._input_dialog_win
+        if dialog_win is not None and dialog_win.getmaxyx() == (dialog_height, dialog_width):
+            try:
+                dialog_win.mvwin(dialog_y, dialog_x)
+                dialog_win.erase()
+            except curses.error:
+                dialog_win = None
+        else:
+            dialog_win = None
+        if dialog_win is None:
+            dialog_win = curses.newwin(dialog_height, dialog_width, dialog_y, dialog_x)
+            self._input_dialog_win = dialog_win
         dialog_win.box()
 
         # 제목 표시
@@ -7119,68 +7847,76 @@ class CCCopyTUI:
         input_x = 2
         input_width = dialog_width - 4
 
-        # 기본값 설정
-        current_text = default_value
-        cursor_pos = len(current_text)
+        # 도움말 표시 (테두리/제목/도움말은 한 번만 그림)
+        dialog_win.addstr(dialog_height-2, 2, "Enter: 확인  ESC: 취소")
 
-        while True:
-            # 다이얼로그 다시 그리기
-            dialog_win.erase()
-            dialog_win.box()
-            dialog_win.addstr(1, 2, title_text)
+        # 기본값 설정 (키 입력마다 문자열을 다시 만들지 않도록 문자 리스트로 관리)
+        text = list(default_value)
+        cursor_pos = len(text)
 
-            # 입력 필드 그리기
-            display_text = current_text[:input_width-2]
-            dialog_win.addstr(input_y, input_x, display_text)
+        # 커서는 반전 블록 대신 터미널 커서 사용
+        try:
+            old_cursor_state = curses.curs_set(1)
+        except curses.error:
+            old_cursor_state = None
 
-            # 커서 표시
-            if cursor_pos < len(display_text):
-                try:
-                    dialog_win.addch(input_y, input_x + cursor_pos, ord(display_text[cursor_pos]), curses.A_REVERSE)
-                except:
-                    pass
-            else:
+        try:
+            while True:
+                # 입력 필드 행만 다시 그리기
+                display_text = ''.join(text[:input_width-2])
+                dialog_win.move(input_y, input_x)
+                dialog_win.clrtoeol()
+                dialog_win.addstr(input_y, input_x, display_text)
+                dialog_win.addch(input_y, dialog_width - 1, curses.ACS_VLINE)  # clrtoeol로 지워진 오른쪽 테두리 복구
+
+                # 커서 위치 이동
                 try:
-                    dialog_win.addch(input_y, input_x + len(display_text), ord(' '), curses.A_REVERSE)
-                except:
+                    dialog_win.move(input_y, input_x + min(cursor_pos, len(display_text)))
+                except curses.error:
                     pass
 
-            # 도움말 표시
-            dialog_win.addstr(dialog_height-2, 2, "Enter: 확인  ESC: 취소")
-
-            dialog_win.refresh()
+                dialog_win.refresh()
 
-            # 키 입력 처리
-            key = dialog_win.getch()
+                # 키 입력 처리
+                key = dialog_win.getch()
 
-            if key == 27:  # ESC
-                return None
-            elif key in [10, 13]:  # Enter
-                return current_text
-            elif key == curses.KEY_BACKSPACE or key == 8 or key == 127:
-                if cursor_pos > 0:
-                    current_text = current_text[:cursor_pos-1] + current_text[cursor_pos:]
-                    cursor_pos -= 1
-            elif key == curses.KEY_LEFT:
-                cursor_pos = max(0, cursor_pos - 1)
-            elif key == curses.KEY_RIGHT:
-                cursor_pos = min(len(current_text), cursor_pos + 1)
-            elif key == curses.KEY_HOME:
-                cursor_pos = 0
-            elif key == curses.KEY_END:
-                cursor_pos = len(current_text)
-            elif 32 <= key <= 126:  # 인쇄 가능한 ASCII 문자
-                current_text = current_text[:cursor_pos] + chr(key) + current_text[cursor_pos:]
-                cursor_pos += 1
+                if key == 27:  # ESC
+                    return None
+                elif key in [10, 13]:  # Enter
+                    return ''.join(text)
+                elif key == curses.KEY_BACKSPACE or key == 8 or key == 127:
+                    if cursor_pos > 0:
+                        del text[cursor_pos - 1]
+                        cursor_pos -= 1
+                elif key == curses.KEY_LEFT:
+                    cursor_pos = max(0, cursor_pos - 1)
+                elif key == curses.KEY_RIGHT:
+                    cursor_pos = min(len(text), cursor_pos + 1)
+                elif key == curses.KEY_HOME:
+                    cursor_pos = 0
+                elif key == curses.KEY_END:
+                    cursor_pos = len(text)
+                elif 32 <= key <= 126:  # 인쇄 가능한 ASCII 문자
+                    text.insert(cursor_pos, chr(key))
+                    cursor_pos += 1
+        finally:
+            if old_cursor_state is not None:
+                try:
+                    curses.curs_set(old_cursor_state)
+                except curses.error:
+                    pass
 
     def show_file_list(self):
         """파일 목록 표시 (텍스트 모드용)"""
-        print(f"\n=== {self.mode.value} 파일 목록 ===")
+        # 줄마다 print하지 않고 모아서 한 번에 출력 (느린 터미널에서 출력 횟수 최소화)
+        lines = [f"\n=== {self.mode.value} 파일 목록 ==="]
 
         if not self.tree.flat_nodes:
-            print("파일이 없습니다.")
+            lines.append("파일이 없습니다.")
+            print("\n".join(lines), flush=True)
             return
 
+        reset = self.ansi_colors.get('reset', '')
         for i, node in enumerate(self.tree.flat_nodes[:20]):  # 최대 20개만 표시
             depth = self.tree.get_depth(node)
             prefix = "  " * depth
@@ -7189,20 +7925,19 @@ class CCCopyTUI:
                 expand_symbol = "[-]" if node.expanded else "[+]"
                 # 디렉토리는 파란색 + 볼드로 표시
                 color = self.get_ansi_color_for_folder()
-                reset = self.ansi_colors.get('reset', '') if hasattr(self, 'ansi_colors') else ''
-                print(f"{i+1:3}. {prefix}{color}{node.name}/{reset} {expand_symbol}")
+                lines.append(f"{i+1:3}. {prefix}{color}{node.name}/{reset} {expand_symbol}")
             else:
                 state_symbol = self.get_state_symbol(node.state)
                 size_text = self.format_size(node.size)
                 # 파일 상태에 따른 색상 적용
                 color = self.get_ansi_color_for_state(node.state)
-                reset = self.ansi_colors.get('reset', '') if hasattr(self, 'ansi_colors') else ''
-                print(f"{i+1:3}. {prefix}{color}{node.name} [{state_symbol}]{reset} {size_text}")
+                lines.append(f"{i+1:3}. {prefix}{color}{node.name} [{state_symbol}]{reset} {size_text}")
 
         if len(self.tree.flat_nodes) > 20:
-            print(f"... 외 {len(self.tree.flat_nodes) - 20}개 더")
+            lines.append(f"... 외 {len(self.tree.flat_nodes) - 20}개 더")
 
-        print(f"\n총 {len(self.tree.flat_nodes)}개 항목")
+        lines.append(f"\n총 {len(self.tree.flat_nodes)}개 항목")
+        print("\n".join(lines), flush=True)
 
     def open_app_viewer(self):
         """App 목록 화면 열기"""
@@ -7217,11 +7952,34 @@ class CCCopyTUI:
             self.app_viewer_mode = True
             self.app_selected_index = 0
             self.app_scroll_offset = 0
+            self._app_layout_width = -1  # 앱 목록이 바뀌었으므로 표시 문자열 캐시 무효화
+            self._prev_app_selected = -1
+            self._prev_app_scroll = -1
             self.add_log(f"앱 목록 로드 완료 ({len(self.app_list)}개)", "INFO")
             self.needs_redraw = True
         except Exception as e:
             self.add_log(f"앱 목록 로드 실패: {str(e)}", "ERROR")
 
+    def drain_app_viewer_keys(self, stdscr):
+        """입력 버퍼에 이미 쌓여 있는 App 뷰어 이동 키를 기다리지 않고 모두 처리
+
+        이동 키가 아닌 키를 만나면 ungetch로 되돌려 메인 루프에서 처리하도록 함
+        """
+        nav_keys = (curses.KEY_UP, curses.KEY_DOWN, curses.KEY_HOME,
+                    curses.KEY_END, curses.KEY_PPAGE, curses.KEY_NPAGE)
+        stdscr.timeout(0)
+        try:
+            while True:
+                key = stdscr.getch()
+                if key == -1:
+                    break
+                if key not in nav_keys:
+                    curses.ungetch(key)
+                    break
+                self.handle_app_viewer_key(key)
+        finally:
+            stdscr.timeout(GETCH_TIMEOUT_MS)
+
     def handle_app_viewer_key(self, key):
         """App 뷰어 키 입력 처리"""
         if key == curses.KEY_UP:
@@ -7270,56 +8028,162 @@ class CCCopyTUI:
 
         self.needs_redraw = True
 
+    def _build_app_row_text(self, app, width):
+        """App 뷰어 한 줄의 텍스트 영역 문자열 생성 (이름 + 설명, 화면 너비에 맞게 자르고 패딩)"""
+        name = app['name']
+        description = app['description']
+
+        # 한글 폭을 고려한 이름 처리
+        name_width = 20
+        name_display_width = self.get_display_width(name)
+
+        if name_display_width > name_width:
+            # 잘라야 함 (누적 너비 이진 탐색)
+            name = self.truncate_text(name, name_width - 2) + ".."
+            name_display_width = self.get_display_width(name)
+
+        # 이름 뒤에 공백 추가 (실제 표시 폭 기준)
+        name_padding = name_width - name_display_width
+        name_with_padding = name + (' ' * name_padding)
+
+        # 설명 영역 크기 계산 (한글 폭 고려)
+        inner_width = width - 2  # 양쪽 │ 제외
+        available_desc_width = inner_width - 1 - name_width  # 공백 1개 제외
+
+        if available_desc_width > 0:
+            desc_display_width = self.get_display_width(description)
+            if desc_display_width > available_desc_width:
+                # 설명 잘라야 함 (누적 너비 이진 탐색)
+                description = self.truncate_text(description, available_desc_width - 3) + "..."
+        else:
+            description = ""
+
+        line_text = name_with_padding + description
+
+        # 전체 라인 구성: │ + 공백 + 텍스트 + 공백 + │
+        # 총 width 길이를 맞춰야 함
+        content_width = width - 2  # 양쪽 │ 제외
+
+        # 텍스트 + 나머지 공백 (한글 폭 고려, 양쪽 "│ " / "│" 제외)
+        return self.format_text_with_korean_padding(line_text, content_width - 1, 'left')
+
+    def _adjust_app_scroll(self, visible_lines):
+        """선택 항목이 보이도록 App 뷰어 스크롤 위치 보정"""
+        if len(self.app_list) > visible_lines:
+            max_scroll_offset = len(self.app_list) - visible_lines
+            self.app_scroll_offset = min(self.app_scroll_offset, max_scroll_offset)
+            self.app_scroll_offset = max(0, self.app_scroll_offset)
+
+            if self.app_selected_index < self.app_scroll_offset:
+                self.app_scroll_offset = self.app_selected_index
+            elif self.app_selected_index >= self.app_scroll_offset + visible_lines:
+                self.app_scroll_offset = self.app_selected_index - visible_lines + 1
+        else:
+            self.app_scroll_offset = 0
+
+    def _draw_app_row(self, stdscr, row, app_index, width):
+        """App 뷰어 목록의 한 행 출력"""
+        try:
+            if app_index < len(self.app_list):
+                padded_text = self._app_rendered_rows[app_index]
+
+                if app_index == self.app_selected_index:
+                    color = getattr(self, 'colors', {}).get('selected', curses.A_REVERSE)
+                    # 테두리와 첫 공백은 일반 색상, 텍스트 영역만 하이라이트
+                    stdscr.addstr(row, 0, "│ ")
+                    stdscr.addstr(row, 2, padded_text, color)
+                    stdscr.addstr(row, width - 1, "│")
+                else:
+                    # 일반 출력
+                    stdscr.addstr(row, 0, "│ " + padded_text + "│")
+            else:
+                # 빈 줄: │ + 공백 + │
+                stdscr.addstr(row, 0, "│" + _SPACES[:width - 2] + "│")
+        except curses.error:
+            pass
+
+    def _get_app_frame(self, width):
+        """App 뷰어 테두리/헤더/도움말 문자열 (화면 너비별 캐시)
+
+        Returns:
+            (top, header, separator, help_parts, help_tail, bottom) 튜플
+            help_parts는 (col, text, is_key) 목록
+        """
+        cache = self._app_frame_cache
+        if cache is not None and cache[0] == width:
+            return cache[1]
+
+        horizontal = "─" * (width - 2)
+
+        # Header: "이름"(2글자=4칸) + 공백으로 20칸 맞추기 + "설명"
+        name_header = "이름"
+        desc_header = "설명"
+        name_width = 20
+        name_header_padding = name_width - self.get_display_width(name_header)
+        header_text = name_header + " " * name_header_padding + desc_header
+
+        # Help 라인: [ ] 안의 텍스트는 노란색, 나머지는 일반 텍스트 - 구간 단위로 출력
+        help_text = "[Enter]Run [ESC]Exit"
+        help_parts = []
+        col = 2
+        for part in re.split(r'(\[[^\]]*\])', help_text):
+            part = part[:max(0, width - 1 - col)]
+            if not part:
+                continue
+            help_parts.append((col, part, part.startswith('[') and part.endswith(']')))
+            col += len(part)
+
+        frame = (
+            "┌" + horizontal + "┐",
+            "│ " + self.format_text_with_korean_padding(header_text, width - 3, 'left') + "│",
+            "├" + horizontal + "┤",
+            help_parts,
+            (col, " " * (width - 1 - col) + "│"),
+            "└" + horizontal + "┘",
+        )
+        self._app_frame_cache = (width, frame)
+        return frame
+
     def draw_app_viewer(self, stdscr):
         """App 뷰어 화면 그리기"""
         height, width = stdscr.getmaxyx()
 
+        # 화면 크기가 그대로면 헤더/테두리/도움말은 ScreenBuffer의 이전 프레임을 재사용하고
+        # 목록 영역만 다시 그림 (스크롤 위치도 같으면 선택이 바뀐 두 행만)
+        app_start_row = 3
+        visible_lines = height - 3 - app_start_row
+        self._adjust_app_scroll(visible_lines)
+        if (self._prev_app_selected >= 0
+                and self._prev_app_size == (height, width)
+                and self._app_layout_width == width
+                and hasattr(stdscr, 'clear_row')
+                and stdscr.reuse_previous_frame()):
+            if self._prev_app_scroll == self.app_scroll_offset:
+                changed_indices = {self._prev_app_selected, self.app_selected_index}
+            else:
+                changed_indices = range(self.app_scroll_offset, self.app_scroll_offset + visible_lines)
+            for app_index in changed_indices:
+                if self.app_scroll_offset <= app_index < self.app_scroll_offset + visible_lines:
+                    row = app_start_row + app_index - self.app_scroll_offset
+                    stdscr.clear_row(row)
+                    self._draw_app_row(stdscr, row, app_index, width)
+            self._prev_app_selected = self.app_selected_index
+            self._prev_app_scroll = self.app_scroll_offset
+            return
+
+        resized = False
         for attempt in range(2):
             try:
-                stdscr.addstr(0, 0, "┌" + "─" * (width - 2) + "┐")
-
-                # Header: "이름"(2글자=4칸) + 공백으로 20칸 맞추기 + "설명"
-                name_header = "이름"
-                desc_header = "설명"
-                name_width = 20
-
-                # 이름 헤더의 실제 표시 폭 계산
-                name_header_display_width = self.get_display_width(name_header)
-                name_header_padding = name_width - name_header_display_width
-
-                # Header 라인 직접 출력
-                stdscr.addch(1, 0, '│')
-                stdscr.addch(1, 1, ' ')
-                col = 2
-                # "이름" 출력
-                for ch in name_header:
-                    stdscr.addch(1, col, ch)
-                    ch_width = 2 if ord(ch) >= 0xAC00 and ord(ch) <= 0xD7AF else 1
-                    col += ch_width
-                # 이름 영역 패딩
-                for _ in range(name_header_padding):
-                    stdscr.addch(1, col, ' ')
-                    col += 1
-                # "설명" 출력
-                for ch in desc_header:
-                    stdscr.addch(1, col, ch)
-                    ch_width = 2 if ord(ch) >= 0xAC00 and ord(ch) <= 0xD7AF else 1
-                    col += ch_width
-                # 나머지 공백
-                while col < width - 1:
-                    stdscr.addch(1, col, ' ')
-                    col += 1
-                # 오른쪽 │
-                stdscr.addch(1, width - 1, '│')
-
-                stdscr.move(2, 0)
-                for col in range(width):
-                    stdscr.addch(2, col, ' ')
-                stdscr.addstr(2, 0, "├" + "─" * (width - 2) + "┤")
+                top_frame, header_line, separator, help_parts, help_tail, bottom_frame = self._get_app_frame(width)
+                stdscr.addstr(0, 0, top_frame)
+                stdscr.addstr(1, 0, header_line)
+                stdscr.addstr(2, 0, separator)
                 break
             except curses.error:
                 if attempt == 0:
                     height, width = stdscr.getmaxyx()
+                    visible_lines = height - 3 - app_start_row
+                    resized = True
                     if height < 3 or width < 10:
                         break
                 else:
@@ -7329,185 +8193,50 @@ class CCCopyTUI:
                     except curses.error:
                         pass
 
-        app_start_row = 3
-        app_end_row = height - 3
-        visible_lines = app_end_row - app_start_row
-
-        if len(self.app_list) > visible_lines:
-            max_scroll_offset = len(self.app_list) - visible_lines
-            self.app_scroll_offset = min(self.app_scroll_offset, max_scroll_offset)
-            self.app_scroll_offset = max(0, self.app_scroll_offset)
+        # 앱 이름/설명은 변하지 않으므로 화면 너비가 바뀐 경우에만 표시 문자열을 다시 생성
+        if self._app_layout_width != width or len(self._app_rendered_rows) != len(self.app_list):
+            self._app_rendered_rows = [self._build_app_row_text(app, width) for app in self.app_list]
+            self._app_layout_width = width
 
-            if self.app_selected_index < self.app_scroll_offset:
-                self.app_scroll_offset = self.app_selected_index
-            elif self.app_selected_index >= self.app_scroll_offset + visible_lines:
-                self.app_scroll_offset = self.app_selected_index - visible_lines + 1
-        else:
-            self.app_scroll_offset = 0
+        if resized:
+            # 그리는 도중 화면 크기가 바뀐 경우에만 스크롤 위치 재보정 (위에서 이미 보정됨)
+            self._adjust_app_scroll(visible_lines)
 
         for i in range(visible_lines):
-            row = app_start_row + i
-            app_index = self.app_scroll_offset + i
-
-            try:
-                if app_index < len(self.app_list):
-                    app = self.app_list[app_index]
-                    name = app['name']
-                    description = app['description']
-
-                    # 한글 폭을 고려한 이름 처리
-                    name_width = 20
-                    name_display_width = self.get_display_width(name)
-
-                    if name_display_width > name_width:
-                        # 잘라야 함
-                        truncated_name = ""
-                        current_width = 0
-                        for ch in name:
-                            ch_width = 2 if ord(ch) >= 0xAC00 and ord(ch) <= 0xD7AF else 1
-                            if current_width + ch_width <= name_width - 2:
-                                truncated_name += ch
-                                current_width += ch_width
-                            else:
-                                break
-                        name = truncated_name + ".."
-                        name_display_width = self.get_display_width(name)
-
-                    # 이름 뒤에 공백 추가 (실제 표시 폭 기준)
-                    name_padding = name_width - name_display_width
-                    name_with_padding = name + (' ' * name_padding)
-
-                    # 설명 영역 크기 계산 (한글 폭 고려)
-                    inner_width = width - 2  # 양쪽 │ 제외
-                    available_desc_width = inner_width - 1 - name_width  # 공백 1개 제외
-
-                    if available_desc_width > 0:
-                        desc_display_width = self.get_display_width(description)
-                        if desc_display_width > available_desc_width:
-                            # 설명 잘라야 함
-                            truncated_desc = ""
-                            current_width = 0
-                            for ch in description:
-                                ch_width = 2 if ord(ch) >= 0xAC00 and ord(ch) <= 0xD7AF else 1
-                                if current_width + ch_width <= available_desc_width - 3:
-                                    truncated_desc += ch
-                                    current_width += ch_width
-                                else:
-                                    break
-                            description = truncated_desc + "..."
-                    else:
-                        description = ""
-
-                    line_text = name_with_padding + description
-
-                    # 전체 라인 구성: │ + 공백 + 텍스트 + 공백 + │
-                    # 총 width 길이를 맞춰야 함
-                    content_width = width - 2  # 양쪽 │ 제외
-
-                    if app_index == self.app_selected_index:
-                        color = getattr(self, 'colors', {}).get('selected', curses.A_REVERSE)
-                        # 첫 번째 '│'는 일반 색상
-                        stdscr.addch(row, 0, '│')
-                        # 공백 1개
-                        stdscr.addch(row, 1, ' ')
-                        # 텍스트 출력 (하이라이트) - 한글 폭 고려
-                        col = 2
-                        for ch in line_text:
-                            if col < width - 1:
-                                stdscr.addch(row, col, ch, color)
-                                # 한글은 2칸 차지
-                                ch_width = 2 if ord(ch) >= 0xAC00 and ord(ch) <= 0xD7AF else 1
-                                col += ch_width
-                        # 나머지 공백 (하이라이트)
-                        while col < width - 1:
-                            stdscr.addch(row, col, ' ', color)
-                            col += 1
-                        # 마지막 '│'는 일반 색상
-                        stdscr.addch(row, width - 1, '│')
-                    else:
-                        # 일반 출력
-                        stdscr.addch(row, 0, '│')
-                        stdscr.addch(row, 1, ' ')
-                        col = 2
-                        for ch in line_text:
-                            if col < width - 1:
-                                stdscr.addch(row, col, ch)
-                                # 한글은 2칸 차지
-                                ch_width = 2 if ord(ch) >= 0xAC00 and ord(ch) <= 0xD7AF else 1
-                                col += ch_width
-                        # 나머지 공백
-                        while col < width - 1:
-                            stdscr.addch(row, col, ' ')
-                            col += 1
-                        stdscr.addch(row, width - 1, '│')
-                else:
-                    # 빈 줄: │ + 공백 + │
-                    stdscr.addch(row, 0, '│')
-                    for col in range(1, width - 1):
-                        stdscr.addch(row, col, ' ')
-                    stdscr.addch(row, width - 1, '│')
-            except curses.error:
-                pass
+            self._draw_app_row(stdscr, app_start_row + i, self.app_scroll_offset + i, width)
 
         try:
-            stdscr.move(height - 3, 0)
-            for col in range(width):
-                stdscr.addch(height - 3, col, ' ')
-            stdscr.addstr(height - 3, 0, "├" + "─" * (width - 2) + "┤")
-
-            help_text = "[Enter]Run [ESC]Exit"
+            top_frame, header_line, separator, help_parts, help_tail, bottom_frame = self._get_app_frame(width)
+            stdscr.addstr(height - 3, 0, separator)
 
             # Help 라인 출력 - 한글 폭 고려 및 노란색 키 표시
             yellow_color = getattr(self, 'colors', {}).get('log_warning', curses.A_BOLD)
 
-            stdscr.addch(height - 2, 0, '│')
-            stdscr.addch(height - 2, 1, ' ')
-
-            col = 2
-            i = 0
-            while i < len(help_text):
-                if help_text[i] == '[':
-                    # [ ] 안의 텍스트는 노란색
-                    end_bracket = help_text.find(']', i)
-                    if end_bracket != -1:
-                        for ch in help_text[i:end_bracket+1]:
-                            if col < width - 1:
-                                stdscr.addch(height - 2, col, ch, yellow_color)
-                                col += 1
-                        i = end_bracket + 1
-                    else:
-                        if col < width - 1:
-                            stdscr.addch(height - 2, col, help_text[i])
-                            col += 1
-                        i += 1
+            stdscr.addstr(height - 2, 0, "│ ")
+            for col, part, is_key in help_parts:
+                if is_key:
+                    stdscr.addstr(height - 2, col, part, yellow_color)
                 else:
-                    # 일반 텍스트
-                    if col < width - 1:
-                        stdscr.addch(height - 2, col, help_text[i])
-                        col += 1
-                    i += 1
-
-            # 나머지 공백
-            while col < width - 1:
-                stdscr.addch(height - 2, col, ' ')
-                col += 1
+                    stdscr.addstr(height - 2, col, part)
 
-            # 오른쪽 │
-            stdscr.addch(height - 2, width - 1, '│')
+            # 나머지 공백 + 오른쪽 │
+            stdscr.addstr(height - 2, help_tail[0], help_tail[1])
 
             # Bottom frame (맨 아랫줄)
             try:
-                bottom_frame = "└" + "─" * (width - 2) + "┘"
                 stdscr.addstr(height - 1, 0, bottom_frame)
             except curses.error:
                 pass
         except curses.error:
             pass
 
+        self._prev_app_selected = self.app_selected_index
+        self._prev_app_scroll = self.app_scroll_offset
+        self._prev_app_size = (height, width)
+
     def _show_startup_fortune(self):
         """앱 시작 시 운세 표시 (다이얼로그)"""
         try:
-            import datetime
             from ..apps.fortune.main import calculate_fortune_index, d_f
 
             # APP.FORTUNE.STARTUP_SHOW 설정 확인
@@ -1,13 +1,16 @@
 """설정 및 프로젝트 관리 모듈"""
+import io
 import os
+import re
+import sys
+import bisect
 import configparser
 import fnmatch
 import time
 import shutil
-import getpass
 import datetime
 import shlex
-import glob
+from stat import S_ISREG
 
 from ..core import GitHelper, CCCopyError, LockManager
 from .ui_handler import display_message, messagebox
@@ -16,6 +19,292 @@ from .file_utils import handle_conflict, update_work_git_after_merge, show_git_h
 from .helpers import expand_path
 from ..models import FileState
 
+# 프로젝트 목록 조회 시 설정 파일 파싱을 스레드 풀로 나누는 최소 파일 수
+# (그보다 적으면 풀 생성 비용이 더 크므로 순차 처리)
+PARALLEL_PARSE_MIN_FILES = 8
+
+# 작업 디렉토리 복사 시 파일 복사를 스레드 풀로 나누는 최소 파일 수
+PARALLEL_COPY_MIN_FILES = 16
+
+# 마이그레이션이 끝난 기존 프로젝트 디렉토리 이름에 붙이는 접미사 (백그라운드 삭제 대기)
+_MIGRATED_SUFFIX = '.__migrated__'
+
+# 터미널 화면 지우기 ANSI 시퀀스 (커서 홈 + 화면 지우기 + 스크롤백 지우기)
+_CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+# 텍스트 모드 프로젝트 관리 메뉴의 고정 문자열 (매 반복마다 줄 단위 print 대신 한 번에 출력)
+_PROJECT_MENU_MAIN = "\n".join([
+    "\n" + "=" * 50,
+    "           프로젝트 관리",
+    "=" * 50,
+    "  1. 신규 프로젝트 생성",
+    "  2. 현재 프로젝트 변경",
+    "",
+    "  [ESC/0] 메인 메뉴로 돌아가기",
+    "-" * 50,
+])
+_PROJECT_MENU_CREATE_HEADER = "\n".join([
+    "\n" + "=" * 50,
+    "       신규 프로젝트 생성",
+    "=" * 50,
+    "사용 가능한 템플릿:",
+])
+_PROJECT_MENU_CREATE_FOOTER = "\n  [ESC/0] 뒤로가기\n" + "-" * 50
+_PROJECT_MENU_SWITCH_HEADER = "\n".join([
+    "\n" + "=" * 70,
+    "              현재 프로젝트 변경",
+    "=" * 70,
+])
+_PROJECT_MENU_SWITCH_FOOTER = "\n  [Enter] 선택, [E] 편집, [D] 삭제, [C] 복제, [ESC/0] 뒤로가기\n" + "-" * 70
+
+# SOURCES 편집용 임시 파일의 고정 안내 문구 (템플릿 패턴 목록 앞/뒤)
+_SOURCES_EDIT_HEADER = (
+    "; ===================================================================\n"
+    "; CCCopy 프로젝트 SOURCES 편집\n"
+    "; ===================================================================\n"
+    ";\n"
+    "; Production 경로에서 관리할 파일들의 목록을 구성하세요.\n"
+    ";\n"
+    "; 패턴 사용법:\n"
+    ";   AAA/**           - AAA에 있는 모든 파일 (하위 경로 포함)\n"
+    ";   AAA/*            - AAA에 있는 모든 파일 (하위 경로 미포함)\n"
+    ";   AAA/**/*.txt     - AAA에 있는 모든 *.txt 파일 (하위 경로 포함)\n"
+    ";   AAA/**/*.py      - AAA에 있는 모든 *.py 파일 (하위 경로 포함)\n"
+    ";   AAA/file.txt     - 특정 파일 하나만\n"
+    ";   AAA/B??/file.txt - 와일드카드 사용 (B로 시작하는 3글자 디렉토리)\n"
+    ";\n"
+    "; 주의사항:\n"
+    ";   - 번호는 00부터 시작합니다 (00, 01, 02, ...)\n"
+    ";   - 경로 구분자는 / 를 사용합니다 (Windows에서도 / 사용)\n"
+    ";   - 상대 경로로 작성합니다 (Production 디렉토리 기준)\n"
+    ";   - 대소문자를 구분합니다 (AAA/file.txt ≠ aaa/file.txt)\n"
+    ";\n"
+    "; [CONFIG] 섹션을 추가하면 다른 설정도 오버라이드할 수 있습니다.\n"
+    "; 예시:\n"
+    ";   [CONFIG]\n"
+    ";   PRODUCTION_DIR=/custom/path\n"
+    ";\n"
+    "; ===================================================================\n"
+    "\n"
+    "; 템플릿의 [SOURCES] 패턴 (참고용 - 필요시 아래 주석을 해제하고 수정):\n"
+    "; [SOURCES]\n"
+)
+_SOURCES_EDIT_DEFAULT_PATTERNS = (
+    "; 00=src/**\n"
+    "; 01=docs/**\n"
+    "; 02=config/*.ini\n"
+)
+_SOURCES_EDIT_FOOTER = (
+    ";\n"
+    "; [SOURCES] 섹션을 추가하려면:\n"
+    ";   1. 위의 '; [SOURCES]' 줄에서 ';'를 제거\n"
+    ";   2. 필요한 패턴 줄에서 ';'를 제거\n"
+    ";   3. 패턴을 원하는 대로 수정\n"
+    ";\n"
+    "; [SOURCES]를 추가하지 않으면 템플릿의 기본 패턴이 사용됩니다.\n"
+)
+
+# 신규 프로젝트 개인 설정 파일(config.ini)의 고정 주석 헤더
+_PERSONAL_CONFIG_HEADER = (
+    "# CCCopy 프로젝트 개인 설정 파일\n"
+    "# 이 파일은 템플릿 설정을 오버라이드합니다.\n"
+    "#\n"
+    "# [SOURCES] 섹션 사용법:\n"
+    "#   - 추적할 파일/디렉토리 패턴을 지정합니다\n"
+    "#   - glob 패턴 사용 가능 (예: AAA/**, *.cpp, **/test/*.h)\n"
+    "#   - 여러 패턴을 00, 01, 02... 형식으로 추가\n"
+    "#   - 이 파일에 [SOURCES]를 추가하면 템플릿의 SOURCES를 완전히 대체합니다\n"
+    "#\n"
+    "# [EXCLUDES] 섹션 사용법:\n"
+    "#   - 제외할 파일/디렉토리 패턴을 지정합니다\n"
+    "#   - 예: **/.git/ (모든 .git 디렉토리)\n"
+    "#   - 예: **/__pycache__/ (모든 Python 캐시)\n"
+    "#   - 예: **/backup/ (모든 backup 디렉토리)\n"
+    "#   - 예: **/*.log (모든 .log 파일)\n"
+    "#\n"
+)
+
+# 프로젝트 목록 조회용 간이 ini 파서 패턴 (섹션 헤더 / key = value)
+_SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$')
+_KV_RE = re.compile(r'^([^=:\s][^=:]*?)\s*[=:]\s*(.*?)\s*$')
+
+
+def _fast_read_ini(path):
+    """단순한 ini 파일을 정규식으로 읽기 (프로젝트 목록 조회 전용)
+
+    ConfigParser와 결과가 달라질 수 있는 형식(여러 줄 값, % 보간, 중복 키 등)이
+    보이면 None을 반환하여 호출자가 ConfigParser로 다시 읽도록 한다.
+
+    Returns:
+        {section: {key(소문자): value}} 또는 None
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    sections = {}
+    current = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in '#;':
+            continue
+        if line[0].isspace():
+            # 들여쓰기된 줄은 여러 줄 값의 연속 줄일 수 있음
+            return None
+        match = _SECTION_RE.match(line)
+        if match:
+            current = sections.setdefault(match.group(1), {})
+            continue
+        match = _KV_RE.match(line)
+        if match is None or current is None:
+            return None
+        key, value = match.group(1).lower(), match.group(2)
+        if '%' in value or key in current:
+            return None
+        current[key] = value
+    if 'DEFAULT' in sections:
+        # DEFAULT 섹션 값은 다른 섹션으로 상속되므로 ConfigParser에 맡김
+        return None
+    return sections
+
+
+def _write_ini_atomic(path, config):
+    """ConfigParser 내용을 임시 파일에 쓴 뒤 교체 (중간에 실패해도 기존 파일이 깨지지 않음)"""
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'w') as f:
+        config.write(f)
+    os.replace(tmp_file, path)
+
+
+# macOS clonefile() 함수 (최초 사용 시 로드, 로드 실패 시 False)
+_clonefile = None
+
+
+def _native_copyfile(src, dst):
+    """OS의 파일 복제/커널 내부 복사 기능으로 파일 내용 복사
+
+    Returns:
+        bool: 복사했으면 True, 현재 플랫폼에서 사용할 수 없으면 False
+    Raises:
+        OSError: 복사 실패
+    """
+    global _clonefile
+    if sys.platform == 'darwin':
+        # APFS: 데이터 블록을 공유하는 복제 (대상 파일이 없어야 함)
+        if _clonefile is None:
+            try:
+                import ctypes
+                libc = ctypes.CDLL('/usr/lib/libSystem.B.dylib', use_errno=True)
+                _clonefile = libc.clonefile
+                _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+                _clonefile.restype = ctypes.c_int
+            except (OSError, AttributeError):
+                _clonefile = False
+        if not _clonefile or os.path.lexists(dst):
+            return False
+        if _clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            import ctypes
+            errno_value = ctypes.get_errno()
+            raise OSError(errno_value, os.strerror(errno_value), src)
+        return True
+
+    if os.name == 'nt':
+        import ctypes
+        if not ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+            raise ctypes.WinError()
+        return True
+
+    if hasattr(os, 'copy_file_range'):
+        # Linux: 커널 내부 복사 (reflink 지원 파일시스템에서는 블록 공유)
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            else:
+                return True
+        # 파일 크기가 도중에 바뀜 (procfs 등) - 일반 복사로 처리
+        return False
+
+    return False
+
+
+def _fast_copyfile(src, dst):
+    """파일 복사 (shutil.copy2와 같이 메타데이터 포함)
+
+    가능하면 clonefile/copy_file_range/CopyFileExW를 사용하고, 실패하면 shutil.copy2로 복사한다.
+    일반 파일이 아니면 (FIFO 등 - 열면 블로킹될 수 있음) shutil.copy2에 맡겨 SpecialFileError로 처리한다.
+    """
+    try:
+        if S_ISREG(os.stat(src).st_mode) and _native_copyfile(src, dst):
+            shutil.copystat(src, dst)
+            return dst
+    except OSError:
+        pass
+    return shutil.copy2(src, dst)
+
+
+def _fast_copytree(src, dst, exclude_top=('.git',)):
+    """디렉토리 트리 복사 (기존 대상 디렉토리에 병합, 최상위 exclude_top 항목 제외)
+
+    Windows에서는 robocopy 멀티스레드 복사를 사용하고, 그 외에는 디렉토리를 먼저 모두
+    만든 뒤 파일 복사를 스레드 풀에서 병렬로 수행한다. (파일 수가 적으면 순차 복사)
+    """
+    if os.name == 'nt':
+        import subprocess
+        command = ['robocopy', src, dst, '/E', '/MT:32', '/NFL', '/NDL', '/NJH', '/NJS', '/NP']
+        if exclude_top:
+            command += ['/XD'] + [os.path.join(src, name) for name in exclude_top]
+        try:
+            result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if result.returncode <= 7:  # robocopy: 0~7 성공, 8 이상 실패
+                return
+        except OSError:
+            pass  # robocopy 실행 불가 - 아래 방식으로 복사
+
+    # 복사할 디렉토리/파일 목록 수집 (shutil.copytree와 같이 심볼릭 링크는 따라가서 복사)
+    dir_pairs = []
+    file_pairs = []
+    pending = [(src, dst, True)]
+    while pending:
+        src_dir, dst_dir, is_top = pending.pop()
+        dir_pairs.append((src_dir, dst_dir))
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                if is_top and entry.name in exclude_top:
+                    continue
+                dest_path = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    pending.append((entry.path, dest_path, False))
+                else:
+                    file_pairs.append((entry.path, dest_path))
+
+    # 디렉토리는 단일 스레드로 먼저 생성
+    for _, dst_dir in dir_pairs:
+        os.makedirs(dst_dir, exist_ok=True)
+
+    if len(file_pairs) >= PARALLEL_COPY_MIN_FILES:
+        # 작업 스레드 수가 동시에 열리는 파일 수의 상한 (파일 디스크립터 고갈 방지)
+        from concurrent.futures import ThreadPoolExecutor
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # list()로 결과를 모두 소비해 복사 중 발생한 예외를 호출자에게 전달
+            list(executor.map(lambda pair: _fast_copyfile(*pair), file_pairs))
+    else:
+        for src_file, dst_file in file_pairs:
+            _fast_copyfile(src_file, dst_file)
+
+    # 디렉토리 속성은 파일 복사가 끝난 뒤 하위 디렉토리부터 복사 (shutil.copytree와 동일)
+    for src_dir, dst_dir in reversed(dir_pairs):
+        try:
+            shutil.copystat(src_dir, dst_dir)
+        except OSError:
+            pass
+
 
 class ProductionTagManager:
     """Production tag 관리 (Enhanced Tag with SOURCES hash)"""
@@ -24,6 +313,11 @@ class ProductionTagManager:
         self.working_dir = working_dir
         self.tag_file = os.path.join(working_dir, '.cccopy', 'status', 'production.tag')
         self.project_manager = project_manager  # SOURCES hash 계산용
+        # tag 파일 내용 캐시 (파일의 (inode, mtime_ns, size)가 같으면 다시 읽지 않음)
+        # tag는 항상 같은 길이이고 NFS 등에서는 mtime 해상도가 낮으므로, os.replace로 교체될 때마다
+        # 바뀌는 inode를 키에 포함해 다른 프로세스가 같은 tick에 다시 쓴 경우도 구분함
+        self._tag_cache = None
+        self._tag_stat = None
 
     def save_production_tag(self, production_dir, include_sources_hash=True):
         """현재 Production HEAD를 tag로 저장 (선택적으로 SOURCES hash 포함)
@@ -50,8 +344,12 @@ class ProductionTagManager:
                     tag_content = head_commit
                     display_message(f"Production tag 저장 중 (구버전): {tag_content}", "DEBUG")
 
-                with open(self.tag_file, 'w') as f:
+                # 임시 파일에 쓴 뒤 교체 (읽는 쪽에서 비어 있거나 일부만 쓰인 tag를 보지 않도록)
+                tmp_file = self.tag_file + '.tmp'
+                with open(tmp_file, 'w', encoding='ascii') as f:
                     f.write(tag_content)
+                os.replace(tmp_file, self.tag_file)
+                self._tag_stat = None  # 같은 시각/크기로 덮어써도 다시 읽도록 캐시 무효화
                 display_message(f"Production tag 저장 성공: {self.tag_file}", "DEBUG")
                 return True
             else:
@@ -66,11 +364,23 @@ class ProductionTagManager:
     def get_production_tag(self):
         """저장된 Production tag 가져오기 (전체 문자열)"""
         try:
-            if os.path.exists(self.tag_file):
-                with open(self.tag_file, 'r') as f:
-                    return f.read().strip()
+            stat = os.stat(self.tag_file)
+        except OSError:
+            self._tag_stat = None
             return None
+
+        file_stat = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if file_stat == self._tag_stat:
+            return self._tag_cache
+
+        try:
+            # Tag는 ASCII 문자열이므로 바이너리로 읽어 한 번에 디코딩 (텍스트 모드 래퍼 생략)
+            with open(self.tag_file, 'rb') as f:
+                self._tag_cache = f.read().decode('ascii', 'replace').strip()
+            self._tag_stat = file_stat
+            return self._tag_cache
         except:
+            self._tag_stat = None
             return None
 
     def get_production_tag_parts(self):
@@ -86,17 +396,13 @@ class ProductionTagManager:
         if not tag:
             return (None, None)
 
-        if ':' in tag:
-            # Enhanced Tag 형식: "commit:sources_hash"
-            parts = tag.split(':', 1)
-            return (parts[0], parts[1])
-        else:
-            # 구버전 Tag 형식: "commit"
-            return (tag, None)
+        # Enhanced Tag 형식: "commit:sources_hash" / 구버전 Tag 형식: "commit"
+        commit, sep, sources_hash = tag.partition(':')
+        return (commit, sources_hash if sep else None)
 
     def has_production_tag(self):
         """Production tag가 존재하는지 확인"""
-        return os.path.exists(self.tag_file) and self.get_production_tag() is not None
+        return self.get_production_tag() is not None
 
 
 class ProjectSelectionManager:
@@ -106,22 +412,36 @@ class ProjectSelectionManager:
         self.workspace = workspace
         self.personal_config_dir = os.path.expanduser("~/.cccopy/project")
         self.personal_config_file = os.path.join(self.personal_config_dir, "config.ini")
+        # 프로젝트 목록 변경 알림 콜백: on_change(event, project_count)
+        # event: 'delete' / 'edit' / 'clone', project_count: 변경된 프로젝트 번호 (int)
+        self.on_change = None
+        # 프로젝트 설정 파싱 결과 캐시: {config_file: (mtime_ns, size, project_row)}
+        self._project_cache = {}
+        # 목록 조회 fallback용 ConfigParser (프로젝트마다 새로 만들지 않고 clear() 후 재사용)
+        self._listing_parser = None
+        # 등록된 작업 경로 집합 (원래 경로 + normpath 정규화 경로) - _get_registered_projects()에서 갱신
+        self._registered_paths = set()
+        self._registered_paths_count = -1  # 경로 집합을 만들 때의 프로젝트 수 (변경 감지용)
+        # 개인 설정 파일(LAST_PROJECT) 캐시: (mtime_ns, size, ConfigParser) - 다른 곳에서 파일을 바꾸면 다시 읽음
+        self._personal_config_cache = None
+
+    def _notify_change(self, event, project_count):
+        """프로젝트 목록 변경을 on_change 콜백으로 알림"""
+        if self.on_change is not None:
+            self.on_change(event, int(project_count))
 
     def show_project_management_menu(self):
         """프로젝트 관리 메인 메뉴 표시"""
 
         # 화면 지우기 (텍스트 모드에서 깔끔한 표시를 위해)
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # POSIX는 clear 프로세스 실행 없이 ANSI 시퀀스를 직접 출력
+        if os.name == 'posix':
+            print(_CLEAR_SCREEN, end='', flush=True)
+        else:
+            os.system('cls')
 
         while True:
-            print("\n" + "=" * 50)
-            print("           프로젝트 관리")
-            print("=" * 50)
-            print("  1. 신규 프로젝트 생성")
-            print("  2. 현재 프로젝트 변경")
-            print()
-            print("  [ESC/0] 메인 메뉴로 돌아가기")
-            print("-" * 50)
+            print(_PROJECT_MENU_MAIN)
 
             try:
                 choice = input("\n선택하세요 (1-2, 0): ").strip()
@@ -153,17 +473,10 @@ class ProjectSelectionManager:
             return False
 
         while True:
-            print("\n" + "=" * 50)
-            print("       신규 프로젝트 생성")
-            print("=" * 50)
-            print("사용 가능한 템플릿:")
-
-            for i, project in enumerate(template_projects, 1):
-                print(f"  {i}  {project}")
-
-            print()
-            print("  [ESC/0] 뒤로가기")
-            print("-" * 50)
+            menu_lines = [_PROJECT_MENU_CREATE_HEADER]
+            menu_lines.extend(f"  {i}  {project}" for i, project in enumerate(template_projects, 1))
+            menu_lines.append(_PROJECT_MENU_CREATE_FOOTER)
+            print("\n".join(menu_lines))
 
             try:
                 choice = input(f"\n템플릿을 선택하세요 (1-{len(template_projects)}, 0): ").strip()
@@ -234,8 +547,7 @@ class ProjectSelectionManager:
                                             settings_confirmed = True
                                         else:
                                             print("\n[ERROR] gedit 실행에 실패했습니다.")
-                                            if os.path.exists(temp_ini_file):
-                                                os.remove(temp_ini_file)
+                                            self._remove_temp_file(temp_ini_file)
                                             temp_ini_file = None
                                             # 다시 메뉴로 돌아감
                                     else:
@@ -258,8 +570,7 @@ class ProjectSelectionManager:
                                 )
 
                                 # 임시 파일 정리
-                                if temp_ini_file and os.path.exists(temp_ini_file):
-                                    os.remove(temp_ini_file)
+                                self._remove_temp_file(temp_ini_file)
 
                                 print(f"\n[OK] 프로젝트가 성공적으로 생성되었습니다!")
                                 print(f"   템플릿: {selected_template}")
@@ -282,8 +593,7 @@ class ProjectSelectionManager:
                                 return True
                             except Exception as e:
                                 # 오류 발생시 임시 파일 정리
-                                if temp_ini_file and os.path.exists(temp_ini_file):
-                                    os.remove(temp_ini_file)
+                                self._remove_temp_file(temp_ini_file)
                                 print(f"\n[ERROR] 프로젝트 생성 실패: {e}")
                                 input("Enter 키를 누르면 계속합니다...")
                                 return False
@@ -309,9 +619,7 @@ class ProjectSelectionManager:
         current_project = self.workspace.get_current_project_name()
 
         while True:
-            print("\n" + "=" * 70)
-            print("              현재 프로젝트 변경")
-            print("=" * 70)
+            menu_lines = [_PROJECT_MENU_SWITCH_HEADER]
 
             for i, (project_count, project_name, work_dir, tag, _) in enumerate(registered_projects, 1):
                 current_marker = " [현재]" if str(project_count) == current_project else ""
@@ -323,11 +631,10 @@ class ProjectSelectionManager:
                 else:
                     display_name = project_name
 
-                print(f"  {prefix}{i}  {display_name} ({work_dir}){current_marker}")
+                menu_lines.append(f"  {prefix}{i}  {display_name} ({work_dir}){current_marker}")
 
-            print()
-            print("  [Enter] 선택, [E] 편집, [D] 삭제, [C] 복제, [ESC/0] 뒤로가기")
-            print("-" * 70)
+            menu_lines.append(_PROJECT_MENU_SWITCH_FOOTER)
+            print("\n".join(menu_lines))
 
             try:
                 choice = input(f"\n선택하세요 (1-{len(registered_projects)}, E+번호, D+번호, C+번호, 0): ").strip().upper()
@@ -439,7 +746,7 @@ class ProjectSelectionManager:
                             project_count, project_name, work_dir, tag, _ = registered_projects[idx]
                             display_name = f"{project_name}({tag})" if tag else project_name
                             if self._confirm_project_deletion(display_name, work_dir):
-                                if self._delete_project(str(project_count)):
+                                if self._delete_project(project_count):
                                     print(f"\n[OK] 프로젝트 '{display_name}'가 삭제되었습니다.")
                                     # 목록 갱신
                                     registered_projects = self._get_registered_projects()
@@ -495,41 +802,160 @@ class ProjectSelectionManager:
     def _get_registered_projects(self):
         """등록된 프로젝트 목록 조회 (숫자 기반 디렉토리)"""
         projects = []
-
-        if not os.path.exists(self.personal_config_dir):
-            return projects
+        to_parse = []  # 캐시에 없거나 변경된 설정 파일: (project_count, config_file, stat)
 
         try:
-            for item in os.listdir(self.personal_config_dir):
-                project_dir = os.path.join(self.personal_config_dir, item)
-                if os.path.isdir(project_dir) and item.isdigit():
-                    project_config_file = os.path.join(project_dir, "config.ini")
-                    if os.path.exists(project_config_file):
-                        config = configparser.ConfigParser()
-                        config.read(project_config_file)
+            # scandir: 디렉토리 여부를 디렉토리 읽기 결과로 판단 (항목별 stat 생략)
+            with os.scandir(self.personal_config_dir) as entries:
+                for entry in entries:
+                    if not (entry.name.isdigit() and entry.is_dir()):
+                        continue
+                    project_config_file = os.path.join(entry.path, "config.ini")
+                    try:
+                        stat = os.stat(project_config_file)
+                    except FileNotFoundError:
+                        continue
 
-                        if (config.has_section('CONFIG') and config.has_option('CONFIG', 'WORKING_BASE_DIR') and
-                            config.has_section('INFO') and config.has_option('INFO', 'PROJECT_NAME')):
-                            work_dir = config.get('CONFIG', 'WORKING_BASE_DIR')
-                            project_name = config.get('INFO', 'PROJECT_NAME')
-                            tag = config.get('INFO', 'TAG', fallback='')
-                            create_date = config.get('INFO', 'CREATE_DATE', fallback='')
-                            projects.append((int(item), project_name, work_dir, tag, create_date))
+                    # 수정 시간과 크기가 같으면 이전에 파싱한 결과 재사용
+                    cached = self._project_cache.get(project_config_file)
+                    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                        if cached[2] is not None:
+                            projects.append(cached[2])
+                    else:
+                        to_parse.append((int(entry.name), project_config_file, stat))
+
+            if len(to_parse) >= PARALLEL_PARSE_MIN_FILES:
+                # 파일 읽기 대기 시간이 겹치도록 스레드 풀에서 파싱 (공유 파서는 사용하지 않음)
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=min(16, len(to_parse))) as executor:
+                    rows = list(executor.map(
+                        lambda item: self._read_project_row(item[0], item[1], reuse_parser=False), to_parse))
+            else:
+                rows = [self._read_project_row(project_count, config_file)
+                        for project_count, config_file, _ in to_parse]
+
+            for (_, project_config_file, stat), row in zip(to_parse, rows):
+                self._project_cache[project_config_file] = (stat.st_mtime_ns, stat.st_size, row)
+                if row is not None:
+                    projects.append(row)
 
             # 숫자 순서로 정렬
             projects.sort(key=lambda x: x[0])
 
+        except FileNotFoundError:
+            # 개인 설정 디렉토리가 아직 없음
+            pass
         except Exception as e:
             # TUI에서 오류 처리하므로 여기서는 제거 (curses 화면 깨짐 방지)
             # display_message(f"프로젝트 목록 조회 중 오류: {e}", "ERROR")
             pass
 
+        # 중복 경로 검사용 집합 갱신 ("/a/./b"와 "/a/b"도 같은 경로로 판단하도록 정규화 경로 포함)
+        # 다시 파싱한 파일이 없고 프로젝트 수도 같으면 목록이 그대로이므로 기존 집합 유지
+        if to_parse or len(projects) != self._registered_paths_count:
+            registered_paths = set()
+            for _, _, work_dir, _, _ in projects:
+                registered_paths.add(work_dir)
+                registered_paths.add(os.path.normpath(work_dir))
+            self._registered_paths = registered_paths
+            self._registered_paths_count = len(projects)
+
         return projects
 
+    def _iter_registered_projects(self):
+        """등록된 프로젝트를 번호순으로 하나씩 반환하는 generator
+
+        디렉토리 이름만 먼저 정렬하고 설정 파일은 꺼낼 때마다 읽으므로,
+        첫 번째 프로젝트만 필요한 호출자는 나머지 설정 파일을 읽지 않는다.
+        (파싱 결과는 _get_registered_projects()와 같은 캐시를 사용)
+        """
+        try:
+            with os.scandir(self.personal_config_dir) as entries:
+                project_dirs = sorted((int(entry.name), entry.path) for entry in entries
+                                      if entry.name.isdigit() and entry.is_dir())
+        except OSError:
+            return
+
+        for project_count, project_dir in project_dirs:
+            project_config_file = os.path.join(project_dir, "config.ini")
+            try:
+                stat = os.stat(project_config_file)
+            except OSError:
+                continue
+
+            cached = self._project_cache.get(project_config_file)
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                row = cached[2]
+            else:
+                try:
+                    row = self._read_project_row(project_count, project_config_file)
+                except Exception:
+                    continue
+                self._project_cache[project_config_file] = (stat.st_mtime_ns, stat.st_size, row)
+
+            if row is not None:
+                yield row
+
+    def _read_project_row(self, project_count, config_file, reuse_parser=True):
+        """프로젝트 설정 파일에서 목록 표시용 정보 읽기
+
+        목록에는 4개 키만 필요하므로 정규식 파서로 먼저 읽고,
+        필수 키가 없거나 단순 형식이 아니면 ConfigParser로 다시 읽는다.
+
+        Args:
+            project_count: 프로젝트 번호 (int)
+            config_file: 설정 파일 경로
+            reuse_parser: False이면 공유 ConfigParser 대신 새로 생성 (여러 스레드에서 호출 시)
+
+        Returns:
+            (project_count, project_name, work_dir, tag, create_date) 또는 None
+        """
+        sections = _fast_read_ini(config_file)
+        if sections is not None:
+            config_section = sections.get('CONFIG', {})
+            info_section = sections.get('INFO', {})
+            if 'working_base_dir' in config_section and 'project_name' in info_section:
+                return (project_count, info_section['project_name'], config_section['working_base_dir'],
+                        info_section.get('tag', ''), info_section.get('create_date', ''))
+
+        config = self._listing_parser if reuse_parser else None
+        if config is None:
+            config = configparser.ConfigParser()
+            if reuse_parser:
+                self._listing_parser = config
+        else:
+            # clear()는 DEFAULT 섹션을 비우지 않으므로 따로 비움
+            config.clear()
+            config[configparser.DEFAULTSECT].clear()
+        config.read(config_file)
+
+        if (config.has_section('CONFIG') and config.has_option('CONFIG', 'WORKING_BASE_DIR') and
+            config.has_section('INFO') and config.has_option('INFO', 'PROJECT_NAME')):
+            work_dir = config.get('CONFIG', 'WORKING_BASE_DIR')
+            project_name = config.get('INFO', 'PROJECT_NAME')
+            tag = config.get('INFO', 'TAG', fallback='')
+            create_date = config.get('INFO', 'CREATE_DATE', fallback='')
+            return (project_count, project_name, work_dir, tag, create_date)
+        return None
+
     def _is_path_already_used(self, path):
         """경로가 이미 사용중인지 확인"""
-        registered_projects = self._get_registered_projects()
-        return any(work_dir == path for _, _, work_dir, _, _ in registered_projects)
+        self._get_registered_projects()  # 변경된 설정 파일만 다시 읽어 경로 집합 갱신
+        return path in self._registered_paths or os.path.normpath(path) in self._registered_paths
+
+    def _get_used_paths_set(self):
+        """등록된 프로젝트들의 작업 경로 집합 반환 (반복 중복 검사용)"""
+        self._get_registered_projects()
+        return self._registered_paths
+
+    def _remove_temp_file(self, path):
+        """임시 파일 삭제 (없으면 무시 - 존재 확인을 따로 하지 않음)"""
+        if not path:
+            return
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
 
     def _confirm_project_deletion(self, project_name, work_dir):
         """프로젝트 삭제 확인"""
@@ -548,25 +974,34 @@ class ProjectSelectionManager:
             else:
                 print("y 또는 n을 입력하세요.")
 
-    def _delete_project(self, project_name):
-        """프로젝트 삭제"""
+    def _delete_project(self, project_count):
+        """프로젝트 삭제
+
+        Args:
+            project_count: 삭제할 프로젝트 번호 (int, 디렉토리 이름은 내부에서 4자리로 패딩)
+        """
         try:
+            project_name = f"{project_count:04d}"
             project_dir = os.path.join(self.personal_config_dir, project_name)
 
-            if os.path.exists(project_dir):
-                import shutil
+            self._project_cache.pop(os.path.join(project_dir, "config.ini"), None)
+
+            try:
                 shutil.rmtree(project_dir)
-                display_message(f"프로젝트 설정 디렉토리 삭제 완료: {project_dir}", "INFO")
-                # LAST_PROJECT 갱신
-                self._update_last_project_after_deletion(project_name)
-                return True  # 실제 삭제 성공
-            else:
+            except FileNotFoundError:
                 # 경로가 존재하지 않지만 삭제 성공으로 처리 (이미 삭제된 상태)
                 display_message(f"프로젝트 설정 디렉토리가 이미 존재하지 않음: {project_dir}", "INFO")
                 # LAST_PROJECT 갱신
                 self._update_last_project_after_deletion(project_name)
+                self._notify_change('delete', project_count)
                 return True  # 이미 없으므로 삭제 성공으로 간주
 
+            display_message(f"프로젝트 설정 디렉토리 삭제 완료: {project_dir}", "INFO")
+            # LAST_PROJECT 갱신
+            self._update_last_project_after_deletion(project_name)
+            self._notify_change('delete', project_count)
+            return True  # 실제 삭제 성공
+
         except Exception as e:
             display_message(f"프로젝트 삭제 중 오류: {e}", "ERROR")
             return False
@@ -611,12 +1046,14 @@ class ProjectSelectionManager:
                 # 파일이 변경되었는지 확인
                 if mtime_after > mtime_before:
                     display_message(f"프로젝트 설정이 변경되었습니다: {display_name}", "INFO")
+                    self._project_cache.pop(config_file, None)
 
                     # SOURCES 변경 여부 확인 및 안내
                     # workspace가 ProjectManager 인스턴스인 경우에만 호출
                     if hasattr(self.workspace, '_check_and_notify_sources_change'):
                         self.workspace._check_and_notify_sources_change(config_file)
 
+                    self._notify_change('edit', project_number)
                     return True
                 else:
                     display_message(f"프로젝트 설정이 변경되지 않았습니다: {display_name}", "INFO")
@@ -693,26 +1130,14 @@ class ProjectSelectionManager:
             new_config_file = os.path.join(new_project_dir, "config.ini")
             with open(new_config_file, 'w', encoding='utf-8') as f:
                 new_config.write(f)
+            self._project_cache.pop(new_config_file, None)
 
             # 원본 작업 디렉토리에서 파일 복사 (.git 제외)
             if os.path.exists(source_working_dir):
                 display_message(f"작업 디렉토리 복사 중: {source_working_dir} → {new_working_dir}", "INFO")
 
-                # 새 작업 디렉토리 생성
-                os.makedirs(new_working_dir, exist_ok=True)
-
-                # .git을 제외한 모든 파일/디렉토리 복사
-                for item in os.listdir(source_working_dir):
-                    if item == '.git':
-                        continue
-
-                    source_item = os.path.join(source_working_dir, item)
-                    dest_item = os.path.join(new_working_dir, item)
-
-                    if os.path.isdir(source_item):
-                        shutil.copytree(source_item, dest_item)
-                    else:
-                        shutil.copy2(source_item, dest_item)
+                # 최상위 .git을 제외한 모든 파일/디렉토리 복사 (파일은 병렬 복사)
+                _fast_copytree(source_working_dir, new_working_dir, exclude_top=('.git',))
 
                 display_message("작업 디렉토리 복사 완료", "INFO")
             else:
@@ -727,6 +1152,7 @@ class ProjectSelectionManager:
             display_message(f"작업 디렉토리: {new_working_dir}", "INFO")
             display_message(f"TAG: {new_tag}", "INFO")
 
+            self._notify_change('clone', new_project_number)
             return True
 
         except Exception as e:
@@ -735,22 +1161,48 @@ class ProjectSelectionManager:
             display_message(traceback.format_exc(), "DEBUG")
             return False
 
+    def _load_personal_config(self):
+        """개인 설정 파일 읽기 (파일의 (mtime_ns, size)가 같으면 이전에 읽은 ConfigParser 재사용)"""
+        try:
+            stat = os.stat(self.personal_config_file)
+        except OSError:
+            self._personal_config_cache = None
+            return configparser.ConfigParser()  # 파일이 없으면 빈 설정
+
+        cached = self._personal_config_cache
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        config = configparser.ConfigParser()
+        config.read(self.personal_config_file)
+        self._personal_config_cache = (stat.st_mtime_ns, stat.st_size, config)
+        return config
+
+    def _save_personal_config(self, config):
+        """개인 설정 파일 원자적 저장 후 캐시 갱신"""
+        try:
+            _write_ini_atomic(self.personal_config_file, config)
+        except Exception:
+            self._personal_config_cache = None  # 메모리 내용과 파일이 다를 수 있으므로 다음에 다시 읽음
+            raise
+        stat = os.stat(self.personal_config_file)
+        self._personal_config_cache = (stat.st_mtime_ns, stat.st_size, config)
+
     def _update_last_project(self, project_name):
-        """LAST_PROJECT 설정 업데이트"""
+        """LAST_PROJECT 설정 업데이트 (값이 그대로면 파일을 다시 쓰지 않음)"""
         try:
             os.makedirs(self.personal_config_dir, exist_ok=True)
 
-            config = configparser.ConfigParser()
-            if os.path.exists(self.personal_config_file):
-                config.read(self.personal_config_file)
+            config = self._load_personal_config()
 
             if not config.has_section('CONFIG'):
                 config.add_section('CONFIG')
 
-            config.set('CONFIG', 'LAST_PROJECT', project_name)
+            if config.get('CONFIG', 'LAST_PROJECT', fallback=None) == project_name:
+                return  # 이미 같은 값 - 파일 쓰기 생략
 
-            with open(self.personal_config_file, 'w') as f:
-                config.write(f)
+            config.set('CONFIG', 'LAST_PROJECT', project_name)
+            self._save_personal_config(config)
 
         except Exception as e:
             # TUI에서 오류 처리하므로 여기서는 제거 (curses 화면 깨짐 방지)
@@ -764,30 +1216,22 @@ class ProjectSelectionManager:
 
             if not registered_projects:
                 # 프로젝트가 하나도 없으면 LAST_PROJECT 제거
-                if os.path.exists(self.personal_config_file):
-                    config = configparser.ConfigParser()
-                    config.read(self.personal_config_file)
-                    if config.has_section('CONFIG') and config.has_option('CONFIG', 'LAST_PROJECT'):
-                        config.remove_option('CONFIG', 'LAST_PROJECT')
-                        with open(self.personal_config_file, 'w') as f:
-                            config.write(f)
-                        display_message("모든 프로젝트가 삭제되어 LAST_PROJECT 설정을 제거했습니다.", "INFO")
+                config = self._load_personal_config()
+                if config.has_section('CONFIG') and config.has_option('CONFIG', 'LAST_PROJECT'):
+                    config.remove_option('CONFIG', 'LAST_PROJECT')
+                    self._save_personal_config(config)
+                    display_message("모든 프로젝트가 삭제되어 LAST_PROJECT 설정을 제거했습니다.", "INFO")
                 return
 
             # 삭제된 프로젝트 번호 찾기
             deleted_number = int(deleted_project_name)
 
-            # 삭제된 프로젝트보다 큰 번호 중 가장 작은 번호 찾기
-            next_project = None
-            for project_count, project_name, work_dir, tag, create_date in registered_projects:
-                if project_count > deleted_number:
-                    next_project = f"{project_count:04d}"
-                    break
-
+            # 삭제된 프로젝트보다 큰 번호 중 가장 작은 번호 찾기 (목록은 번호순 정렬되어 있으므로 이진 탐색)
             # 못 찾으면 첫 번째 프로젝트 선택
-            if not next_project:
-                first_project = registered_projects[0]
-                next_project = f"{first_project[0]:04d}"
+            counts = [project[0] for project in registered_projects]
+            index = bisect.bisect_right(counts, deleted_number)
+            next_count = counts[index] if index < len(counts) else counts[0]
+            next_project = f"{next_count:04d}"
 
             # LAST_PROJECT 업데이트
             self._update_last_project(next_project)
@@ -812,53 +1256,13 @@ class ProjectSelectionManager:
             fd, temp_path = tempfile.mkstemp(suffix='.ini', prefix='cccopy_sources_')
             os.close(fd)
 
-            # 주석과 함께 SOURCES 섹션 작성
+            # 주석과 함께 SOURCES 섹션 작성 (고정 문구와 템플릿 패턴을 한 번에 쓰기)
             with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write("; ===================================================================\n")
-                f.write("; CCCopy 프로젝트 SOURCES 편집\n")
-                f.write("; ===================================================================\n")
-                f.write(";\n")
-                f.write("; Production 경로에서 관리할 파일들의 목록을 구성하세요.\n")
-                f.write(";\n")
-                f.write("; 패턴 사용법:\n")
-                f.write(";   AAA/**           - AAA에 있는 모든 파일 (하위 경로 포함)\n")
-                f.write(";   AAA/*            - AAA에 있는 모든 파일 (하위 경로 미포함)\n")
-                f.write(";   AAA/**/*.txt     - AAA에 있는 모든 *.txt 파일 (하위 경로 포함)\n")
-                f.write(";   AAA/**/*.py      - AAA에 있는 모든 *.py 파일 (하위 경로 포함)\n")
-                f.write(";   AAA/file.txt     - 특정 파일 하나만\n")
-                f.write(";   AAA/B??/file.txt - 와일드카드 사용 (B로 시작하는 3글자 디렉토리)\n")
-                f.write(";\n")
-                f.write("; 주의사항:\n")
-                f.write(";   - 번호는 00부터 시작합니다 (00, 01, 02, ...)\n")
-                f.write(";   - 경로 구분자는 / 를 사용합니다 (Windows에서도 / 사용)\n")
-                f.write(";   - 상대 경로로 작성합니다 (Production 디렉토리 기준)\n")
-                f.write(";   - 대소문자를 구분합니다 (AAA/file.txt ≠ aaa/file.txt)\n")
-                f.write(";\n")
-                f.write("; [CONFIG] 섹션을 추가하면 다른 설정도 오버라이드할 수 있습니다.\n")
-                f.write("; 예시:\n")
-                f.write(";   [CONFIG]\n")
-                f.write(";   PRODUCTION_DIR=/custom/path\n")
-                f.write(";\n")
-                f.write("; ===================================================================\n")
-                f.write("\n")
-
-                # 기존 SOURCES 섹션을 주석으로 표시 (참고용)
-                f.write("; 템플릿의 [SOURCES] 패턴 (참고용 - 필요시 아래 주석을 해제하고 수정):\n")
-                f.write("; [SOURCES]\n")
                 if config.has_section('SOURCES'):
-                    for key, value in config.items('SOURCES'):
-                        f.write(f"; {key}={value}\n")
+                    patterns = "".join(f"; {key}={value}\n" for key, value in config.items('SOURCES'))
                 else:
-                    f.write("; 00=src/**\n")
-                    f.write("; 01=docs/**\n")
-                    f.write("; 02=config/*.ini\n")
-                f.write(";\n")
-                f.write("; [SOURCES] 섹션을 추가하려면:\n")
-                f.write(";   1. 위의 '; [SOURCES]' 줄에서 ';'를 제거\n")
-                f.write(";   2. 필요한 패턴 줄에서 ';'를 제거\n")
-                f.write(";   3. 패턴을 원하는 대로 수정\n")
-                f.write(";\n")
-                f.write("; [SOURCES]를 추가하지 않으면 템플릿의 기본 패턴이 사용됩니다.\n")
+                    patterns = _SOURCES_EDIT_DEFAULT_PATTERNS
+                f.write(_SOURCES_EDIT_HEADER + patterns + _SOURCES_EDIT_FOOTER)
 
             display_message(f"임시 편집 파일 생성: {temp_path}", "INFO")
             return temp_path
@@ -889,6 +1293,12 @@ class ProjectManager:
         self.last_production_check_time = 0
         self.production_check_timeout = cache_timeout
 
+        # 읽기 전용 ini 파싱 결과 캐시: {path: (mtime_ns, size, ConfigParser)}
+        self._config_cache = {}
+
+        # 프로젝트 이름 -> 번호 역색인 (_find_project_number_by_name()에서 필요할 때 생성)
+        self._name_to_number = None
+
         # 기존 프로젝트 마이그레이션 (숫자 기반으로 변경)
         self._migrate_old_projects()
 
@@ -904,6 +1314,29 @@ class ProjectManager:
         # 최종 설정 적용
         self._apply_final_config()
 
+    def _read_ini_cached(self, path):
+        """ini 파일을 읽은 ConfigParser 반환 (파일의 (mtime_ns, size)가 같으면 이전 결과 재사용)
+
+        반환된 객체는 여러 호출자가 공유하므로 읽기 전용으로만 사용해야 한다.
+        파일이 없으면 ConfigParser.read()와 같이 빈 ConfigParser를 반환한다.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._config_cache.pop(path, None)
+            return configparser.ConfigParser()
+
+        cached = self._config_cache.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        # 파일이 바뀐 경우에도 이전 ConfigParser는 건드리지 않고 새로 읽은 객체로 캐시 항목을 교체함
+        # (이전 객체를 들고 있는 다른 호출자/스레드가 비어 있거나 일부만 읽힌 상태를 보지 않도록)
+        config = configparser.ConfigParser()
+        config.read(path)
+        self._config_cache[path] = (stat.st_mtime_ns, stat.st_size, config)
+        return config
+
     def _scan_project_configs(self):
         """project/*.ini 파일들을 스캔하고 PROJECT_NAME 중복 검사"""
         # 환경 변수로 템플릿 디렉토리 경로 지정 가능
@@ -923,20 +1356,29 @@ class ProjectManager:
             raise CCCopyError(f"Project 디렉토리가 없습니다: {project_dir}")
 
         ini_files = []
-        for file in os.listdir(project_dir):
-            if file.endswith('.ini'):
-                ini_files.append(os.path.join(project_dir, file))
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.ini') and entry.is_file():
+                    ini_files.append(entry.path)
 
 
         if not ini_files:
             raise CCCopyError("project/*.ini 파일이 없습니다")
 
+        if len(ini_files) >= PARALLEL_PARSE_MIN_FILES:
+            # 파일 읽기 대기 시간이 겹치도록 스레드 풀에서 파싱 (중복 검사는 아래에서 순차 처리)
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(8, len(ini_files))) as executor:
+                parsed = list(executor.map(self._parse_template_ini, ini_files))
+        else:
+            parsed = [self._parse_template_ini(config_file) for config_file in ini_files]
+
         project_names = set()
 
-        for config_file in ini_files:
+        for config_file, (config, error) in zip(ini_files, parsed):
             try:
-                config = configparser.ConfigParser()
-                config.read(config_file)
+                if error is not None:
+                    raise error
 
                 if not config.has_section('CONFIG') or not config.has_option('CONFIG', 'PROJECT_NAME'):
                     display_message(f"경고: {config_file}에 PROJECT_NAME이 없습니다", "WARN")
@@ -954,12 +1396,24 @@ class ProjectManager:
                 display_message(f"설정 파일 읽기 오류 {config_file}: {e}", "ERROR")
 
 
+    def _parse_template_ini(self, config_file):
+        """템플릿 ini 파일 파싱
+
+        Returns:
+            (ConfigParser, None) 또는 읽기 실패 시 (None, 예외)
+        """
+        try:
+            config = configparser.ConfigParser()
+            config.read(config_file)
+            return (config, None)
+        except Exception as e:
+            return (None, e)
+
     def _auto_select_or_setup_project(self):
         """개인 설정을 읽어 자동 선택하거나 설정 필요 (숫자 기반 디렉토리 지원)"""
         if os.path.exists(self.personal_config_file):
             # 기존 설정 읽기
-            personal_config = configparser.ConfigParser()
-            personal_config.read(self.personal_config_file)
+            personal_config = self._read_ini_cached(self.personal_config_file)
 
             if personal_config.has_section('CONFIG') and personal_config.has_option('CONFIG', 'LAST_PROJECT'):
                 last_project_number = personal_config.get('CONFIG', 'LAST_PROJECT')
@@ -969,8 +1423,7 @@ class ProjectManager:
                 if os.path.isdir(project_dir):
                     project_config_file = os.path.join(project_dir, "config.ini")
                     if os.path.exists(project_config_file):
-                        config = configparser.ConfigParser()
-                        config.read(project_config_file)
+                        config = self._read_ini_cached(project_config_file)
                         if (config.has_section('INFO') and config.has_option('INFO', 'PROJECT_NAME')):
                             actual_project_name = config.get('INFO', 'PROJECT_NAME')
                             if actual_project_name in self.project_configs:
@@ -985,34 +1438,50 @@ class ProjectManager:
         self._try_auto_select_first_project()
 
     def _find_project_number_by_name(self, project_name):
-        """프로젝트 이름으로 프로젝트 번호 찾기"""
+        """프로젝트 이름으로 프로젝트 번호 찾기
+
+        역색인에서 찾은 번호는 해당 설정 파일의 PROJECT_NAME을 다시 확인하고,
+        없거나 맞지 않으면 (다른 곳에서 프로젝트가 추가/삭제됨) 역색인을 다시 만든다.
+        """
+        if self._name_to_number is not None:
+            project_number = self._name_to_number.get(project_name)
+            if project_number is not None and self._read_project_name(project_number) == project_name:
+                return project_number
+
+        self._build_name_index()
+        return self._name_to_number.get(project_name)
+
+    def _read_project_name(self, project_number):
+        """프로젝트 번호 디렉토리의 설정 파일에서 PROJECT_NAME 읽기 (없으면 None)"""
+        config_file = os.path.join(self.personal_config_dir, project_number, "config.ini")
+        config = self._read_ini_cached(config_file)
+        return config.get('INFO', 'PROJECT_NAME', fallback=None)
+
+    def _build_name_index(self):
+        """모든 숫자 디렉토리를 한 번 스캔해 프로젝트 이름 -> 번호 역색인 생성"""
+        name_to_number = {}
         try:
-            # 모든 숫자 디렉토리 스캔
-            for entry in os.listdir(self.personal_config_dir):
-                if entry.isdigit() or (len(entry) == 4 and entry.isdigit()):
-                    project_dir = os.path.join(self.personal_config_dir, entry)
-                    if os.path.isdir(project_dir):
-                        config_file = os.path.join(project_dir, "config.ini")
-                        if os.path.exists(config_file):
-                            config = configparser.ConfigParser()
-                            config.read(config_file)
-                            if config.has_section('INFO') and config.has_option('INFO', 'PROJECT_NAME'):
-                                if config.get('INFO', 'PROJECT_NAME') == project_name:
-                                    return entry
+            with os.scandir(self.personal_config_dir) as entries:
+                for entry in entries:
+                    if entry.name.isdigit() and entry.is_dir():
+                        project_name = self._read_project_name(entry.name)
+                        if project_name is not None:
+                            # 같은 이름이 여러 개면 먼저 찾은 번호 사용 (기존 스캔과 동일)
+                            name_to_number.setdefault(project_name, entry.name)
         except Exception as e:
             display_message(f"프로젝트 번호 찾기 실패: {e}", "WARN")
-        return None
+        self._name_to_number = name_to_number
 
     def _try_auto_select_first_project(self):
         """첫 번째 등록된 프로젝트를 자동으로 선택"""
         try:
             # ProjectSelectionManager를 사용하여 등록된 프로젝트 목록 가져오기
+            # 첫 번째 프로젝트만 필요하므로 나머지 프로젝트 설정 파일은 읽지 않음
             project_selection_manager = ProjectSelectionManager(self)
-            registered_projects = project_selection_manager._get_registered_projects()
+            first_project = next(project_selection_manager._iter_registered_projects(), None)
 
-            if registered_projects:
+            if first_project is not None:
                 # 첫 번째 프로젝트 선택
-                first_project = registered_projects[0]
                 project_count, project_name, work_dir, tag, create_date = first_project
 
                 if project_name in self.project_configs:
@@ -1052,12 +1521,10 @@ class ProjectManager:
 
         _, base_config = self.project_configs[self.selected_project]
 
-        # 기본 설정 복사
+        # 기본 설정 복사 (섹션별 dict로 만들어 read_dict로 한 번에 적용)
         self.config = configparser.ConfigParser()
-        for section_name in base_config.sections():
-            self.config.add_section(section_name)
-            for key, value in base_config.items(section_name):
-                self.config.set(section_name, key, value)
+        self.config.read_dict({section_name: dict(base_config.items(section_name))
+                               for section_name in base_config.sections()})
 
         # 개인 설정으로 오버라이드 (숫자 기반 디렉토리 지원)
         # current_project_number가 있으면 사용, 없으면 프로젝트 이름으로 찾기
@@ -1072,13 +1539,13 @@ class ProjectManager:
 
         personal_project_config = os.path.join(self.project_personal_dir, "config.ini")
         if os.path.exists(personal_project_config):
-            personal_config = configparser.ConfigParser()
-            personal_config.read(personal_project_config)
+            personal_config = self._read_ini_cached(personal_project_config)
 
             # 섹션별 오버라이드 정책
             REPLACE_SECTIONS = ['SOURCES', 'EXCLUDES']  # 전체 교체할 섹션
             IGNORE_SECTIONS = ['PREFERENCE']  # TUI 전용 섹션, ProjectManager에서 무시
 
+            overrides = {}
             for section_name in personal_config.sections():
                 # PREFERENCE 섹션은 TUI 전용이므로 ProjectManager config에 로드하지 않음
                 if section_name in IGNORE_SECTIONS:
@@ -1087,19 +1554,19 @@ class ProjectManager:
 
                 # SOURCES, EXCLUDES는 전체 교체 (키 병합 방지)
                 if section_name in REPLACE_SECTIONS:
-                    # 기존 섹션 삭제 후 재생성
-                    if self.config.has_section(section_name):
-                        self.config.remove_section(section_name)
-                    self.config.add_section(section_name)
+                    # 기존 섹션 삭제 (아래 read_dict에서 개인 설정 값으로 재생성)
+                    self.config.remove_section(section_name)
                     display_message(f"개인 설정으로 [{section_name}] 섹션 전체 교체")
-                elif not self.config.has_section(section_name):
-                    self.config.add_section(section_name)
 
                 # 개인 설정 값 적용
-                for key, value in personal_config.items(section_name):
-                    self.config.set(section_name, key, value)
+                section_values = dict(personal_config.items(section_name))
+                overrides[section_name] = section_values
+                for key, value in section_values.items():
                     display_message(f"개인 설정 적용: [{section_name}] {key} = {value}")
 
+            # 키 병합은 read_dict로 한 번에 적용 (없는 섹션은 자동 생성)
+            self.config.read_dict(overrides)
+
         # 작업 디렉토리 설정 (~ 와 환경변수 확장 지원)
         self.production_dir = expand_path(self.config.get('CONFIG', 'PRODUCTION_DIR'))
         self.working_dir = expand_path(self.config.get('CONFIG', 'WORKING_BASE_DIR'))
@@ -1140,6 +1607,7 @@ class ProjectManager:
         os.makedirs(self.personal_config_dir, exist_ok=True)
         project_personal_dir = os.path.join(self.personal_config_dir, project_number)
         os.makedirs(project_personal_dir, exist_ok=True)
+        self._name_to_number = None  # 새 프로젝트 추가 - 이름 역색인 다시 생성
 
         # 마지막 프로젝트 저장 (숫자로 저장)
         personal_config = configparser.ConfigParser()
@@ -1149,8 +1617,7 @@ class ProjectManager:
             personal_config.add_section('CONFIG')
         personal_config.set('CONFIG', 'LAST_PROJECT', project_number)
 
-        with open(self.personal_config_file, 'w') as f:
-            personal_config.write(f)
+        _write_ini_atomic(self.personal_config_file, personal_config)
 
         # 프로젝트별 개인 설정 저장 (config.ini로 이름 변경)
         project_personal_config = os.path.join(project_personal_dir, "config.ini")
@@ -1200,52 +1667,38 @@ class ProjectManager:
         project_config.set('INFO', 'PROJECT_NAME', project_name)
         project_config.set('INFO', 'TAG', tag if tag else "")
 
-        from datetime import datetime
-        project_config.set('INFO', 'CREATE_DATE', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        project_config.set('INFO', 'CREATE_DATE', datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+
+        # config.ini 내용 구성 (SOURCES 템플릿 주석 포함) - 메모리에서 만든 뒤 한 번에 쓰기
+        _, base_config = self.project_configs[project_name]
+        buf = io.StringIO()
+
+        # 주석 헤더 작성
+        buf.write(_PERSONAL_CONFIG_HEADER)
+
+        # 템플릿의 SOURCES 섹션을 주석으로 추가
+        if base_config.has_section('SOURCES'):
+            buf.write("# 템플릿의 [SOURCES] 패턴 (참고용):\n")
+            buf.write("# [SOURCES]\n")
+            for key in sorted(base_config['SOURCES'].keys()):
+                value = base_config.get('SOURCES', key)
+                buf.write(f"# {key}={value}\n")
+            buf.write("#\n")
+
+        # 템플릿의 EXCLUDES 섹션도 주석으로 추가
+        if base_config.has_section('EXCLUDES'):
+            buf.write("# 템플릿의 [EXCLUDES] 패턴 (참고용):\n")
+            buf.write("# [EXCLUDES]\n")
+            for key in sorted(base_config['EXCLUDES'].keys()):
+                value = base_config.get('EXCLUDES', key)
+                buf.write(f"# {key}={value}\n")
+            buf.write("#\n\n")
+
+        # 실제 설정 작성
+        project_config.write(buf)
 
-        # config.ini 파일 작성 (SOURCES 템플릿 주석 포함)
         with open(project_personal_config, 'w') as f:
-            # 템플릿의 SOURCES 섹션을 주석으로 추가
-            _, base_config = self.project_configs[project_name]
-
-            # 주석 헤더 작성
-            f.write("# CCCopy 프로젝트 개인 설정 파일\n")
-            f.write("# 이 파일은 템플릿 설정을 오버라이드합니다.\n")
-            f.write("#\n")
-            f.write("# [SOURCES] 섹션 사용법:\n")
-            f.write("#   - 추적할 파일/디렉토리 패턴을 지정합니다\n")
-            f.write("#   - glob 패턴 사용 가능 (예: AAA/**, *.cpp, **/test/*.h)\n")
-            f.write("#   - 여러 패턴을 00, 01, 02... 형식으로 추가\n")
-            f.write("#   - 이 파일에 [SOURCES]를 추가하면 템플릿의 SOURCES를 완전히 대체합니다\n")
-            f.write("#\n")
-            f.write("# [EXCLUDES] 섹션 사용법:\n")
-            f.write("#   - 제외할 파일/디렉토리 패턴을 지정합니다\n")
-            f.write("#   - 예: **/.git/ (모든 .git 디렉토리)\n")
-            f.write("#   - 예: **/__pycache__/ (모든 Python 캐시)\n")
-            f.write("#   - 예: **/backup/ (모든 backup 디렉토리)\n")
-            f.write("#   - 예: **/*.log (모든 .log 파일)\n")
-            f.write("#\n")
-
-            # 템플릿의 SOURCES 섹션을 주석으로 추가
-            if base_config.has_section('SOURCES'):
-                f.write("# 템플릿의 [SOURCES] 패턴 (참고용):\n")
-                f.write("# [SOURCES]\n")
-                for key in sorted(base_config['SOURCES'].keys()):
-                    value = base_config.get('SOURCES', key)
-                    f.write(f"# {key}={value}\n")
-                f.write("#\n")
-
-            # 템플릿의 EXCLUDES 섹션도 주석으로 추가
-            if base_config.has_section('EXCLUDES'):
-                f.write("# 템플릿의 [EXCLUDES] 패턴 (참고용):\n")
-                f.write("# [EXCLUDES]\n")
-                for key in sorted(base_config['EXCLUDES'].keys()):
-                    value = base_config.get('EXCLUDES', key)
-                    f.write(f"# {key}={value}\n")
-                f.write("#\n\n")
-
-            # 실제 설정 작성
-            project_config.write(f)
+            f.write(buf.getvalue())
 
         # 최종 설정 적용
         self._apply_final_config()
@@ -1290,61 +1743,80 @@ class ProjectManager:
 
         migrated_count = 0
         migration_log = []
+        pending_deletions = []  # 이름을 바꿔 둔 기존 디렉토리 (백그라운드에서 삭제)
 
         try:
-            for item in os.listdir(self.personal_config_dir):
-                project_dir = os.path.join(self.personal_config_dir, item)
-                if os.path.isdir(project_dir) and not item.isdigit():  # 숫자가 아닌 기존 프로젝트
-                    old_config_file = os.path.join(project_dir, "project.ini")
-                    if os.path.exists(old_config_file):
-                        # 새 프로젝트 숫자 발급
-                        project_number = self._get_next_project_number()
-                        new_project_dir = os.path.join(self.personal_config_dir, project_number)
-
-                        try:
-                            # 기존 설정 읽기
-                            old_config = configparser.ConfigParser()
-                            old_config.read(old_config_file)
-
-                            # 새 디렉토리 생성
-                            os.makedirs(new_project_dir, exist_ok=True)
-                            new_config_file = os.path.join(new_project_dir, "config.ini")
-
-                            # 새 설정 파일 생성
-                            new_config = configparser.ConfigParser()
-
-                            # CONFIG 섹션 복사
-                            if old_config.has_section('CONFIG'):
-                                new_config.add_section('CONFIG')
-                                for key, value in old_config.items('CONFIG'):
-                                    new_config.set('CONFIG', key, value)
-
-                            # INFO 섹션 추가
-                            if not new_config.has_section('INFO'):
-                                new_config.add_section('INFO')
-                            new_config.set('INFO', 'PROJECT_NAME', item)  # 기존 디렉토리명을 프로젝트명으로 사용
-                            new_config.set('INFO', 'TAG', '')  # TAG는 빈 값으로 설정
-
-                            from datetime import datetime
-                            new_config.set('INFO', 'CREATE_DATE', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            # 마이그레이션 중 디렉토리를 만들고 지우므로 목록을 먼저 확정한 뒤 처리
+            # (항목 이름 목록은 새 프로젝트 숫자 발급에도 재사용 - 디렉토리를 다시 읽지 않음)
+            with os.scandir(self.personal_config_dir) as entries:
+                dir_entries = list(entries)
+            entry_names = [entry.name for entry in dir_entries]
+            # 이전 실행에서 삭제가 끝나지 않은 디렉토리는 다시 삭제 대상으로 등록
+            pending_deletions.extend(entry.path for entry in dir_entries
+                                     if entry.name.endswith(_MIGRATED_SUFFIX))
+            # 숫자가 아닌 기존 프로젝트 (심볼릭 링크는 rmtree로 지울 수 없으므로 제외 - lstat 결과만 사용)
+            old_project_dirs = [(entry.name, entry.path) for entry in dir_entries
+                                if not entry.name.isdigit() and not entry.name.endswith(_MIGRATED_SUFFIX)
+                                and entry.is_dir(follow_symlinks=False)]
+            # 한 번의 마이그레이션에서 생성되는 프로젝트는 같은 생성 일시 사용
+            create_date = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            for item, project_dir in old_project_dirs:
+                old_config_file = os.path.join(project_dir, "project.ini")
+                if os.path.exists(old_config_file):
+                    # 새 프로젝트 숫자 발급
+                    project_number = self._get_next_project_number(entry_names)
+                    new_project_dir = os.path.join(self.personal_config_dir, project_number)
 
-                            # 새 파일에 저장
-                            with open(new_config_file, 'w') as f:
-                                new_config.write(f)
-
-                            # 기존 디렉토리 삭제
-                            import shutil
-                            shutil.rmtree(project_dir)
-
-                            migrated_count += 1
-                            migration_log.append(f"프로젝트 '{item}' -> '{project_number}' 마이그레이션 완료")
+                    try:
+                        # 기존 설정 읽기
+                        old_config = configparser.ConfigParser()
+                        old_config.read(old_config_file)
+
+                        # 새 디렉토리 생성
+                        os.makedirs(new_project_dir, exist_ok=True)
+                        entry_names.append(project_number)
+                        new_config_file = os.path.join(new_project_dir, "config.ini")
+
+                        # 새 설정 파일 생성
+                        new_config = configparser.ConfigParser()
+
+                        # CONFIG 섹션 복사
+                        if old_config.has_section('CONFIG'):
+                            new_config.add_section('CONFIG')
+                            for key, value in old_config.items('CONFIG'):
+                                new_config.set('CONFIG', key, value)
+
+                        # INFO 섹션 추가
+                        if not new_config.has_section('INFO'):
+                            new_config.add_section('INFO')
+                        new_config.set('INFO', 'PROJECT_NAME', item)  # 기존 디렉토리명을 프로젝트명으로 사용
+                        new_config.set('INFO', 'TAG', '')  # TAG는 빈 값으로 설정
+                        new_config.set('INFO', 'CREATE_DATE', create_date)
+
+                        # 새 파일에 저장
+                        with open(new_config_file, 'w') as f:
+                            new_config.write(f)
+
+                        # 기존 디렉토리는 이름만 바꿔 두고 삭제는 백그라운드에서 처리
+                        migrated_dir = project_dir + _MIGRATED_SUFFIX
+                        os.rename(project_dir, migrated_dir)
+                        pending_deletions.append(migrated_dir)
+
+                        migrated_count += 1
+                        migration_log.append(f"프로젝트 '{item}' -> '{project_number}' 마이그레이션 완료")
 
-                        except Exception as e:
-                            migration_log.append(f"프로젝트 '{item}' 마이그레이션 실패: {e}")
+                    except Exception as e:
+                        migration_log.append(f"프로젝트 '{item}' 마이그레이션 실패: {e}")
 
         except Exception as e:
             migration_log.append(f"마이그레이션 오류: {e}")
 
+        if pending_deletions:
+            # 종료 시 삭제가 끝나도록 daemon이 아닌 스레드 사용 (중단되면 다음 실행에서 다시 삭제)
+            import threading
+            threading.Thread(target=self._remove_migrated_dirs, args=(pending_deletions,),
+                             name='cccopy-migration-cleanup').start()
+
         # 마이그레이션 결과 출력
         if migrated_count > 0:
             display_message(f"프로젝트 마이그레이션 완료: {migrated_count}개 프로젝트")
@@ -1374,16 +1846,26 @@ class ProjectManager:
             except Exception as e:
                 display_message(f"LAST_PROJECT 업데이트 오류: {e}", "WARN")
 
-    def _get_next_project_number(self):
-        """다음 프로젝트 숫자 반환 (4자리 이상)"""
-        if not os.path.exists(self.personal_config_dir):
-            return "0001"
+    def _remove_migrated_dirs(self, paths):
+        """마이그레이션이 끝난 기존 프로젝트 디렉토리 삭제 (백그라운드 스레드에서 실행)"""
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _get_next_project_number(self, entry_names=None):
+        """다음 프로젝트 숫자 반환 (4자리 이상)
 
+        Args:
+            entry_names: 이미 읽어 둔 개인 설정 디렉토리 항목 이름 목록 (None이면 디렉토리를 직접 읽음)
+        """
         max_num = 0
         try:
-            for item in os.listdir(self.personal_config_dir):
-                if item.isdigit():
-                    max_num = max(max_num, int(item))
+            if entry_names is None:
+                # 디렉토리가 없으면 예외 처리로 "0001" 반환 (존재 확인을 따로 하지 않음)
+                with os.scandir(self.personal_config_dir) as entries:
+                    entry_names = [entry.name for entry in entries]
+            for name in entry_names:
+                if name.isdigit():
+                    max_num = max(max_num, int(name))
         except Exception:
             pass
 
@@ -1403,21 +1885,21 @@ class ProjectManager:
             return projects
 
         try:
-            for item in os.listdir(self.personal_config_dir):
-                project_dir = os.path.join(self.personal_config_dir, item)
-                if os.path.isdir(project_dir) and item.isdigit():
-                    project_config_file = os.path.join(project_dir, "config.ini")
-                    if os.path.exists(project_config_file):
-                        config = configparser.ConfigParser()
-                        config.read(project_config_file)
-
-                        if (config.has_section('CONFIG') and config.has_option('CONFIG', 'WORKING_BASE_DIR') and
-                            config.has_section('INFO') and config.has_option('INFO', 'PROJECT_NAME')):
-                            work_dir = config.get('CONFIG', 'WORKING_BASE_DIR')
-                            project_name = config.get('INFO', 'PROJECT_NAME')
-                            tag = config.get('INFO', 'TAG', fallback='')
-                            create_date = config.get('INFO', 'CREATE_DATE', fallback='')
-                            projects.append((int(item), project_name, work_dir, tag, create_date))
+            with os.scandir(self.personal_config_dir) as entries:
+                project_dirs = [(entry.name, entry.path) for entry in entries
+                                if entry.name.isdigit() and entry.is_dir()]
+            for item, project_dir in project_dirs:
+                project_config_file = os.path.join(project_dir, "config.ini")
+                if os.path.exists(project_config_file):
+                    config = self._read_ini_cached(project_config_file)
+
+                    if (config.has_section('CONFIG') and config.has_option('CONFIG', 'WORKING_BASE_DIR') and
+                        config.has_section('INFO') and config.has_option('INFO', 'PROJECT_NAME')):
+                        work_dir = config.get('CONFIG', 'WORKING_BASE_DIR')
+                        project_name = config.get('INFO', 'PROJECT_NAME')
+                        tag = config.get('INFO', 'TAG', fallback='')
+                        create_date = config.get('INFO', 'CREATE_DATE', fallback='')
+                        projects.append((int(item), project_name, work_dir, tag, create_date))
 
             # 숫자 순서로 정렬
             projects.sort(key=lambda x: x[0])
@@ -1430,15 +1912,12 @@ class ProjectManager:
     def get_file_state(self, production_file, work_file, rel_path):
         """3-way 비교를 통한 파일 상태 판단"""
 
-        if not self.tag_manager.has_production_tag():
-            return FileState.UPDATED  # 첫 다운로드
+        # Enhanced Tag에서 commit hash만 추출 (Tag 존재 확인과 조회를 한 번에 처리)
+        production_commit, _ = self.tag_manager.get_production_tag_parts()
+        if not production_commit:
+            return FileState.UPDATED  # 첫 다운로드 또는 Tag가 없으면 업데이트로 간주
 
         try:
-            # Enhanced Tag에서 commit hash만 추출
-            production_commit, _ = self.tag_manager.get_production_tag_parts()
-            if not production_commit:
-                return FileState.UPDATED  # Tag가 없으면 업데이트로 간주
-
             # Git hash 기반 빠른 비교
             work_hash = GitHelper.get_current_file_hash(self.working_dir, rel_path)
             production_head_hash = GitHelper.get_current_file_hash(self.production_dir, rel_path)
@@ -2212,8 +2691,17 @@ class ProjectManager:
             return False
 
     def download(self):
-        """다운로드 (production -> work)"""
+        """다운로드 (production -> work)
+
+        Returns:
+            Work에 복사(업데이트/충돌 해결)된 파일의 상대 경로 리스트.
+            Production tag의 commit이 바뀌었거나 .gitignore를 동기화한 경우 None
+            (복사하지 않은 파일의 상태도 바뀌었을 수 있으므로 호출자는 전체 새로고침 필요)
+        """
         display_message("=== DOWNLOAD (production -> work) ===", "INFO")
+        changed_paths = []
+        tag_changed = False
+        gitignore_changed = False
 
         # Git 버전 정보 출력
         try:
@@ -2225,7 +2713,7 @@ class ProjectManager:
         display_message("Production 디렉토리 확인 중...", "INFO")
         if not os.path.exists(self.production_dir):
             display_message(f"오류: Production 디렉토리가 존재하지 않습니다: {self.production_dir}", "ERROR")
-            return
+            return []
 
         display_message(f"연결 완료: {self.production_dir}", "INFO")
 
@@ -2428,7 +2916,7 @@ class ProjectManager:
                 if not files:
                     display_message("수집된 파일이 없습니다.", "WARNING")
                     display_message("설정 파일의 SOURCES 패턴을 확인하세요.", "INFO")
-                    return
+                    return None if gitignore_changed else []
 
                 # 파일별 상태 확인 및 처리
                 modified_count = 0
@@ -2451,6 +2939,7 @@ class ProjectManager:
                         shutil.copy2(production_file, work_file)
                         display_message(f"업데이트: {rel_path}", "INFO")
                         updated_count += 1
+                        changed_paths.append(rel_path)
 
                         # 새로 추가된 파일이면 목록에 추가
                         if was_new_file:
@@ -2467,6 +2956,7 @@ class ProjectManager:
                             # 해결되면 Git에 변경사항 반영
                             update_work_git_after_merge(work_file, rel_path)
                             updated_count += 1
+                            changed_paths.append(rel_path)
                         else:
                             # 건너뛰기한 경우 충돌 상태 유지
                             unresolved_conflicts = True
@@ -2474,7 +2964,12 @@ class ProjectManager:
 
                 # Production tag 저장 (미해결 충돌이 없는 경우에만)
                 if not unresolved_conflicts:
+                    previous_commit, _ = self.tag_manager.get_production_tag_parts()
                     self.tag_manager.save_production_tag(self.production_dir, include_sources_hash=True)
+                    current_commit, _ = self.tag_manager.get_production_tag_parts()
+                    if current_commit != previous_commit:
+                        # 캐시된 파일 상태는 모두 이전 tag 기준이므로 복사한 파일만 무효화할 수 없음
+                        tag_changed = True
                 else:
                     display_message("[INFO] 미해결 충돌로 인해 Production tag 업데이트하지 않음", "INFO")
 
@@ -2524,6 +3019,10 @@ class ProjectManager:
         except CCCopyError as e:
             display_message(f"오류: {e}", "ERROR")
 
+        if tag_changed or gitignore_changed:
+            return None
+        return changed_paths
+
     def upload(self):
         """업로드 (work -> production)"""
         display_message("=== UPLOAD (work -> production) ===", "INFO")
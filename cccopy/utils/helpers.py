@@ -538,12 +538,35 @@ def launch_terminal(directory):
         return False
 
 
-def launch_text_editor(file_path):
+def _wait_process(proc, poll_callback=None, interval=0.1):
+    """프로세스 종료 대기 (대기 중 poll_callback을 주기적으로 호출)
+
+    Args:
+        proc: subprocess.Popen 객체
+        poll_callback: 대기 중 interval초마다 호출할 함수 (None이면 단순 대기)
+        interval: poll_callback 호출 간격 (초)
+
+    Returns:
+        int: 프로세스 종료 코드
+    """
+    if poll_callback is None:
+        return proc.wait()
+
+    while True:
+        try:
+            return proc.wait(timeout=interval)
+        except subprocess.TimeoutExpired:
+            poll_callback()
+
+
+def launch_text_editor(file_path, poll_callback=None):
     """텍스트 에디터를 실행하여 파일 편집 (동기 실행)
     우선순위: gedit -> gnome-text-editor
 
     Args:
         file_path: 편집할 파일 경로
+        poll_callback: 에디터 종료 대기 중 주기적으로 호출할 함수
+                       (TUI에서 대기 중에도 로그/상태 갱신을 화면에 반영할 때 사용)
 
     Returns:
         bool: 성공 여부
@@ -609,28 +632,27 @@ def launch_text_editor(file_path):
         # 에디터 실행
         if has_standalone:
             # --standalone: 독립 프로세스로 실행하여 종료까지 대기
-            result = subprocess.run(
-                [editor, '--standalone', '--new-window', file_path],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+            editor_cmd = [editor, '--standalone', '--new-window', file_path]
         else:
             # --standalone 미지원: --new-window만 사용 (대기 안 될 수 있음)
             display_message(f"[WARNING] {editor_name}이 --standalone을 지원하지 않습니다.", "WARN")
             display_message("편집 완료 후 수동으로 설정을 다시 로드하세요.", "WARN")
-            result = subprocess.run(
-                [editor, '--new-window', file_path],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+            editor_cmd = [editor, '--new-window', file_path]
+
+        proc = subprocess.Popen(
+            editor_cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        returncode = _wait_process(proc, poll_callback)
 
         # 파일 시스템 동기화를 위한 짧은 대기
         time.sleep(0.5)
 
-        if result.returncode == 0:
+        if returncode == 0:
             return True
         else:
-            display_message(f"{editor_name} 실행 중 오류 발생 (코드: {result.returncode})", "ERROR")
+            display_message(f"{editor_name} 실행 중 오류 발생 (코드: {returncode})", "ERROR")
             return False
 
     except FileNotFoundError as e:
@@ -11,6 +11,7 @@ import configparser
 import getpass
 import grp
 import pwd
+import heapq
 
 # cccopy 모듈에서 필요한 것들 import
 from cccopy import (
@@ -100,20 +101,16 @@ def cleanup_old_log_files():
         # 로그 디렉토리가 없으면 생성
         os.makedirs(LOG_DIR, exist_ok=True)
 
-        # 로그 파일 목록 가져오기 (*.log)
-        log_files = []
-        for filename in os.listdir(LOG_DIR):
-            if filename.endswith('.log'):
-                filepath = os.path.join(LOG_DIR, filename)
-                # 파일 수정 시간 기준으로 정렬하기 위해 (mtime, filepath) 튜플 저장
-                log_files.append((os.path.getmtime(filepath), filepath))
-
-        # 수정 시간 기준 오름차순 정렬 (오래된 것이 앞에)
-        log_files.sort()
+        # 로그 파일 목록 가져오기 (*.log) - (mtime, filepath) 튜플
+        with os.scandir(LOG_DIR) as entries:
+            log_files = [(entry.stat().st_mtime, entry.path)
+                         for entry in entries if entry.name.endswith('.log')]
 
         # MAX_LOG_FILES 초과시 오래된 파일부터 삭제
-        if len(log_files) > MAX_LOG_FILES:
-            files_to_delete = log_files[:len(log_files) - MAX_LOG_FILES]
+        # (전체 정렬 없이 삭제 대상인 가장 오래된 파일들만 선택)
+        delete_count = len(log_files) - MAX_LOG_FILES
+        if delete_count > 0:
+            files_to_delete = heapq.nsmallest(delete_count, log_files)
             for mtime, filepath in files_to_delete:
                 try:
                     os.remove(filepath)
@@ -309,6 +306,8 @@ def run_tui_mode(workspace, preference=None):
         # Curses 실행 시도
         try:
             import curses
+            # ESC 단독 입력 판단 대기 시간 단축 (initscr 전에 설정해야 적용됨)
+            os.environ.setdefault('ESCDELAY', '25')
             curses.wrapper(tui.main_loop)
         except Exception as e:
             display_message(f"Curses 실행 실패: {e}", "ERROR")